@@ -0,0 +1,178 @@
+"""
+Aggregate-backed analyzer base for the Business Analysis Engine.
+AggregateRentalAnalyzer produces every section of RentalPropertyAnalyzer
+from aggregate state (StatementAggregates, per-date totals, the latest
+statement and the low-rent count) instead of statement rows. Subclasses
+fill that state from wherever the statements live: ChunkedRentalAnalyzer
+streams a file, SQLRentalAnalyzer runs GROUP BY queries in the database and
+IncrementalRentalAnalyzer folds appended rows into persisted aggregates.
+"""
+
+import os
+import sys
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Ensure local imports work regardless of CWD
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.insert(0, CURRENT_DIR)
+
+from aggregates import StatementAggregates
+from business_analyzer import ANALYSIS_VERSION, SECTION_METHODS, RentalPropertyAnalyzer
+
+
+# Rent quantile used for low_rent_statements (as compute_risk_metrics)
+LOW_RENT_QUANTILE = 0.25
+
+# Per-statement series the trend section fits
+TREND_COLUMNS = ['rent', 'total_costs', 'cash_flow']
+
+# Sort key of NaT statement dates: after every real date, as sort_values places them
+NAT_KEY = np.iinfo(np.int64).max
+
+
+def quantile_ranks(n: int, q: float) -> Tuple[int, int, float]:
+    """Ranks of the two order statistics a linear quantile of n values interpolates, and the weight."""
+    # numpy's 'linear' method: virtual index (n - 1) * q, computed the way numpy does
+    virtual = n * q + (1 - q) - 1
+    lower = int(np.floor(virtual))
+    return lower, min(lower + 1, n - 1), virtual - lower
+
+
+def interpolate(a: float, b: float, t: float) -> float:
+    """numpy's linear interpolation, so quantiles match Series.quantile bit for bit."""
+    diff = b - a
+    return b - diff * (1 - t) if t >= 0.5 else a + diff * t
+
+
+def date_keys(dates: pd.Series) -> np.ndarray:
+    """int64 sort keys of statement dates, NaT last."""
+    keys = dates.astype('datetime64[ns]').to_numpy().view(np.int64)
+    return np.where(keys == np.iinfo(np.int64).min, NAT_KEY, keys)
+
+
+class AggregateRentalAnalyzer(RentalPropertyAnalyzer):
+    """
+    Rental property analyzer computing every section from aggregate state.
+
+    aggregate() fills:
+    aggregates: StatementAggregates of all statements.
+    date_blocks: statement count and rent/total_costs/cash_flow sums per
+    statement date, indexed by date_keys and sorted.
+    last_statement: (date key, rent, total costs) of the latest-dated
+    statement, ties going to the last in source order.
+    low_rent_statements: statements with rent below the rent lower quartile.
+
+    Results match RentalPropertyAnalyzer to floating-point rounding, except
+    where the full analyzer depends on the order of rows with equal statement
+    dates, which its unstable date sort leaves unspecified: trends place those
+    rows at their mean position (the average slope over their orderings), and
+    forecasts start from the last of the latest-dated rows in source order.
+    """
+
+    # analysis_metadata['mode'] of the results
+    mode = 'aggregate'
+    # Result sections run_complete_analysis produces (SECTION_METHODS keys)
+    sections = tuple(SECTION_METHODS)
+
+    def __init__(self, data_path: str = "code/sample-data/rental-statements/labels.csv"):
+        """Initialize analyzer with data path and empty aggregate state."""
+        super().__init__(data_path)
+        self.aggregates = StatementAggregates.empty()
+        self.date_blocks = pd.DataFrame(columns=['statement_count'] + TREND_COLUMNS, dtype=float)
+        self.last_statement = None
+        self.low_rent_statements = 0
+
+    def aggregate(self, **options) -> int:
+        """Fill the aggregate state; returns the statement count."""
+        raise NotImplementedError
+
+    def compute_property_kpis(self) -> Dict[str, Any]:
+        """Compute property-level KPIs from the aggregates."""
+        return self.property_kpis_from_aggregates(self.aggregates.property_aggregates())
+
+    def compute_portfolio_metrics(self) -> Dict[str, Any]:
+        """Compute portfolio-level metrics from the aggregates."""
+        if not self.aggregates.portfolio['statement_count']:
+            return {}
+        return self.portfolio_from_totals(self.aggregates.portfolio_totals())
+
+    def compute_seasonal_analysis(self) -> Dict[str, Any]:
+        """Analyze seasonal patterns from the per-month aggregates."""
+        if not self.aggregates.portfolio['statement_count']:
+            return {}
+        return self.seasonal_from_monthly_stats(self.aggregates.monthly_stats())
+
+    def compute_cost_optimization_opportunities(self) -> Dict[str, Any]:
+        """Identify cost optimization opportunities from the aggregates."""
+        if not self.aggregates.portfolio['statement_count']:
+            return {}
+        return self.cost_optimization_from_aggregates(self.aggregates.property_aggregates(),
+                                                      self.aggregates.portfolio['rent_sum'])
+
+    def compute_risk_metrics(self) -> Dict[str, Any]:
+        """Compute risk assessment metrics from the portfolio aggregates."""
+        portfolio = self.aggregates.portfolio
+        if not portfolio['statement_count']:
+            return {}
+        return self.risk_from_stats({
+            'total_statements': portfolio['statement_count'],
+            'zero_rent_statements': portfolio['zero_rent_count'],
+            'low_rent_statements': self.low_rent_statements,
+            'management_fee_std': self.aggregates.portfolio_std('management_fee'),
+            'repair_std': self.aggregates.portfolio_std('repair'),
+            'total_costs_std': self.aggregates.portfolio_std('total_costs'),
+            'cash_flow_std': self.aggregates.portfolio_std('cash_flow'),
+            'property_shares': self.aggregates.property_shares(),
+        })
+
+    def compute_predictive_metrics(self) -> Dict[str, Any]:
+        """Compute predictive analytics metrics from the per-date totals."""
+        if self.last_statement is None:
+            return {}
+        portfolio = self.aggregates.portfolio
+        counts = self.date_blocks['statement_count'].to_numpy()
+        n = counts.sum()
+        trends = {}
+        if n > 1:
+            # Closed-form least-squares slope against the row's position in date order:
+            # sum((x - mean_x) * y) / sum((x - mean_x) ** 2), x = 0..n-1, one term per date
+            mean_positions = np.cumsum(counts) - (counts + 1) / 2
+            centered = mean_positions - (n - 1) / 2
+            sxx = n * (n * n - 1) / 12
+            for col in TREND_COLUMNS:
+                # Any missing value makes the fit undefined, as np.polyfit returns NaN
+                has_nan = portfolio[f'{col}_count'] < portfolio['statement_count']
+                trends[col] = np.nan if has_nan else float((centered * self.date_blocks[col].to_numpy()).sum() / sxx)
+        _, last_rent, last_costs = self.last_statement
+        predictive = self.predictive_from_trends(trends, last_rent, last_costs)
+        predictive['property_trends'] = self.property_trends_from_sums(self.aggregates.properties.sort_index())
+        return predictive
+
+    def run_complete_analysis(self, **aggregate_options) -> Dict[str, Any]:
+        """Fill the aggregate state (passing aggregate_options to aggregate) and return the metrics."""
+        print(f"Starting {self.mode} business analysis...")
+
+        try:
+            self.aggregate(**aggregate_options)
+        except Exception as e:
+            print(f"Error loading data: {e}")
+            return {}
+
+        self.results = {
+            'analysis_metadata': {
+                'generated_at': datetime.now().isoformat(),
+                'data_source': self.data_path,
+                'total_records': self.aggregates.portfolio['statement_count'],
+                'analysis_version': ANALYSIS_VERSION,
+                'mode': self.mode
+            },
+            **{section: getattr(self, SECTION_METHODS[section])() for section in self.sections}
+        }
+
+        print("Analysis complete!")
+        return self.results
@@ -0,0 +1,250 @@
+"""
+Mergeable aggregates of rental statements for the Business Analysis Engine.
+StatementAggregates holds per-property, per-month and portfolio counts, sums,
+sums of squares and first/last statement dates. Aggregates of disjoint sets
+of statements merge exactly (up to floating-point summation order), so they
+can be built incrementally, chunk by chunk or in parallel, and turned into
+the analyzer's section inputs without the statement rows.
+"""
+
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+
+# Amount columns tracked per property / per month
+AMOUNT_COLUMNS = ['rent', 'management_fee', 'repair', 'misc', 'deposit']
+MONTH_COLUMNS = ['rent', 'management_fee', 'repair', 'misc']
+DATE_COLUMNS = ['first_statement', 'last_statement']
+# Portfolio-wide columns with count/sum/sum of squares (the risk section needs their std)
+PORTFOLIO_COLUMNS = AMOUNT_COLUMNS + ['total_costs', 'cash_flow']
+
+# Per-property trend fits: x is months since TREND_ORIGIN, y each TREND_AMOUNTS column
+TREND_ORIGIN = pd.Timestamp('2000-01-01')
+AVERAGE_MONTH_DAYS = 30.44
+TREND_AMOUNTS = ['rent', 'total_costs']
+# Moment sums of the fit (cash flow follows by linearity); rows missing x or any y are left out
+TREND_COLUMNS = (['trend_count', 'trend_x_sum', 'trend_x_sumsq']
+                 + [f'trend_{col}_{stat}' for col in TREND_AMOUNTS for stat in ('sum', 'xy_sum')])
+
+
+def trend_months(dates: pd.Series) -> pd.Series:
+    """Statement dates as months since TREND_ORIGIN, the x of the per-property trend fits."""
+    return (dates - TREND_ORIGIN) / pd.Timedelta(days=1) / AVERAGE_MONTH_DAYS
+
+
+def trend_sums(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-property moment sums (TREND_COLUMNS) of a typed statement frame for
+    the least-squares trend fits, over rows with a date, rent and total costs.
+    """
+    x = trend_months(df['statement_date'])
+    total_costs = df['management_fee'] + df['repair'] + df['misc']
+    valid = x.notna() & df['rent'].notna() & total_costs.notna()
+    x, rent, total_costs = x[valid], df['rent'][valid], total_costs[valid]
+    data = pd.DataFrame({
+        'property_alias': df['property_alias'][valid],
+        'trend_x_sum': x,
+        'trend_x_sumsq': x * x,
+        'trend_rent_sum': rent,
+        'trend_rent_xy_sum': x * rent,
+        'trend_total_costs_sum': total_costs,
+        'trend_total_costs_xy_sum': x * total_costs,
+    })
+    groups = data.groupby('property_alias')
+    return groups.sum().assign(trend_count=groups.size())[TREND_COLUMNS]
+
+
+def _mean(sums: pd.Series, counts: pd.Series) -> pd.Series:
+    return sums / counts
+
+
+def _std(sums: pd.Series, sumsqs: pd.Series, counts: pd.Series) -> pd.Series:
+    # Sample std (ddof=1) from count, sum and sum of squares; NaN below 2 values
+    var = (sumsqs - sums * sums / counts) / (counts - 1)
+    return np.sqrt(var.clip(lower=0).where(counts > 1))
+
+
+def _earliest(a, b):
+    dates = [d for d in (a, b) if not pd.isna(d)]
+    return min(dates) if dates else pd.NaT
+
+
+def _latest(a, b):
+    dates = [d for d in (a, b) if not pd.isna(d)]
+    return max(dates) if dates else pd.NaT
+
+
+class StatementAggregates:
+    """
+    Mergeable aggregate state for a set of statements.
+    properties: one row per property_alias with statement/zero-rent counts,
+    first/last statement dates, <col>_count/_sum/_sumsq per amount column and
+    the trend fit sums (TREND_COLUMNS).
+    months: one row per calendar month with <col>_count/_sum.
+    portfolio: statement and zero-rent counts, first/last dates and
+    <col>_count/_sum/_sumsq per PORTFOLIO_COLUMNS column over all rows.
+    """
+
+    def __init__(self, properties: pd.DataFrame, months: pd.DataFrame, portfolio: Dict[str, Any]):
+        self.properties = properties
+        self.months = months
+        self.portfolio = portfolio
+
+    @classmethod
+    def empty(cls) -> 'StatementAggregates':
+        """Aggregates of no statements."""
+        return cls.from_statements(pd.DataFrame({
+            'property_alias': pd.Series(dtype=object),
+            'statement_date': pd.Series(dtype='datetime64[ns]'),
+            **{col: pd.Series(dtype=float) for col in AMOUNT_COLUMNS},
+        }))
+
+    @classmethod
+    def from_statements(cls, df: pd.DataFrame) -> 'StatementAggregates':
+        """Aggregate a typed statement frame (as load_data returns) in one pass per level."""
+        data = df[['property_alias', 'statement_date'] + AMOUNT_COLUMNS].assign(
+            zero_rent=df['rent'] == 0,
+            **{f'{col}_sq': df[col] ** 2 for col in AMOUNT_COLUMNS},
+        )
+
+        spec = {
+            'statement_count': ('rent', 'size'),
+            'zero_rent_count': ('zero_rent', 'sum'),
+            'first_statement': ('statement_date', 'min'),
+            'last_statement': ('statement_date', 'max'),
+        }
+        for col in AMOUNT_COLUMNS:
+            spec[f'{col}_count'] = (col, 'count')
+            spec[f'{col}_sum'] = (col, 'sum')
+            spec[f'{col}_sumsq'] = (f'{col}_sq', 'sum')
+        properties = data.groupby('property_alias').agg(**spec)
+        trends = trend_sums(df).reindex(properties.index, fill_value=0)
+        properties = properties.join(trends.astype({'trend_count': 'int64'}))
+
+        month_spec = {}
+        for col in MONTH_COLUMNS:
+            month_spec[f'{col}_count'] = (col, 'count')
+            month_spec[f'{col}_sum'] = (col, 'sum')
+        months = data.groupby(df['statement_date'].dt.month.rename('month')).agg(**month_spec)
+        months.index = months.index.astype(int)
+
+        total_costs = df['management_fee'] + df['repair'] + df['misc']
+        portfolio_columns = {col: df[col] for col in AMOUNT_COLUMNS}
+        portfolio_columns.update(total_costs=total_costs, cash_flow=df['rent'] - total_costs)
+        portfolio = {
+            'statement_count': len(df),
+            'zero_rent_count': int(data['zero_rent'].sum()),
+            'first_statement': df['statement_date'].min(),
+            'last_statement': df['statement_date'].max(),
+        }
+        for col, values in portfolio_columns.items():
+            portfolio[f'{col}_count'] = int(values.count())
+            portfolio[f'{col}_sum'] = float(values.sum())
+            portfolio[f'{col}_sumsq'] = float((values ** 2).sum())
+        return cls(properties, months, portfolio)
+
+    def merge(self, other: 'StatementAggregates') -> 'StatementAggregates':
+        """Combine with the aggregates of another, disjoint set of statements."""
+        count_columns = [col for col in self.properties.columns if col not in DATE_COLUMNS]
+        properties = self.properties[count_columns].add(other.properties[count_columns], fill_value=0)
+        for col, combine in (('first_statement', 'min'), ('last_statement', 'max')):
+            both = pd.concat([self.properties[col], other.properties[col]], axis=1)
+            properties[col] = getattr(both, combine)(axis=1)
+        int_columns = [col for col in count_columns if not col.endswith(('_sum', '_sumsq'))]
+        properties[int_columns] = properties[int_columns].astype('int64')
+
+        months = self.months.add(other.months, fill_value=0)
+        months[[c for c in months.columns if c.endswith('_count')]] = (
+            months[[c for c in months.columns if c.endswith('_count')]].astype('int64'))
+
+        portfolio = {
+            key: value + other.portfolio[key]
+            for key, value in self.portfolio.items() if key not in DATE_COLUMNS
+        }
+        portfolio['first_statement'] = _earliest(self.portfolio['first_statement'], other.portfolio['first_statement'])
+        portfolio['last_statement'] = _latest(self.portfolio['last_statement'], other.portfolio['last_statement'])
+        return StatementAggregates(properties, months, portfolio)
+
+    def property_aggregates(self) -> pd.DataFrame:
+        """Per-property statistics in the layout RentalPropertyAnalyzer._build_property_aggregates returns."""
+        p = self.properties.sort_index()
+        return pd.DataFrame({
+            'total_rent': p['rent_sum'],
+            'average_monthly_rent': _mean(p['rent_sum'], p['rent_count']),
+            'rent_std': _std(p['rent_sum'], p['rent_sumsq'], p['rent_count']),
+            'total_mgmt_fee': p['management_fee_sum'],
+            'total_repair': p['repair_sum'],
+            'total_misc': p['misc_sum'],
+            'total_deposit': p['deposit_sum'],
+            'average_rent': _mean(p['rent_sum'], p['rent_count']),
+            'average_mgmt_fee': _mean(p['management_fee_sum'], p['management_fee_count']),
+            'average_repair': _mean(p['repair_sum'], p['repair_count']),
+            'repair_std': _std(p['repair_sum'], p['repair_sumsq'], p['repair_count']),
+            'statement_count': p['statement_count'],
+            'zero_rent_count': p['zero_rent_count'],
+            'first_statement': p['first_statement'],
+            'last_statement': p['last_statement'],
+        })
+
+    def monthly_stats(self) -> pd.DataFrame:
+        """Per-month statistics in the layout compute_seasonal_analysis builds."""
+        m = self.months.sort_index()
+        stats = {('rent', 'mean'): _mean(m['rent_sum'], m['rent_count']),
+                 ('rent', 'sum'): m['rent_sum'],
+                 ('rent', 'count'): m['rent_count']}
+        for col in MONTH_COLUMNS[1:]:
+            stats[(col, 'mean')] = _mean(m[f'{col}_sum'], m[f'{col}_count'])
+            stats[(col, 'sum')] = m[f'{col}_sum']
+        return pd.DataFrame(stats).round(2)
+
+    def portfolio_totals(self) -> Dict[str, Any]:
+        """Portfolio totals in the form RentalPropertyAnalyzer.portfolio_from_totals expects."""
+        totals = {
+            'total_properties': len(self.properties),
+            'total_statements': self.portfolio['statement_count'],
+            'first_statement': self.portfolio['first_statement'],
+            'last_statement': self.portfolio['last_statement'],
+        }
+        totals.update({col: self.portfolio[f'{col}_sum'] for col in AMOUNT_COLUMNS})
+        return totals
+
+    def portfolio_std(self, col: str) -> float:
+        """Sample std of a PORTFOLIO_COLUMNS column over all statements."""
+        p = self.portfolio
+        std = _std(pd.Series([p[f'{col}_sum']]), pd.Series([p[f'{col}_sumsq']]), pd.Series([p[f'{col}_count']]))
+        return float(std.iloc[0])
+
+    def property_shares(self) -> pd.Series:
+        """Each property's share of the statements, largest first (value_counts(normalize=True))."""
+        counts = self.properties['statement_count']
+        return (counts / counts.sum()).sort_values(ascending=False, kind='stable')
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form of the aggregates."""
+        properties = self.properties.copy()
+        for col in DATE_COLUMNS:
+            properties[col] = properties[col].map(lambda d: None if pd.isna(d) else d.isoformat())
+        portfolio = dict(self.portfolio)
+        for col in DATE_COLUMNS:
+            portfolio[col] = None if pd.isna(portfolio[col]) else portfolio[col].isoformat()
+        return {
+            'properties': properties.to_dict(orient='split'),
+            'months': self.months.to_dict(orient='split'),
+            'portfolio': portfolio,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'StatementAggregates':
+        """Rebuild aggregates saved with to_dict."""
+        properties = pd.DataFrame(**data['properties'])
+        properties.index.name = 'property_alias'
+        for col in DATE_COLUMNS:
+            properties[col] = pd.to_datetime(properties[col])
+        months = pd.DataFrame(**data['months'])
+        months.index.name = 'month'
+        portfolio = dict(data['portfolio'])
+        for col in DATE_COLUMNS:
+            portfolio[col] = pd.Timestamp(portfolio[col]) if portfolio[col] else pd.NaT
+        return cls(properties, months, portfolio)
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for the Business Analysis Engine.
+Generates synthetic statement histories in labels.csv format at each
+requested scale (rows and properties), then times load_data, every compute_*
+section and save_results of RentalPropertyAnalyzer separately, recording each
+step's peak memory. The report is written as JSON; pass an earlier report as
+--baseline to flag steps that got slower.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Ensure local imports work regardless of CWD
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.insert(0, CURRENT_DIR)
+
+from benchmark_load_data import write_labels_csv
+from business_analyzer import ANALYSIS_COLUMNS, ANALYSIS_VERSION, SECTION_METHODS, RentalPropertyAnalyzer
+
+
+# ROWS:PROPERTIES pairs, 1e3 to 1e7 statements over 10 to 100k properties
+DEFAULT_SCALES = ['1000:10', '10000:100', '100000:1000', '1000000:10000', '10000000:100000']
+
+# Latest statement month of the synthetic histories
+LAST_MONTH = np.datetime64('2025-12', 'M')
+
+# Steps faster than this in the baseline are too noisy to flag
+NOISE_FLOOR_SECONDS = 0.01
+
+
+def make_statement_history(rows: int, properties: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Build a synthetic statement history with the labels.csv columns (dates as
+    datetimes). Properties get uneven history lengths summing to rows and
+    monthly statements ending in staggered recent months. Rent is stepped per
+    tenancy, with vacant and part months; management fees run at 8-12% plus a
+    letting fee and deposit when a tenancy starts; repairs and misc costs are
+    sporadic; a few pay dates are missing.
+    """
+    if not 0 < properties <= rows:
+        raise ValueError(f"need 0 < properties <= rows, got {properties} properties for {rows} rows")
+    rng = np.random.default_rng(seed)
+
+    weights = rng.lognormal(0, 0.75, properties)
+    lengths = 1 + rng.multinomial(rows - properties, weights / weights.sum())
+    property_ids = np.repeat(np.arange(properties), lengths)
+    # Statement number within the property
+    position = np.arange(rows) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+    # Histories end within the two years before LAST_MONTH, so longer ones start earlier
+    first_month = LAST_MONTH - rng.integers(0, 24, properties) - (lengths - 1)
+    month = np.repeat(first_month, lengths) + position
+    period_start = month.astype('datetime64[D]')
+    period_end = (month + 1).astype('datetime64[D]') - 1
+    statement_date = period_start + rng.integers(-10, 10, rows)
+    pay_date = pd.Series(statement_date + rng.integers(0, 5, rows)).mask(rng.random(rows) < 0.05)
+
+    # A new tenancy with each property's first statement and then every ~18 months
+    new_tenancy = (position == 0) | (rng.random(rows) < 1 / 18)
+    tenancy = np.cumsum(new_tenancy) - 1
+    base_rent = rng.lognormal(6.2, 0.4, properties)
+    tenancy_property = property_ids[new_tenancy]
+    # Rent per tenancy around the property's base, to the nearest 5
+    tenancy_rent = (base_rent[tenancy_property] * rng.uniform(0.9, 1.15, len(tenancy_property)) / 5).round() * 5
+    rent = tenancy_rent[tenancy]
+    rent = np.where(rng.random(rows) < 0.02, rent * rng.uniform(0.2, 1.0, rows), rent).round(2)
+    rent[rng.random(rows) < 0.03] = 0.0  # vacant months
+
+    fee_rate = rng.uniform(0.08, 0.12, properties)[property_ids]
+    management_fee = (rent * fee_rate + np.where(new_tenancy, rent * 0.3, 0.0)).round(2)
+    deposit = np.where(new_tenancy, rent, 0.0)
+    repair = np.where(rng.random(rows) < 0.15, rng.exponential(150, rows), 0.0).round(2)
+    misc = np.where(rng.random(rows) < 0.05, rng.uniform(5, 200, rows), 0.0).round(2)
+    note = np.where(repair > 0, 'repairs', '').astype(object)
+
+    return pd.DataFrame({
+        'statement_id': np.arange(1, rows + 1),
+        'property_alias': np.array([f"Property {i:06d}" for i in range(properties)], dtype=object)[property_ids],
+        'statement_date': statement_date.astype('datetime64[ns]'),
+        'period_start': period_start.astype('datetime64[ns]'),
+        'period_end': period_end.astype('datetime64[ns]'),
+        'rent': rent,
+        'management_fee': management_fee,
+        'repair': repair,
+        'deposit': deposit,
+        'misc': misc,
+        'note': note,
+        'total': (rent - management_fee - repair - deposit - misc).round(2),
+        'pay_date': pay_date.astype('datetime64[ns]'),
+    })
+
+
+def _reset_peak_rss() -> bool:
+    """Reset the process's resident-set high-water mark (Linux only); False if unsupported."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _rss_bytes(field: str) -> Optional[int]:
+    """A /proc/self/status memory field (VmRSS, VmHWM) in bytes, None off Linux."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def _peak_rss_bytes() -> int:
+    """Resident-set high-water mark of the process."""
+    peak = _rss_bytes('VmHWM')
+    if peak is None:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+        peak *= 1 if sys.platform == 'darwin' else 1024
+    return peak
+
+
+def measure(step: Callable[[], Any], repeat: int = 1) -> Tuple[Dict[str, Any], Any]:
+    """
+    Run step repeat times with its output silenced; returns ({seconds,
+    peak_rss_mb, peak_increase_mb}, last result), keeping the best time and
+    the largest peak.
+    """
+    timing = {'seconds': float('inf'), 'peak_rss_mb': 0.0, 'peak_increase_mb': None}
+    for _ in range(repeat):
+        per_step = _reset_peak_rss()
+        start_rss = _rss_bytes('VmRSS')
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = step()
+        timing['seconds'] = min(timing['seconds'], time.perf_counter() - start)
+        peak = _peak_rss_bytes()
+        timing['peak_rss_mb'] = max(timing['peak_rss_mb'], peak / 1e6)
+        # Only meaningful when the high-water mark was reset for this step
+        if per_step and start_rss is not None:
+            timing['peak_increase_mb'] = max(timing['peak_increase_mb'] or 0.0, (peak - start_rss) / 1e6)
+    return timing, result
+
+
+def run_scale(rows: int, properties: int, work_dir: str, seed: int, repeat: int = 1) -> Dict[str, Any]:
+    """Generate one synthetic history and time every step of a full analysis on it."""
+    csv_path = os.path.join(work_dir, 'labels.csv')
+    start = time.perf_counter()
+    write_labels_csv(csv_path, make_statement_history(rows, properties, seed))
+    generate_seconds = time.perf_counter() - start
+
+    analyzer = RentalPropertyAnalyzer(csv_path)
+    steps = {}
+    # Only the columns the sections read, as run_complete_analysis loads them
+    steps['load_data'], df = measure(lambda: analyzer.load_data(columns=ANALYSIS_COLUMNS), repeat)
+    if df is None:
+        raise SystemExit(f"{csv_path}: load_data failed")
+
+    def section_step(method: str) -> Callable[[], Dict[str, Any]]:
+        def step():
+            # Drop the derived values earlier sections built, so each section is timed on its own
+            analyzer._derived.clear()
+            return getattr(analyzer, method)()
+        return step
+
+    sections = {}
+    for section, method in SECTION_METHODS.items():
+        steps[method], sections[section] = measure(section_step(method), repeat)
+
+    analyzer.results = {
+        'analysis_metadata': {
+            'generated_at': datetime.now().isoformat(),
+            'data_source': csv_path,
+            'total_records': len(df),
+            'analysis_version': ANALYSIS_VERSION
+        },
+        **sections
+    }
+    output_path = os.path.join(work_dir, 'business_analysis_results.json')
+    steps['save_results'], _ = measure(lambda: analyzer.save_results(output_path), repeat)
+
+    scale = {
+        'rows': rows,
+        'properties': properties,
+        'csv_mb': os.path.getsize(csv_path) / 1e6,
+        'frame_mb': df.memory_usage(deep=True).sum() / 1e6,
+        'results_mb': os.path.getsize(output_path) / 1e6,
+        'generate_seconds': generate_seconds,
+        'steps': steps,
+        'total_seconds': sum(step['seconds'] for step in steps.values()),
+    }
+    os.remove(csv_path)
+    os.remove(output_path)
+    return scale
+
+
+def parse_scale(value: str) -> Tuple[int, int]:
+    """Parse ROWS:PROPERTIES (either may be written as 1e6)."""
+    try:
+        rows, properties = (int(float(part)) for part in value.split(':'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected ROWS:PROPERTIES, got {value!r}")
+    if not 0 < properties <= rows:
+        raise argparse.ArgumentTypeError(f"need 0 < PROPERTIES <= ROWS, got {value!r}")
+    return rows, properties
+
+
+def compare_with_baseline(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Steps at least threshold times slower than in the baseline at the same scale."""
+    baseline_scales = {(s['rows'], s['properties']): s for s in baseline.get('scales', [])}
+    regressions = []
+    for scale in report['scales']:
+        previous = baseline_scales.get((scale['rows'], scale['properties']))
+        if previous is None:
+            continue
+        for step, timing in scale['steps'].items():
+            before = previous['steps'].get(step, {}).get('seconds')
+            if before is None or before < NOISE_FLOOR_SECONDS:
+                continue
+            ratio = timing['seconds'] / before
+            if ratio >= threshold:
+                regressions.append(f"{scale['rows']} rows, {scale['properties']} properties: {step} "
+                                   f"{before * 1000:.1f} -> {timing['seconds'] * 1000:.1f} ms ({ratio:.2f}x)")
+    return regressions
+
+
+def print_scale(scale: Dict[str, Any]):
+    """Print one scale's step timings and memory."""
+    print(f"{scale['rows']} rows, {scale['properties']} properties "
+          f"(CSV {scale['csv_mb']:.1f} MB, frame {scale['frame_mb']:.1f} MB)")
+    print(f"  {'step':<42}{'ms':>11}{'peak MB':>10}{'+MB':>9}")
+    for step, timing in scale['steps'].items():
+        increase = timing['peak_increase_mb']
+        print(f"  {step:<42}{timing['seconds'] * 1000:>11.1f}{timing['peak_rss_mb']:>10.1f}"
+              f"{'-' if increase is None else f'{increase:.1f}':>9}")
+    print(f"  {'total':<42}{scale['total_seconds'] * 1000:>11.1f}\n")
+
+
+def main():
+    """Run the scaling benchmark and write the JSON report."""
+    parser = argparse.ArgumentParser(description="Benchmark the business analysis engine at synthetic scale")
+    parser.add_argument("--scales", type=parse_scale, nargs="+", default=[parse_scale(s) for s in DEFAULT_SCALES],
+                       metavar="ROWS:PROPERTIES", help="Statement and property counts to benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic histories")
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs of each step (best is reported)")
+    parser.add_argument("--output", help="Report JSON (default: benchmark_analysis_report.json next to this script)")
+    parser.add_argument("--baseline", help="Earlier report to compare step timings against")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                       help="Slowdown ratio against the baseline reported as a regression")
+
+    args = parser.parse_args()
+    output_path = args.output or os.path.join(CURRENT_DIR, 'benchmark_analysis_report.json')
+
+    report = {
+        'generated_at': datetime.now().isoformat(),
+        'analysis_version': ANALYSIS_VERSION,
+        'environment': {
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        # peak_rss_mb is per step where the high-water mark can be reset (Linux), else since process start
+        'peak_rss_per_step': _reset_peak_rss(),
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'scales': [],
+    }
+    work_dir = tempfile.mkdtemp(prefix="analysis-bench-")
+    try:
+        for rows, properties in args.scales:
+            scale = run_scale(rows, properties, work_dir, args.seed, args.repeat)
+            report['scales'].append(scale)
+            print_scale(scale)
+            # Written after every scale so a long run leaves a partial report
+            os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+            with open(output_path, 'w') as f:
+                json.dump(report, f, indent=2)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    print(f"Report saved to {output_path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_with_baseline(report, json.load(f), args.threshold)
+        if regressions:
+            print(f"\nSlower than {args.baseline} by {args.threshold}x or more:")
+            for line in regressions:
+                print(f"  {line}")
+            raise SystemExit(1)
+        print(f"\nNo step {args.threshold}x slower than {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark RentalPropertyAnalyzer.load_data: CSV parsing vs the typed load cache.
+Writes a synthetic statement CSV in labels.csv format, then times a full CSV
+parse, a column-pruned parse, the first (converting) typed-cache load and
+warm memory-mapped loads, checking every path yields the same typed frame.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# Ensure local imports work regardless of CWD
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.insert(0, CURRENT_DIR)
+
+from benchmark_property_kpis import make_statements
+from business_analyzer import ANALYSIS_COLUMNS, RentalPropertyAnalyzer
+
+
+# Date columns of labels.csv
+DATE_COLUMNS = ['statement_date', 'period_start', 'period_end', 'pay_date']
+
+
+def format_dates(dates: pd.Series) -> pd.Series:
+    """Dates as labels.csv writes them (m/d/yyyy, NaT as empty), formatting each distinct date once."""
+    codes, uniques = pd.factorize(dates)
+    formatted = np.append(pd.DatetimeIndex(uniques).strftime('%-m/%-d/%Y').to_numpy(dtype=object), '')
+    return pd.Series(formatted[codes], index=dates.index)
+
+
+def write_labels_csv(path: str, df: pd.DataFrame) -> None:
+    """Write a statement frame in labels.csv format (title row, then a header row)."""
+    df = df.assign(**{col: format_dates(df[col]) for col in DATE_COLUMNS if col in df.columns})
+    with open(path, 'w') as f:
+        f.write('labels\n')
+        df.to_csv(f, index=False)
+
+
+def write_statements_csv(path: str, n_properties: int, months: int) -> int:
+    """Write a synthetic statement history in labels.csv format; returns the row count."""
+    df = make_statements(n_properties, months)
+    dates = df['statement_date']
+    write_labels_csv(path, df.assign(period_start=dates, period_end=dates, pay_date=dates, note='',
+                                     total=df['rent'] - df['management_fee'] - df['repair'] - df['misc']))
+    return len(df)
+
+
+def timed_load(data_path: str, cache_dir=None, columns=None):
+    """Load with a fresh analyzer; returns (seconds, frame)."""
+    analyzer = RentalPropertyAnalyzer(data_path, cache_dir=cache_dir)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        df = analyzer.load_data(columns=columns)
+    return time.perf_counter() - start, df
+
+
+def main():
+    """Run the load_data benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark CSV parsing vs the typed load cache")
+    parser.add_argument("--properties", type=int, default=5000, help="Synthetic properties")
+    parser.add_argument("--months", type=int, default=120, help="Statements per property")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repeats of each warm load (best is shown)")
+
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="analysis-load-bench-")
+    try:
+        csv_path = os.path.join(work_dir, "labels.csv")
+        cache_dir = os.path.join(work_dir, "cache")
+        rows = write_statements_csv(csv_path, args.properties, args.months)
+        print(f"{rows} rows, CSV {os.path.getsize(csv_path) / 1e6:.1f} MB\n")
+
+        full_s, csv_df = timed_load(csv_path)
+        pruned_s = min(timed_load(csv_path, columns=ANALYSIS_COLUMNS)[0] for _ in range(args.repeat))
+        convert_s, _ = timed_load(csv_path, cache_dir=cache_dir)
+        warm_s, warm_df = min((timed_load(csv_path, cache_dir=cache_dir) for _ in range(args.repeat)),
+                              key=lambda r: r[0])
+        warm_pruned_s, pruned_df = min(
+            (timed_load(csv_path, cache_dir=cache_dir, columns=ANALYSIS_COLUMNS) for _ in range(args.repeat)),
+            key=lambda r: r[0])
+
+        pd.testing.assert_frame_equal(csv_df, warm_df)
+        pd.testing.assert_frame_equal(csv_df[ANALYSIS_COLUMNS], pruned_df)
+
+        print(f"{'load':<36}{'ms':>10}")
+        for label, seconds in [("CSV parse, all columns", full_s),
+                               ("CSV parse, analysis columns", pruned_s),
+                               ("typed cache, first load (convert)", convert_s),
+                               ("typed cache, all columns", warm_s),
+                               ("typed cache, analysis columns", warm_pruned_s)]:
+            print(f"{label:<36}{seconds * 1000:>10.1f}")
+        print("\nAll loads produced identical frames")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark ParallelRentalAnalyzer against the serial analyzer.
+Times the per-property sections (property KPIs and cost optimization, which
+share one aggregation) on synthetic statement histories, serially and with
+a process pool of each requested size, and checks the results are identical.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Ensure local imports work regardless of CWD
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.insert(0, CURRENT_DIR)
+
+from benchmark_property_kpis import make_statements
+from business_analyzer import RentalPropertyAnalyzer
+from parallel_analyzer import ParallelRentalAnalyzer
+
+
+def timed_property_sections(analyzer: RentalPropertyAnalyzer, df):
+    """Run both per-property sections on df; returns (seconds, (kpis, cost optimization))."""
+    analyzer.df = df
+    start = time.perf_counter()
+    results = (analyzer.compute_property_kpis(), analyzer.compute_cost_optimization_opportunities())
+    return time.perf_counter() - start, results
+
+
+def main():
+    """Run the serial vs parallel benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark parallel per-property analysis")
+    parser.add_argument("--properties", type=int, nargs="+", default=[1000, 10000, 50000],
+                       help="Property counts to benchmark")
+    parser.add_argument("--months", type=int, default=60, help="Statements per property")
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, os.cpu_count() or 1],
+                       help="Pool sizes to benchmark")
+
+    args = parser.parse_args()
+    workers = sorted(set(args.workers))
+
+    print(f"Property KPIs + cost optimization, {args.months} statements per property, {os.cpu_count()} CPUs\n")
+    print(f"{'properties':>11}{'rows':>11}{'serial ms':>11}"
+          + "".join(f"{f'{w} workers ms':>16}{'speedup':>9}" for w in workers))
+    for n_properties in args.properties:
+        df = make_statements(n_properties, args.months)
+        serial_s, expected = timed_property_sections(RentalPropertyAnalyzer(), df)
+        line = f"{n_properties:>11}{len(df):>11}{serial_s * 1000:>11.1f}"
+        for w in workers:
+            parallel_s, results = timed_property_sections(ParallelRentalAnalyzer(workers=w, min_rows=0), df)
+            if results != expected:
+                raise SystemExit(f"{w} workers: results differ from the serial analyzer")
+            line += f"{parallel_s * 1000:>16.1f}{serial_s / parallel_s:>8.2f}x"
+        print(line)
+    print("\nParallel results identical to serial")
+
+
+if __name__ == "__main__":
+    main()
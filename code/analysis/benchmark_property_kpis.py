@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-property aggregation in the Business Analysis Engine.
+Generates synthetic statement histories with a growing number of properties
+and times the per-group loop the analyzer used to run against the single
+grouped pass now behind compute_property_kpis and
+compute_cost_optimization_opportunities, checking both give the same numbers.
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+# Ensure local imports work regardless of CWD
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.insert(0, CURRENT_DIR)
+
+from business_analyzer import RentalPropertyAnalyzer
+
+
+def make_statements(n_properties: int, months: int = 24, seed: int = 0) -> pd.DataFrame:
+    """Build a typed statement frame (as load_data returns) with one statement per property per month."""
+    rng = np.random.default_rng(seed)
+    n = n_properties * months
+    base_rent = rng.uniform(350, 1200, n_properties).round(2)
+    rent = np.repeat(base_rent, months) * rng.normal(1.0, 0.05, n).round(2)
+    rent[rng.random(n) < 0.03] = 0.0  # vacant months
+    return pd.DataFrame({
+        'statement_id': np.arange(n),
+        'property_alias': np.repeat([f"Property {i:06d}" for i in range(n_properties)], months),
+        'statement_date': np.tile(pd.date_range('2021-01-05', periods=months, freq='MS'), n_properties),
+        'rent': rent.round(2),
+        'management_fee': (rent * rng.uniform(0.08, 0.14, n)).round(2),
+        'repair': np.where(rng.random(n) < 0.2, rng.exponential(120, n), 0.0).round(2),
+        'deposit': 0.0,
+        'misc': np.where(rng.random(n) < 0.1, rng.uniform(5, 60, n), 0.0).round(2),
+    })
+
+
+def per_group_property_kpis(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """The former compute_property_kpis: one Python iteration and a dozen reductions per property."""
+    kpis = {}
+    for property_name, group in df.groupby('property_alias'):
+        total_rent = group['rent'].sum()
+        total_mgmt_fee = group['management_fee'].sum()
+        total_repair = group['repair'].sum()
+        total_misc = group['misc'].sum()
+        property_kpis = {
+            'total_rental_income': float(total_rent),
+            'average_monthly_rent': float(group['rent'].mean()),
+            'rent_volatility': float(group['rent'].std()),
+            'total_management_fees': float(total_mgmt_fee),
+            'total_repair_costs': float(total_repair),
+            'total_miscellaneous_costs': float(total_misc),
+            'total_deposits': float(group['deposit'].sum()),
+        }
+        if total_rent > 0:
+            property_kpis['management_fee_ratio'] = float((total_mgmt_fee / total_rent) * 100)
+            property_kpis['repair_cost_ratio'] = float((total_repair / total_rent) * 100)
+            property_kpis['misc_cost_ratio'] = float((total_misc / total_rent) * 100)
+            property_kpis['total_cost_ratio'] = float(((total_mgmt_fee + total_repair + total_misc) / total_rent) * 100)
+            property_kpis['net_yield'] = float(((total_rent - total_mgmt_fee - total_repair - total_misc) / total_rent) * 100)
+        property_kpis['net_cash_flow'] = float(total_rent - total_mgmt_fee - total_repair - total_misc)
+        property_kpis['average_monthly_cash_flow'] = float(property_kpis['net_cash_flow'] / len(group))
+        property_kpis['statement_count'] = len(group)
+        property_kpis['date_range_months'] = (group['statement_date'].max() - group['statement_date'].min()).days / 30.44
+        property_kpis['vacancy_rate'] = float(((group['rent'] == 0).sum() / len(group)) * 100)
+        kpis[property_name] = property_kpis
+    return kpis
+
+
+def max_relative_difference(expected: Dict[str, Dict[str, Any]], actual: Dict[str, Dict[str, Any]]) -> float:
+    """Largest relative difference between matching values; inf if keys differ."""
+    if list(expected) != list(actual):
+        return math.inf
+    worst = 0.0
+    for name, metrics in expected.items():
+        if list(metrics) != list(actual[name]):
+            return math.inf
+        for key, value in metrics.items():
+            other = actual[name][key]
+            if value == other or (value != value and other != other):
+                continue
+            worst = max(worst, abs(value - other) / max(abs(value), abs(other)))
+    return worst
+
+
+def main():
+    """Run the per-property aggregation scaling benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark per-property KPI aggregation")
+    parser.add_argument("--properties", type=int, nargs="+", default=[10, 100, 1000, 10000],
+                       help="Property counts to benchmark")
+    parser.add_argument("--months", type=int, default=24, help="Statements per property")
+    parser.add_argument("--skip-loop-above", type=int, default=10000,
+                       help="Skip the slow per-group loop above this many properties")
+
+    args = parser.parse_args()
+
+    print(f"Per-property KPIs, {args.months} statements per property\n")
+    print(f"{'properties':>11}{'rows':>10}{'loop ms':>11}{'agg ms':>10}{'cost opt ms':>13}{'speedup':>9}{'max rel diff':>14}")
+    for n_properties in args.properties:
+        df = make_statements(n_properties, args.months)
+        analyzer = RentalPropertyAnalyzer()
+        analyzer.df = df
+
+        start = time.perf_counter()
+        kpis = analyzer.compute_property_kpis()
+        agg_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        analyzer.compute_cost_optimization_opportunities()
+        cost_ms = (time.perf_counter() - start) * 1000
+
+        if n_properties > args.skip_loop_above:
+            print(f"{n_properties:>11}{len(df):>10}{'-':>11}{agg_ms:>10.1f}{cost_ms:>13.1f}{'-':>9}{'-':>14}")
+            continue
+        start = time.perf_counter()
+        reference = per_group_property_kpis(df)
+        loop_ms = (time.perf_counter() - start) * 1000
+
+        diff = max_relative_difference(reference, kpis)
+        print(f"{n_properties:>11}{len(df):>10}{loop_ms:>11.1f}{agg_ms:>10.1f}{cost_ms:>13.1f}"
+              f"{loop_ms / agg_ms:>8.1f}x{diff:>14.1e}")
+
+
+if __name__ == "__main__":
+    main()
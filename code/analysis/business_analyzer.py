@@ -4,14 +4,66 @@ Business Analysis Engine for Rental Property Data
 Computes deterministic business metrics and KPIs from rental property data.
 """
 
+import argparse
 import json
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import os
+import sys
 from pathlib import Path
 
+# Ensure local imports work regardless of CWD
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.insert(0, CURRENT_DIR)
+
+from aggregates import trend_months, trend_sums
+from result_cache import RESULTS_SUBDIR, ResultCache
+from typed_cache import DEFAULT_CACHE_DIR, TYPED_EXTENSIONS, TypedLoadCache, pyarrow_available, read_typed_file
+
+
+# Recorded in the results and part of the result cache key; bump when any section's output changes
+ANALYSIS_VERSION = '1.2'
+
+# Columns read by the compute_* sections; run_complete_analysis loads only these
+ANALYSIS_COLUMNS = ['property_alias', 'statement_date', 'rent', 'management_fee', 'repair', 'deposit', 'misc']
+
+# Result sections in output order, with the method computing each
+SECTION_METHODS = {
+    'property_kpis': 'compute_property_kpis',
+    'portfolio_metrics': 'compute_portfolio_metrics',
+    'seasonal_analysis': 'compute_seasonal_analysis',
+    'cost_optimization': 'compute_cost_optimization_opportunities',
+    'risk_metrics': 'compute_risk_metrics',
+    'predictive_metrics': 'compute_predictive_metrics',
+}
+
+
+def _group_series_stats(values: np.ndarray, bounds: List[int], std: bool = False):
+    """
+    Per-group sums, means and (with std=True) sample stds of values sorted by
+    group, group i being values[bounds[i]:bounds[i + 1]]. Each group is reduced
+    the way Series.sum/mean/std reduce it (NaN skipped, numpy's pairwise sum
+    over the group's rows, two-pass variance), so the results are bit-for-bit
+    those of per-group Series reductions. Returns (sums, means, stds or None).
+    """
+    missing = np.isnan(values)
+    filled = np.where(missing, 0.0, values)
+    starts, stops = bounds[:-1], bounds[1:]
+    present = np.concatenate([[0], np.cumsum(~missing)])
+    counts = (present[stops] - present[starts]).astype('float64')
+    sums = np.array([filled[a:b].sum() for a, b in zip(starts, stops)], dtype='float64')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = sums / counts
+        if not std:
+            return sums, means, None
+        sqr = (np.repeat(means, np.diff(bounds)) - filled) ** 2
+        sqr[missing] = 0
+        variances = np.array([sqr[a:b].sum() for a, b in zip(starts, stops)], dtype='float64') / (counts - 1)
+    return sums, means, np.sqrt(np.where(counts > 1, variances, np.nan))
+
 
 class RentalPropertyAnalyzer:
     """
@@ -19,29 +71,37 @@ class RentalPropertyAnalyzer:
     Computes deterministic metrics for portfolio optimization and business intelligence.
     """
     
-    def __init__(self, data_path: str = "code/sample-data/rental-statements/labels.csv"):
-        """Initialize analyzer with data path."""
+    def __init__(self, data_path: str = "code/sample-data/rental-statements/labels.csv",
+                 cache_dir: Optional[str] = None, result_cache_dir: Optional[str] = None):
+        """
+        Initialize analyzer with data path; cache_dir enables the typed load
+        cache and result_cache_dir the persistent cache of section results.
+        """
         self.data_path = data_path
+        self.load_cache = TypedLoadCache(cache_dir) if cache_dir else None
+        self.result_cache = ResultCache(result_cache_dir) if result_cache_dir else None
         self.df = None
         self.results = {}
-        
-    def load_data(self) -> pd.DataFrame:
-        """Load and preprocess rental statement data."""
+        self.record_count = None
+        # Derived columns and views of self.df, built lazily and shared across sections
+        self._derived = {}
+        self._derived_source = None
+        
+    def load_data(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load and preprocess rental statement data, keeping only columns if given.
+        Typed columnar files (.arrow/.feather/.parquet) are read as-is; with the
+        typed load cache on, a CSV is converted once and then read from the cache.
+        """
         try:
-            # Load the CSV file, skipping the first row which contains column headers
-            self.df = pd.read_csv(self.data_path, skiprows=1)
-            
-            # Convert date columns to datetime
-            date_columns = ['statement_date', 'period_start', 'period_end', 'pay_date']
-            for col in date_columns:
-                if col in self.df.columns:
-                    self.df[col] = pd.to_datetime(self.df[col], errors='coerce')
-            
-            # Convert numeric columns
-            numeric_columns = ['rent', 'management_fee', 'repair', 'deposit', 'misc', 'total']
-            for col in numeric_columns:
-                if col in self.df.columns:
-                    self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
+            if self.data_path.endswith(TYPED_EXTENSIONS):
+                self.df = read_typed_file(self.data_path, columns)
+            elif self.load_cache is not None and pyarrow_available():
+                self.df = self.load_cache.load(self.data_path, self._read_csv, columns)
+            else:
+                if self.load_cache is not None:
+                    print("pyarrow not installed; parsing the CSV without the typed load cache")
+                self.df = self._read_csv(self.data_path, columns)
             
             print(f"Loaded {len(self.df)} records from {self.data_path}")
             return self.df
@@ -50,76 +110,227 @@ class RentalPropertyAnalyzer:
             print(f"Error loading data: {e}")
             return None
     
+    def _read_csv(self, path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        # Load the CSV file, skipping the first row which contains column headers
+        usecols = None if columns is None else (lambda col: col in columns)
+        return self.prepare_statements(pd.read_csv(path, skiprows=1, usecols=usecols))
+    
+    @staticmethod
+    def prepare_statements(df: pd.DataFrame) -> pd.DataFrame:
+        """Convert raw statement columns (as read from CSV) to dates and numbers, in place."""
+        # Convert date columns to datetime
+        date_columns = ['statement_date', 'period_start', 'period_end', 'pay_date']
+        for col in date_columns:
+            if col in df.columns:
+                df[col] = pd.to_datetime(df[col], errors='coerce')
+        
+        # Convert numeric columns
+        numeric_columns = ['rent', 'management_fee', 'repair', 'deposit', 'misc', 'total']
+        for col in numeric_columns:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+        
+        return df
+    
+    def _derived_value(self, name: str) -> Any:
+        """
+        Return a derived column or view of self.df, built on first use by
+        _build_<name> and memoized until self.df is reloaded or replaced.
+        The loaded frame itself is never modified.
+        """
+        if self._derived_source is not self.df:
+            self._derived = {}
+            self._derived_source = self.df
+        if name not in self._derived:
+            self._derived[name] = getattr(self, f'_build_{name}')()
+        return self._derived[name]
+    
+    def _build_total_costs(self) -> pd.Series:
+        """Management fees + repairs + miscellaneous costs per statement."""
+        return self.df['management_fee'] + self.df['repair'] + self.df['misc']
+    
+    def _build_cash_flow(self) -> pd.Series:
+        """Rent less total costs per statement."""
+        return self.df['rent'] - self._derived_value('total_costs')
+    
+    def _build_zero_rent(self) -> pd.Series:
+        """Statements with zero rent (vacant periods)."""
+        return self.df['rent'] == 0
+    
+    def _build_month(self) -> pd.Series:
+        """Calendar month of each statement date."""
+        return self.df['statement_date'].dt.month.rename('month')
+    
+    def _build_date_sorted(self) -> pd.DataFrame:
+        """Rent, total costs and cash flow in statement date order (not a full-frame copy)."""
+        # Positions of the rows in the order sort_values('statement_date') gives
+        order = self.df['statement_date'].reset_index(drop=True).sort_values().index.to_numpy()
+        return pd.DataFrame({
+            'rent': self.df['rent'].to_numpy()[order],
+            'total_costs': self._derived_value('total_costs').to_numpy()[order],
+            'cash_flow': self._derived_value('cash_flow').to_numpy()[order],
+        })
+    
+    def _build_trend_sums(self) -> pd.DataFrame:
+        """Per-property trend fit sums (see aggregates.trend_sums) and last statement date."""
+        sums = trend_sums(self.df)
+        return sums.assign(last_statement=self._derived_value('property_aggregates')['last_statement'])
+    
+    def _build_property_aggregates(self) -> pd.DataFrame:
+        """
+        Compute every per-property statistic in one grouped pass.
+        Shared by compute_property_kpis and compute_cost_optimization_opportunities;
+        one row per property, in groupby (sorted) order.
+        """
+        columns = ['property_alias', 'statement_date', 'rent', 'management_fee', 'repair', 'misc', 'deposit']
+        return self.aggregate_properties(self.df[columns].assign(zero_rent=self._derived_value('zero_rent')))
+    
+    @staticmethod
+    def aggregate_properties(data: pd.DataFrame) -> pd.DataFrame:
+        """
+        The per-property aggregation behind _build_property_aggregates, over a
+        frame with property_alias, statement_date, the amount columns and zero_rent.
+        The KPI figures (totals, average_monthly_rent, rent_std) are reduced per
+        property as Series reductions, the cost optimization averages and
+        repair_std by the groupby aggregation, as each section computed them.
+        """
+        agg = data.groupby('property_alias').agg(
+            average_rent=('rent', 'mean'),
+            average_mgmt_fee=('management_fee', 'mean'),
+            average_repair=('repair', 'mean'),
+            repair_std=('repair', 'std'),
+            statement_count=('rent', 'size'),
+            zero_rent_count=('zero_rent', 'sum'),
+            first_statement=('statement_date', 'min'),
+            last_statement=('statement_date', 'max'),
+        )
+        
+        # Rows grouped by property in sorted alias order, each property's rows in file order
+        codes, _ = pd.factorize(data['property_alias'], sort=True)
+        order = np.argsort(codes, kind='stable')
+        order = order[codes[order] >= 0]  # NaN aliases are not grouped
+        bounds = np.concatenate([[0], np.cumsum(np.bincount(codes[order]))]).tolist()
+        
+        def group_stats(col: str, std: bool = False):
+            return _group_series_stats(data[col].to_numpy(dtype='float64')[order], bounds, std)
+        
+        total_rent, average_monthly_rent, rent_std = group_stats('rent', std=True)
+        stats = {
+            'total_rent': total_rent,
+            'average_monthly_rent': average_monthly_rent,
+            'rent_std': rent_std,
+            'total_mgmt_fee': group_stats('management_fee')[0],
+            'total_repair': group_stats('repair')[0],
+            'total_misc': group_stats('misc')[0],
+            'total_deposit': group_stats('deposit')[0],
+        }
+        return pd.concat([pd.DataFrame(stats, index=agg.index), agg], axis=1)
+    
     def compute_property_kpis(self) -> Dict[str, Any]:
         """Compute property-level Key Performance Indicators."""
         if self.df is None:
             return {}
         
-        kpis = {}
-        
-        # Group by property
-        property_groups = self.df.groupby('property_alias')
-        
-        for property_name, group in property_groups:
-            property_kpis = {}
-            
-            # Basic financial metrics
-            total_rent = group['rent'].sum()
-            total_mgmt_fee = group['management_fee'].sum()
-            total_repair = group['repair'].sum()
-            total_misc = group['misc'].sum()
-            total_deposit = group['deposit'].sum()
-            
+        return self.property_kpis_from_aggregates(self._derived_value('property_aggregates'))
+    
+    @staticmethod
+    def property_kpis_from_aggregates(agg: pd.DataFrame) -> Dict[str, Any]:
+        """Derive property KPIs from a per-property aggregate frame (see _build_property_aggregates)."""
+        total_rent = agg['total_rent']
+        total_costs = agg['total_mgmt_fee'] + agg['total_repair'] + agg['total_misc']
+        net_cash_flow = total_rent - agg['total_mgmt_fee'] - agg['total_repair'] - agg['total_misc']
+        
+        # Derived metrics, column-wise across all properties
+        derived = pd.DataFrame({
             # Revenue metrics
-            property_kpis['total_rental_income'] = float(total_rent)
-            property_kpis['average_monthly_rent'] = float(group['rent'].mean())
-            property_kpis['rent_volatility'] = float(group['rent'].std())
-            
+            'total_rental_income': total_rent,
+            'average_monthly_rent': agg['average_monthly_rent'],
+            'rent_volatility': agg['rent_std'],
             # Cost metrics
-            property_kpis['total_management_fees'] = float(total_mgmt_fee)
-            property_kpis['total_repair_costs'] = float(total_repair)
-            property_kpis['total_miscellaneous_costs'] = float(total_misc)
-            property_kpis['total_deposits'] = float(total_deposit)
-            
-            # Efficiency ratios
-            if total_rent > 0:
-                property_kpis['management_fee_ratio'] = float((total_mgmt_fee / total_rent) * 100)
-                property_kpis['repair_cost_ratio'] = float((total_repair / total_rent) * 100)
-                property_kpis['misc_cost_ratio'] = float((total_misc / total_rent) * 100)
-                property_kpis['total_cost_ratio'] = float(((total_mgmt_fee + total_repair + total_misc) / total_rent) * 100)
-                property_kpis['net_yield'] = float(((total_rent - total_mgmt_fee - total_repair - total_misc) / total_rent) * 100)
-            
+            'total_management_fees': agg['total_mgmt_fee'],
+            'total_repair_costs': agg['total_repair'],
+            'total_miscellaneous_costs': agg['total_misc'],
+            'total_deposits': agg['total_deposit'],
+            # Efficiency ratios (only reported where total rent > 0)
+            'management_fee_ratio': (agg['total_mgmt_fee'] / total_rent) * 100,
+            'repair_cost_ratio': (agg['total_repair'] / total_rent) * 100,
+            'misc_cost_ratio': (agg['total_misc'] / total_rent) * 100,
+            'total_cost_ratio': (total_costs / total_rent) * 100,
+            'net_yield': (net_cash_flow / total_rent) * 100,
             # Cash flow metrics
-            property_kpis['net_cash_flow'] = float(total_rent - total_mgmt_fee - total_repair - total_misc)
-            property_kpis['average_monthly_cash_flow'] = float(property_kpis['net_cash_flow'] / len(group))
-            
+            'net_cash_flow': net_cash_flow,
+            'average_monthly_cash_flow': net_cash_flow / agg['statement_count'],
             # Time-based metrics
-            property_kpis['statement_count'] = len(group)
-            property_kpis['date_range_months'] = (group['statement_date'].max() - group['statement_date'].min()).days / 30.44
-            
+            'date_range_months': (agg['last_statement'] - agg['first_statement']).dt.days / 30.44,
             # Vacancy analysis
-            zero_rent_count = (group['rent'] == 0).sum()
-            property_kpis['vacancy_rate'] = float((zero_rent_count / len(group)) * 100)
-            
+            'vacancy_rate': (agg['zero_rent_count'] / agg['statement_count']) * 100,
+        })
+        
+        float_keys = ['total_rental_income', 'average_monthly_rent', 'rent_volatility',
+                      'total_management_fees', 'total_repair_costs', 'total_miscellaneous_costs',
+                      'total_deposits']
+        ratio_keys = ['management_fee_ratio', 'repair_cost_ratio', 'misc_cost_ratio',
+                      'total_cost_ratio', 'net_yield']
+        
+        kpis = {}
+        columns = {key: derived[key].tolist() for key in derived.columns}
+        counts = agg['statement_count'].tolist()
+        for i, property_name in enumerate(agg.index):
+            property_kpis = {key: float(columns[key][i]) for key in float_keys}
+            if columns['total_rental_income'][i] > 0:
+                property_kpis.update({key: float(columns[key][i]) for key in ratio_keys})
+            property_kpis['net_cash_flow'] = float(columns['net_cash_flow'][i])
+            property_kpis['average_monthly_cash_flow'] = float(columns['average_monthly_cash_flow'][i])
+            property_kpis['statement_count'] = int(counts[i])
+            property_kpis['date_range_months'] = float(columns['date_range_months'][i])
+            property_kpis['vacancy_rate'] = float(columns['vacancy_rate'][i])
             kpis[property_name] = property_kpis
         
         return kpis
     
+    @staticmethod
+    def _rows_as_float_dicts(frame: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+        """Convert a per-property frame to {property: {column: float}}, keeping column order."""
+        columns = {key: frame[key].tolist() for key in frame.columns}
+        return {
+            property_name: {key: float(values[i]) for key, values in columns.items()}
+            for i, property_name in enumerate(frame.index)
+        }
+    
     def compute_portfolio_metrics(self) -> Dict[str, Any]:
         """Compute portfolio-level metrics."""
         if self.df is None:
             return {}
         
+        totals = {
+            'total_properties': self.df['property_alias'].nunique(),
+            'total_statements': len(self.df),
+            'rent': self.df['rent'].sum(),
+            'management_fee': self.df['management_fee'].sum(),
+            'repair': self.df['repair'].sum(),
+            'misc': self.df['misc'].sum(),
+            'deposit': self.df['deposit'].sum(),
+            'first_statement': self.df['statement_date'].min(),
+            'last_statement': self.df['statement_date'].max(),
+        }
+        return self.portfolio_from_totals(totals)
+    
+    @staticmethod
+    def portfolio_from_totals(totals: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Derive portfolio metrics from portfolio totals: property and statement
+        counts, per-column sums and the first/last statement dates.
+        """
         portfolio = {}
         
         # Overall portfolio metrics
-        portfolio['total_properties'] = self.df['property_alias'].nunique()
-        portfolio['total_statements'] = len(self.df)
-        portfolio['total_rental_income'] = float(self.df['rent'].sum())
-        portfolio['total_management_fees'] = float(self.df['management_fee'].sum())
-        portfolio['total_repair_costs'] = float(self.df['repair'].sum())
-        portfolio['total_miscellaneous_costs'] = float(self.df['misc'].sum())
-        portfolio['total_deposits'] = float(self.df['deposit'].sum())
+        portfolio['total_properties'] = totals['total_properties']
+        portfolio['total_statements'] = totals['total_statements']
+        portfolio['total_rental_income'] = float(totals['rent'])
+        portfolio['total_management_fees'] = float(totals['management_fee'])
+        portfolio['total_repair_costs'] = float(totals['repair'])
+        portfolio['total_miscellaneous_costs'] = float(totals['misc'])
+        portfolio['total_deposits'] = float(totals['deposit'])
         
         # Portfolio efficiency
         total_costs = portfolio['total_management_fees'] + portfolio['total_repair_costs'] + portfolio['total_miscellaneous_costs']
@@ -133,9 +344,9 @@ class RentalPropertyAnalyzer:
             portfolio['portfolio_net_yield'] = float((portfolio['net_portfolio_value'] / portfolio['total_rental_income']) * 100)
         
         # Time analysis
-        portfolio['date_range_start'] = self.df['statement_date'].min().strftime('%Y-%m-%d')
-        portfolio['date_range_end'] = self.df['statement_date'].max().strftime('%Y-%m-%d')
-        portfolio['analysis_period_months'] = (self.df['statement_date'].max() - self.df['statement_date'].min()).days / 30.44
+        portfolio['date_range_start'] = totals['first_statement'].strftime('%Y-%m-%d')
+        portfolio['date_range_end'] = totals['last_statement'].strftime('%Y-%m-%d')
+        portfolio['analysis_period_months'] = (totals['last_statement'] - totals['first_statement']).days / 30.44
         
         # Monthly averages
         portfolio['average_monthly_rent'] = float(portfolio['total_rental_income'] / portfolio['analysis_period_months'])
@@ -149,19 +360,25 @@ class RentalPropertyAnalyzer:
         if self.df is None:
             return {}
         
-        seasonal = {}
-        
-        # Add month column
-        self.df['month'] = self.df['statement_date'].dt.month
-        
-        # Monthly averages
-        monthly_stats = self.df.groupby('month').agg({
+        # Monthly averages, grouped by the derived month column
+        columns = ['rent', 'management_fee', 'repair', 'misc']
+        monthly_stats = self.df[columns].groupby(self._derived_value('month')).agg({
             'rent': ['mean', 'sum', 'count'],
             'management_fee': ['mean', 'sum'],
             'repair': ['mean', 'sum'],
             'misc': ['mean', 'sum']
         }).round(2)
         
+        return self.seasonal_from_monthly_stats(monthly_stats)
+    
+    @staticmethod
+    def seasonal_from_monthly_stats(monthly_stats: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Derive the seasonal analysis from per-month statistics: a frame indexed
+        by month number with (column, statistic) columns, rounded to 2 decimals.
+        """
+        seasonal = {}
+        
         seasonal['monthly_averages'] = {}
         for month in range(1, 13):
             month_name = datetime(2023, month, 1).strftime('%B')
@@ -197,47 +414,47 @@ class RentalPropertyAnalyzer:
         if self.df is None:
             return {}
         
+        return self.cost_optimization_from_aggregates(self._derived_value('property_aggregates'),
+                                                      self.df['rent'].sum())
+    
+    @classmethod
+    def cost_optimization_from_aggregates(cls, agg: pd.DataFrame, total_rent: float) -> Dict[str, Any]:
+        """Derive cost optimization opportunities from a per-property aggregate frame."""
         optimization = {}
         
-        # Management fee analysis
-        mgmt_fee_by_property = self.df.groupby('property_alias')['management_fee'].agg(['mean', 'sum'])
-        rent_by_property = self.df.groupby('property_alias')['rent'].agg(['mean', 'sum'])
-        
-        optimization['management_fee_analysis'] = {}
-        for property_name in mgmt_fee_by_property.index:
-            avg_mgmt_fee = mgmt_fee_by_property.loc[property_name, 'mean']
-            avg_rent = rent_by_property.loc[property_name, 'mean']
-            mgmt_fee_ratio = (avg_mgmt_fee / avg_rent * 100) if avg_rent > 0 else 0
-            
-            optimization['management_fee_analysis'][property_name] = {
-                'average_management_fee': float(avg_mgmt_fee),
-                'average_rent': float(avg_rent),
-                'management_fee_ratio': float(mgmt_fee_ratio),
-                'industry_benchmark': 10.0,  # Industry standard
-                'optimization_potential': float(max(0, mgmt_fee_ratio - 10.0)),
-                'potential_annual_savings': float(max(0, (mgmt_fee_ratio - 10.0) / 100 * avg_rent * 12))
-            }
+        avg_mgmt_fee = agg['average_mgmt_fee']
+        avg_rent = agg['average_rent']
+        avg_repair = agg['average_repair']
+        
+        # Management fee analysis; .where(x > 0, 0.0) is max(0, x) column-wise (NaN -> 0)
+        mgmt_fee_ratio = (avg_mgmt_fee / avg_rent * 100).where(avg_rent > 0, 0.0)
+        optimization_potential = mgmt_fee_ratio - 10.0
+        annual_savings = (mgmt_fee_ratio - 10.0) / 100 * avg_rent * 12
+        mgmt_columns = pd.DataFrame({
+            'average_management_fee': avg_mgmt_fee,
+            'average_rent': avg_rent,
+            'management_fee_ratio': mgmt_fee_ratio,
+            'industry_benchmark': 10.0,  # Industry standard
+            'optimization_potential': optimization_potential.where(optimization_potential > 0, 0.0),
+            'potential_annual_savings': annual_savings.where(annual_savings > 0, 0.0),
+        })
+        optimization['management_fee_analysis'] = cls._rows_as_float_dicts(mgmt_columns)
         
         # Repair cost analysis
-        repair_by_property = self.df.groupby('property_alias')['repair'].agg(['mean', 'sum', 'std'])
-        optimization['repair_cost_analysis'] = {}
-        
-        for property_name in repair_by_property.index:
-            avg_repair = repair_by_property.loc[property_name, 'mean']
-            repair_volatility = repair_by_property.loc[property_name, 'std']
-            
-            optimization['repair_cost_analysis'][property_name] = {
-                'average_repair_cost': float(avg_repair),
-                'repair_cost_volatility': float(repair_volatility),
-                'industry_benchmark': 15.0,  # Industry standard percentage
-                'maintenance_efficiency_score': float(max(0, 100 - (avg_repair / rent_by_property.loc[property_name, 'mean'] * 100)))
-            }
+        efficiency_score = 100 - (avg_repair / avg_rent * 100)
+        repair_columns = pd.DataFrame({
+            'average_repair_cost': avg_repair,
+            'repair_cost_volatility': agg['repair_std'],
+            'industry_benchmark': 15.0,  # Industry standard percentage
+            'maintenance_efficiency_score': efficiency_score.where(efficiency_score > 0, 0.0),
+        })
+        optimization['repair_cost_analysis'] = cls._rows_as_float_dicts(repair_columns)
         
         # Overall optimization summary
         total_potential_savings = sum([opt['potential_annual_savings'] for opt in optimization['management_fee_analysis'].values()])
         optimization['total_optimization_potential'] = {
             'annual_savings_potential': float(total_potential_savings),
-            'percentage_of_income': float((total_potential_savings / self.df['rent'].sum()) * 100),
+            'percentage_of_income': float((total_potential_savings / total_rent) * 100),
             'roi_timeline_months': float(12)  # Assuming immediate implementation
         }
         
@@ -248,26 +465,47 @@ class RentalPropertyAnalyzer:
         if self.df is None:
             return {}
         
+        stats = {
+            'total_statements': len(self.df),
+            'zero_rent_statements': self._derived_value('zero_rent').sum(),
+            'low_rent_statements': (self.df['rent'] < self.df['rent'].quantile(0.25)).sum(),
+            'management_fee_std': self.df['management_fee'].std(),
+            'repair_std': self.df['repair'].std(),
+            'total_costs_std': self._derived_value('total_costs').std(),
+            'cash_flow_std': self._derived_value('cash_flow').std(),
+            'property_shares': self.df['property_alias'].value_counts(normalize=True),
+        }
+        return self.risk_from_stats(stats)
+    
+    @staticmethod
+    def risk_from_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Derive risk metrics from statement counts (total, zero rent, below the
+        rent lower quartile), cost and cash flow standard deviations and the
+        properties' statement shares, largest first.
+        """
         risk = {}
         
         # Payment risk analysis
+        zero_rent_count = stats['zero_rent_statements']
+        total_statements = stats['total_statements']
         risk['payment_risk'] = {
-            'zero_rent_statements': int((self.df['rent'] == 0).sum()),
-            'zero_rent_percentage': float((self.df['rent'] == 0).sum() / len(self.df) * 100),
-            'low_rent_statements': int((self.df['rent'] < self.df['rent'].quantile(0.25)).sum()),
-            'payment_consistency_score': float(100 - ((self.df['rent'] == 0).sum() / len(self.df) * 100))
+            'zero_rent_statements': int(zero_rent_count),
+            'zero_rent_percentage': float(zero_rent_count / total_statements * 100),
+            'low_rent_statements': int(stats['low_rent_statements']),
+            'payment_consistency_score': float(100 - (zero_rent_count / total_statements * 100))
         }
         
         # Cost volatility analysis
         risk['cost_volatility'] = {
-            'management_fee_volatility': float(self.df['management_fee'].std()),
-            'repair_cost_volatility': float(self.df['repair'].std()),
-            'total_cost_volatility': float((self.df['management_fee'] + self.df['repair'] + self.df['misc']).std()),
-            'cash_flow_volatility': float((self.df['rent'] - self.df['management_fee'] - self.df['repair'] - self.df['misc']).std())
+            'management_fee_volatility': float(stats['management_fee_std']),
+            'repair_cost_volatility': float(stats['repair_std']),
+            'total_cost_volatility': float(stats['total_costs_std']),
+            'cash_flow_volatility': float(stats['cash_flow_std'])
         }
         
         # Concentration risk
-        property_concentration = self.df['property_alias'].value_counts(normalize=True)
+        property_concentration = stats['property_shares']
         risk['concentration_risk'] = {
             'largest_property_share': float(property_concentration.iloc[0] * 100),
             'top_2_properties_share': float(property_concentration.iloc[:2].sum() * 100),
@@ -288,14 +526,66 @@ class RentalPropertyAnalyzer:
         if self.df is None:
             return {}
         
-        predictive = {}
+        # Trend analysis over the shared date-sorted view
+        date_sorted = self._derived_value('date_sorted')
+        x = np.arange(len(date_sorted))
         
-        # Trend analysis
-        self.df_sorted = self.df.sort_values('statement_date')
+        # Least-squares slopes per statement (in date order); undefined for a single statement
+        trends = {}
+        if len(date_sorted) > 1:
+            trends['rent'] = np.polyfit(x, date_sorted['rent'], 1)[0]
+            trends['total_costs'] = np.polyfit(x, date_sorted['total_costs'], 1)[0]
+            trends['cash_flow'] = np.polyfit(x, date_sorted['cash_flow'], 1)[0]
+        
+        predictive = self.predictive_from_trends(trends, date_sorted['rent'].iloc[-1], date_sorted['total_costs'].iloc[-1])
+        predictive['property_trends'] = self.property_trends_from_sums(self._derived_value('trend_sums'))
+        return predictive
+    
+    @classmethod
+    def property_trends_from_sums(cls, sums: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+        """
+        Fit rent, cost and cash flow against time (months) for every property
+        at once, by closed-form least squares over the per-property moment sums
+        (aggregates.TREND_COLUMNS plus last_statement). Forecasts are the fitted
+        lines one month after each property's last statement. Properties with
+        fewer than two statement dates have no trend and are left out.
+        """
+        n = sums['trend_count']
+        mean_x = sums['trend_x_sum'] / n
+        sxx = sums['trend_x_sumsq'] - sums['trend_x_sum'] * mean_x
+        # Distinct dates are at least a day (~0.03 months) apart; anything smaller is rounding
+        fitted = sums[(n > 1) & (sxx > sums['trend_x_sumsq'] * 1e-12)].index
+        next_x = trend_months(sums['last_statement']) + 1
+        
+        slopes, forecasts = {}, {}
+        for col in ['rent', 'total_costs']:
+            y_sum = sums[f'trend_{col}_sum']
+            slopes[col] = (sums[f'trend_{col}_xy_sum'] - y_sum * mean_x) / sxx
+            forecasts[col] = y_sum / n + slopes[col] * (next_x - mean_x)
+        
+        trends = pd.DataFrame({
+            'rent_monthly_change': slopes['rent'],
+            'cost_monthly_change': slopes['total_costs'],
+            'cash_flow_monthly_change': slopes['rent'] - slopes['total_costs'],
+            'next_month_rent_forecast': forecasts['rent'],
+            'next_month_costs_forecast': forecasts['total_costs'],
+            'next_month_cash_flow_forecast': forecasts['rent'] - forecasts['total_costs'],
+        }).loc[fitted]
+        return cls._rows_as_float_dicts(trends)
+    
+    @staticmethod
+    def predictive_from_trends(trends: Dict[str, float], last_month_rent: float,
+                               last_month_costs: float) -> Dict[str, Any]:
+        """
+        Derive trend and forecast metrics from the rent, total_costs and
+        cash_flow slopes (empty if there is no trend) and the latest
+        statement's rent and total costs.
+        """
+        predictive = {}
         
         # Rent trend
-        if len(self.df_sorted) > 1:
-            rent_trend = np.polyfit(range(len(self.df_sorted)), self.df_sorted['rent'], 1)[0]
+        if 'rent' in trends:
+            rent_trend = trends['rent']
             predictive['rent_trend'] = {
                 'monthly_change': float(rent_trend),
                 'annual_projection': float(rent_trend * 12),
@@ -303,9 +593,8 @@ class RentalPropertyAnalyzer:
             }
         
         # Cost trend
-        total_costs = self.df_sorted['management_fee'] + self.df_sorted['repair'] + self.df_sorted['misc']
-        if len(self.df_sorted) > 1:
-            cost_trend = np.polyfit(range(len(self.df_sorted)), total_costs, 1)[0]
+        if 'total_costs' in trends:
+            cost_trend = trends['total_costs']
             predictive['cost_trend'] = {
                 'monthly_change': float(cost_trend),
                 'annual_projection': float(cost_trend * 12),
@@ -313,9 +602,8 @@ class RentalPropertyAnalyzer:
             }
         
         # Cash flow trend
-        cash_flow = self.df_sorted['rent'] - total_costs
-        if len(self.df_sorted) > 1:
-            cash_flow_trend = np.polyfit(range(len(self.df_sorted)), cash_flow, 1)[0]
+        if 'cash_flow' in trends:
+            cash_flow_trend = trends['cash_flow']
             predictive['cash_flow_trend'] = {
                 'monthly_change': float(cash_flow_trend),
                 'annual_projection': float(cash_flow_trend * 12),
@@ -323,9 +611,6 @@ class RentalPropertyAnalyzer:
             }
         
         # Forecasting
-        last_month_rent = self.df_sorted['rent'].iloc[-1]
-        last_month_costs = total_costs.iloc[-1]
-        
         predictive['forecasts'] = {
             'next_month_rent_forecast': float(last_month_rent + predictive.get('rent_trend', {}).get('monthly_change', 0)),
             'next_month_costs_forecast': float(last_month_costs + predictive.get('cost_trend', {}).get('monthly_change', 0)),
@@ -335,28 +620,60 @@ class RentalPropertyAnalyzer:
         
         return predictive
     
+    def _input_hash(self) -> Optional[str]:
+        # Result cache key of data_path; None disables caching (no cache, or unreadable file)
+        if self.result_cache is None:
+            return None
+        try:
+            return self.result_cache.input_hash(self.data_path)
+        except OSError:
+            return None
+    
+    def _section(self, section: str, input_hash: Optional[str]) -> Optional[Dict[str, Any]]:
+        """One section from the result cache or computed; None if the data cannot be loaded."""
+        if input_hash is not None:
+            entry = self.result_cache.get(input_hash, ANALYSIS_VERSION, section)
+            if entry is not None:
+                self.record_count = entry['records']
+                return entry['result']
+        
+        # Load data on the first miss (only the columns the sections read)
+        if self.df is None and self.load_data(columns=ANALYSIS_COLUMNS) is None:
+            return None
+        result = getattr(self, SECTION_METHODS[section])()
+        self.record_count = len(self.df)
+        if input_hash is not None:
+            self.result_cache.put(input_hash, ANALYSIS_VERSION, section, self.record_count, result)
+        return result
+    
+    def compute_section(self, section: str) -> Dict[str, Any]:
+        """
+        Return one result section by name (a SECTION_METHODS key). With the
+        result cache on, a section already computed for the current contents
+        of data_path is returned without loading the data.
+        """
+        return self._section(section, self._input_hash()) or {}
+    
     def run_complete_analysis(self) -> Dict[str, Any]:
         """Run complete business analysis and return all metrics."""
         print("Starting comprehensive business analysis...")
         
-        # Load data
-        if self.load_data() is None:
-            return {}
+        # Compute all metrics, serving unchanged inputs from the result cache
+        input_hash = self._input_hash()
+        sections = {}
+        for section in SECTION_METHODS:
+            sections[section] = self._section(section, input_hash)
+            if sections[section] is None:
+                return {}
         
-        # Compute all metrics
         self.results = {
             'analysis_metadata': {
                 'generated_at': datetime.now().isoformat(),
                 'data_source': self.data_path,
-                'total_records': len(self.df),
-                'analysis_version': '1.0'
+                'total_records': self.record_count,
+                'analysis_version': ANALYSIS_VERSION
             },
-            'property_kpis': self.compute_property_kpis(),
-            'portfolio_metrics': self.compute_portfolio_metrics(),
-            'seasonal_analysis': self.compute_seasonal_analysis(),
-            'cost_optimization': self.compute_cost_optimization_opportunities(),
-            'risk_metrics': self.compute_risk_metrics(),
-            'predictive_metrics': self.compute_predictive_metrics()
+            **sections
         }
         
         print("Analysis complete!")
@@ -404,11 +721,31 @@ class RentalPropertyAnalyzer:
 
 def main():
     """Main function to run the analysis."""
-    analyzer = RentalPropertyAnalyzer()
+    parser = argparse.ArgumentParser(description="Rental property business analysis")
+    parser.add_argument("--data", default="code/sample-data/rental-statements/labels.csv",
+                       help="Statement CSV (labels.csv format) or typed .arrow/.feather/.parquet file")
+    parser.add_argument("--output", help="Results JSON (default: business_analysis_results.json next to this script)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                       help="Directory for the typed load cache of converted CSVs")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Parse the CSV and recompute every section instead of using the caches")
+    parser.add_argument("--refresh", nargs="*", choices=list(SECTION_METHODS), metavar="SECTION",
+                       help="Drop cached results of these sections (all sections if none given) before running")
+    
+    args = parser.parse_args()
+    
+    if args.no_cache:
+        analyzer = RentalPropertyAnalyzer(args.data)
+    else:
+        analyzer = RentalPropertyAnalyzer(args.data, cache_dir=args.cache_dir,
+                                          result_cache_dir=os.path.join(args.cache_dir, RESULTS_SUBDIR))
+    if args.refresh is not None and analyzer.result_cache is not None:
+        removed = analyzer.result_cache.invalidate(args.refresh or None)
+        print(f"Dropped {removed} cached section results")
     results = analyzer.run_complete_analysis()
     
     if results:
-        analyzer.save_results()
+        analyzer.save_results(args.output)
         analyzer.print_summary()
         return results
     else:
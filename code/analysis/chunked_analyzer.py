@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Out-of-core Business Analysis for Rental Property Data
+Streams the statement file in bounded chunks and folds each chunk into
+mergeable aggregates (StatementAggregates, a rent histogram and per-date
+totals), so memory depends on the number of properties and statement dates
+rather than on the number of rows. Every section of RentalPropertyAnalyzer
+is produced with the same JSON layout; the rent lower quartile behind
+low_rent_statements is exact, found with a second pass over the file.
+"""
+
+import argparse
+import os
+import sys
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+# Ensure local imports work regardless of CWD
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.insert(0, CURRENT_DIR)
+
+from aggregate_analyzer import LOW_RENT_QUANTILE, AggregateRentalAnalyzer, date_keys, interpolate, quantile_ranks
+from aggregates import StatementAggregates
+from business_analyzer import ANALYSIS_COLUMNS
+from typed_cache import TYPED_EXTENSIONS, iter_typed_batches
+
+
+DEFAULT_CHUNKSIZE = 100_000
+
+# Rent histogram buckets: the top bits of an order-preserving uint64 key of each float64
+HISTOGRAM_BITS = 20
+SIGN_BIT = np.uint64(1 << 63)
+
+
+def _sortable_keys(values: np.ndarray) -> np.ndarray:
+    """Map float64 values to uint64 keys with the same order (no NaNs)."""
+    bits = (values + 0.0).view(np.uint64)  # + 0.0 folds -0.0 into 0.0
+    return np.where(bits & SIGN_BIT, ~bits, bits | SIGN_BIT)
+
+
+class ChunkedRentalAnalyzer(AggregateRentalAnalyzer):
+    """
+    Rental property analyzer for statement files larger than memory.
+    Fills the AggregateRentalAnalyzer state chunk by chunk; see there for how
+    results compare with RentalPropertyAnalyzer.
+    """
+
+    mode = 'chunked'
+
+    def __init__(self, data_path: str = "code/sample-data/rental-statements/labels.csv",
+                 chunksize: int = DEFAULT_CHUNKSIZE):
+        """Initialize analyzer with data path and the number of rows per chunk."""
+        super().__init__(data_path)
+        self.chunksize = chunksize
+        self.rent_histogram = np.zeros(1 << HISTOGRAM_BITS, dtype=np.int64)
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Yield the analysis columns of data_path as typed frames of at most chunksize rows."""
+        if self.data_path.endswith(TYPED_EXTENSIONS):
+            for chunk in iter_typed_batches(self.data_path, ANALYSIS_COLUMNS, self.chunksize):
+                yield self.prepare_statements(chunk)
+            return
+        # Skip the first row which contains column headers
+        with pd.read_csv(self.data_path, skiprows=1, usecols=lambda col: col in ANALYSIS_COLUMNS,
+                         chunksize=self.chunksize) as reader:
+            for chunk in reader:
+                yield self.prepare_statements(chunk)
+
+    def _fold_chunk(self, chunk: pd.DataFrame):
+        """First pass: merge one chunk into the aggregates, rent histogram and date blocks."""
+        self.aggregates = self.aggregates.merge(StatementAggregates.from_statements(chunk))
+
+        rent = chunk['rent'].to_numpy(dtype=float)
+        rent = rent[~np.isnan(rent)]
+        buckets = (_sortable_keys(rent) >> np.uint64(64 - HISTOGRAM_BITS)).astype(np.intp)
+        self.rent_histogram += np.bincount(buckets, minlength=len(self.rent_histogram))
+
+        total_costs = chunk['management_fee'] + chunk['repair'] + chunk['misc']
+        values = pd.DataFrame({'rent': chunk['rent'], 'total_costs': total_costs,
+                               'cash_flow': chunk['rent'] - total_costs})
+        dates = date_keys(chunk['statement_date'])
+        blocks = values.groupby(dates).sum().assign(statement_count=values.groupby(dates).size())
+        self.date_blocks = self.date_blocks.add(blocks, fill_value=0)
+
+        # Latest-dated row, later rows (and chunks) winning ties
+        if len(dates):
+            latest = dates.max()
+            if self.last_statement is None or latest >= self.last_statement[0]:
+                row = np.flatnonzero(dates == latest)[-1]
+                self.last_statement = (latest, values['rent'].iat[row], values['total_costs'].iat[row])
+
+    def _count_low_rent(self) -> int:
+        """
+        Second pass: statements with rent below the lower quartile.
+        Only rents in the histogram buckets holding the two order statistics
+        are collected, so the quartile is exact without sorting every rent.
+        """
+        if not self.aggregates.portfolio['rent_count']:
+            return 0
+        lower, upper, weight = quantile_ranks(self.aggregates.portfolio['rent_count'], LOW_RENT_QUANTILE)
+        cumulative = np.cumsum(self.rent_histogram)
+        first_bucket, last_bucket = np.searchsorted(cumulative, [lower, upper], side='right')
+        below = int(cumulative[first_bucket - 1]) if first_bucket else 0
+
+        in_buckets = pd.Series(dtype=np.int64)
+        for chunk in self.iter_chunks():
+            rent = chunk['rent'].to_numpy(dtype=float)
+            rent = rent[~np.isnan(rent)] + 0.0
+            buckets = _sortable_keys(rent) >> np.uint64(64 - HISTOGRAM_BITS)
+            selected = rent[(buckets >= first_bucket) & (buckets <= last_bucket)]
+            in_buckets = in_buckets.add(pd.Series(selected).value_counts(), fill_value=0)
+
+        in_buckets = in_buckets.sort_index()
+        ranks = below + np.cumsum(in_buckets.to_numpy()) - 1  # rank of each value's last copy
+        values = in_buckets.index.to_numpy()
+        lower_value = values[np.searchsorted(ranks, lower)]
+        upper_value = values[np.searchsorted(ranks, upper)]
+        quantile = interpolate(lower_value, upper_value, weight)
+        return below + int(in_buckets[in_buckets.index < quantile].sum())
+
+    def aggregate(self) -> int:
+        """Stream data_path twice (aggregates, then the rent quartile); returns the statement count."""
+        for chunk in self.iter_chunks():
+            self._fold_chunk(chunk)
+        self.date_blocks = self.date_blocks.sort_index()
+        self.low_rent_statements = self._count_low_rent()
+        total = self.aggregates.portfolio['statement_count']
+        print(f"Aggregated {total} records from {self.data_path} in chunks of {self.chunksize}")
+        return total
+
+
+def main():
+    """Run the chunked analysis and save the results."""
+    parser = argparse.ArgumentParser(description="Out-of-core rental property business analysis")
+    parser.add_argument("--data", default="code/sample-data/rental-statements/labels.csv",
+                       help="Statement CSV (labels.csv format) or .arrow/.feather/.parquet file")
+    parser.add_argument("--output", help="Results JSON (default: business_analysis_results.json next to this script)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Rows per chunk")
+
+    args = parser.parse_args()
+
+    analyzer = ChunkedRentalAnalyzer(args.data, args.chunksize)
+    results = analyzer.run_complete_analysis()
+    if not results:
+        print("Analysis failed. Check data file.")
+        return None
+    analyzer.save_results(args.output)
+    analyzer.print_summary()
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,13 @@ if CURRENT_DIR not in sys.path:
     sys.path.insert(0, CURRENT_DIR)
 
 from business_analyzer import RentalPropertyAnalyzer
+from result_cache import RESULTS_SUBDIR
+from typed_cache import DEFAULT_CACHE_DIR
+
+DATA_PATH = 'code/sample-data/rental-statements/labels.csv'
+
+# Sections computed by one example are served to the next from this cache while labels.csv is unchanged
+RESULT_CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, RESULTS_SUBDIR)
 
 
 def example_basic_analysis():
@@ -22,7 +29,7 @@ def example_basic_analysis():
     print("EXAMPLE 1: Basic Analysis")
     print("="*60)
     
-    analyzer = RentalPropertyAnalyzer('code/sample-data/rental-statements/labels.csv')
+    analyzer = RentalPropertyAnalyzer(DATA_PATH, result_cache_dir=RESULT_CACHE_DIR)
     results = analyzer.run_complete_analysis()
     
     if results:
@@ -38,10 +45,8 @@ def example_property_comparison():
     print("EXAMPLE 2: Property Performance Comparison")
     print("="*60)
     
-    analyzer = RentalPropertyAnalyzer('code/sample-data/rental-statements/labels.csv')
-    analyzer.load_data()
-    
-    property_kpis = analyzer.compute_property_kpis()
+    analyzer = RentalPropertyAnalyzer(DATA_PATH, result_cache_dir=RESULT_CACHE_DIR)
+    property_kpis = analyzer.compute_section('property_kpis')
     
     print("Property Performance Ranking:")
     print("-" * 40)
@@ -68,10 +73,8 @@ def example_cost_optimization():
     print("EXAMPLE 3: Cost Optimization Opportunities")
     print("="*60)
     
-    analyzer = RentalPropertyAnalyzer('code/sample-data/rental-statements/labels.csv')
-    analyzer.load_data()
-    
-    optimization = analyzer.compute_cost_optimization_opportunities()
+    analyzer = RentalPropertyAnalyzer(DATA_PATH, result_cache_dir=RESULT_CACHE_DIR)
+    optimization = analyzer.compute_section('cost_optimization')
     
     print("Management Fee Optimization:")
     print("-" * 30)
@@ -96,10 +99,8 @@ def example_risk_assessment():
     print("EXAMPLE 4: Risk Assessment")
     print("="*60)
     
-    analyzer = RentalPropertyAnalyzer('code/sample-data/rental-statements/labels.csv')
-    analyzer.load_data()
-    
-    risk = analyzer.compute_risk_metrics()
+    analyzer = RentalPropertyAnalyzer(DATA_PATH, result_cache_dir=RESULT_CACHE_DIR)
+    risk = analyzer.compute_section('risk_metrics')
     
     print("Portfolio Risk Analysis:")
     print("-" * 25)
@@ -128,10 +129,8 @@ def example_predictive_analytics():
     print("EXAMPLE 5: Predictive Analytics")
     print("="*60)
     
-    analyzer = RentalPropertyAnalyzer('code/sample-data/rental-statements/labels.csv')
-    analyzer.load_data()
-    
-    predictive = analyzer.compute_predictive_metrics()
+    analyzer = RentalPropertyAnalyzer(DATA_PATH, result_cache_dir=RESULT_CACHE_DIR)
+    predictive = analyzer.compute_section('predictive_metrics')
     
     print("Trend Analysis:")
     print("-" * 15)
@@ -171,10 +170,8 @@ def example_seasonal_analysis():
     print("EXAMPLE 6: Seasonal Analysis")
     print("="*60)
     
-    analyzer = RentalPropertyAnalyzer('code/sample-data/rental-statements/labels.csv')
-    analyzer.load_data()
-    
-    seasonal = analyzer.compute_seasonal_analysis()
+    analyzer = RentalPropertyAnalyzer(DATA_PATH, result_cache_dir=RESULT_CACHE_DIR)
+    seasonal = analyzer.compute_section('seasonal_analysis')
     
     print("Seasonal Patterns:")
     print("-" * 18)
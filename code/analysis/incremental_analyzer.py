@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Incremental Business Analysis for Rental Property Data
+Keeps mergeable per-property, per-month and portfolio aggregates (counts,
+sums, sums of squares, first/last statement dates) in a JSON state file,
+so statements appended to labels.csv are folded in without re-reading the
+history. KPIs, portfolio metrics, seasonal tables and cost optimization are
+derived from the aggregates by AggregateRentalAnalyzer, as in the chunked and
+database modes.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+# Ensure local imports work regardless of CWD
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.insert(0, CURRENT_DIR)
+
+from aggregate_analyzer import AggregateRentalAnalyzer
+from aggregates import StatementAggregates
+
+
+# Bump when the state layout changes; older state files are rebuilt
+STATE_VERSION = 5
+
+# Bytes just before the processed offset that must be unchanged for an append-only update
+TAIL_WINDOW_BYTES = 4096
+
+
+class IncrementalRentalAnalyzer(AggregateRentalAnalyzer):
+    """
+    Rental property analyzer that folds new statements into persisted aggregates.
+    The first update reads the whole file; later updates parse only the rows
+    appended since (tracked by byte offset), in time proportional to the new
+    rows. Whether the file only grew is judged from its size and mtime and the
+    SHA-256 of the TAIL_WINDOW_BYTES before the offset; a file rewritten
+    without growing, or changed in that window, is re-aggregated from scratch.
+    An edit further back made together with an append is not detected; use
+    update(rebuild=True) (--rebuild) after editing earlier rows.
+
+    Only complete lines are folded into the persisted aggregates: a last line
+    without its newline may still be being written, so it is counted in the
+    results of this update only and read again by the next. Risk and
+    predictive metrics need the full history and are not available in this
+    mode.
+    """
+
+    mode = 'incremental'
+    sections = ('property_kpis', 'portfolio_metrics', 'seasonal_analysis', 'cost_optimization')
+
+    def __init__(self, data_path: str = "code/sample-data/rental-statements/labels.csv",
+                 state_path: Optional[str] = None):
+        """Initialize analyzer with data path and aggregate state path."""
+        super().__init__(data_path)
+        self.state_path = state_path or f"{data_path}.analysis-state.json"
+        # Aggregates of the complete lines (persisted); self.aggregates adds an unterminated last line
+        self.line_aggregates = StatementAggregates.empty()
+        self.columns = None
+        self.offset = 0
+        self.size = 0
+        self.mtime_ns = 0
+        self.tail_hash = ''
+
+    def load_state(self) -> bool:
+        """Load persisted aggregates; returns False if there is no usable state file."""
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if state.get('state_version') != STATE_VERSION:
+            return False
+        self.line_aggregates = StatementAggregates.from_dict(state['aggregates'])
+        self.aggregates = self.line_aggregates
+        self.columns = state['source']['columns']
+        self.offset = state['source']['offset']
+        self.size = state['source']['size']
+        self.mtime_ns = state['source']['mtime_ns']
+        self.tail_hash = state['source']['tail_hash']
+        return True
+
+    def save_state(self):
+        """Persist aggregates and the processed source position."""
+        state = {
+            'state_version': STATE_VERSION,
+            'source': {
+                'path': self.data_path,
+                'columns': self.columns,
+                'offset': self.offset,
+                'size': self.size,
+                'mtime_ns': self.mtime_ns,
+                'tail_hash': self.tail_hash,
+            },
+            'aggregates': self.line_aggregates.to_dict(),
+        }
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def _tail_hash(self, offset: int) -> str:
+        """SHA-256 of the TAIL_WINDOW_BYTES of data_path before offset."""
+        start = max(0, offset - TAIL_WINDOW_BYTES)
+        with open(self.data_path, 'rb') as f:
+            f.seek(start)
+            return hashlib.sha256(f.read(offset - start)).hexdigest()
+
+    def _source_appended(self) -> bool:
+        """True if data_path is unchanged or only grew since the state was saved."""
+        if self.columns is None:
+            return False
+        st = os.stat(self.data_path)
+        if (st.st_size, st.st_mtime_ns) == (self.size, self.mtime_ns):
+            return True
+        if st.st_size <= self.size:
+            # Rewritten in place or truncated
+            return False
+        return self._tail_hash(self.offset) == self.tail_hash
+
+    def append_statements(self, rows: pd.DataFrame) -> int:
+        """Fold statement rows (raw CSV columns or typed) into the persisted aggregates."""
+        rows = self.prepare_statements(rows)
+        if len(rows):
+            self.line_aggregates = self.line_aggregates.merge(StatementAggregates.from_statements(rows))
+        self.aggregates = self.line_aggregates
+        return len(rows)
+
+    def _read_rows(self, data: bytes) -> pd.DataFrame:
+        """Parse header-less CSV rows with the file's columns."""
+        if not data.strip():
+            return pd.DataFrame(columns=self.columns)
+        return pd.read_csv(io.BytesIO(data), header=None, names=self.columns)
+
+    def update(self, rebuild: bool = False) -> int:
+        """
+        Fold in statements appended to data_path since the last update.
+        Returns the number of rows read (all rows when the state is rebuilt).
+        """
+        if not rebuild and self.columns is None:
+            self.load_state()
+        if rebuild or not self._source_appended():
+            self.line_aggregates = StatementAggregates.empty()
+            self.columns = None
+            self.offset = 0
+
+        # Taken before reading, so bytes appended meanwhile make the next update check the tail
+        st = os.stat(self.data_path)
+        with open(self.data_path, 'rb') as f:
+            f.seek(self.offset)
+            new_bytes = f.read()
+
+        # Up to the last newline; the rest may be a row still being written
+        complete = new_bytes[:new_bytes.rfind(b'\n') + 1]
+        if self.columns is None:
+            # Full read, skipping the first row which contains column headers
+            rows = pd.read_csv(io.BytesIO(complete), skiprows=1)
+            self.columns = list(rows.columns)
+        else:
+            rows = self._read_rows(complete)
+
+        added = self.append_statements(rows)
+        self.offset += len(complete)
+        unterminated = self.prepare_statements(self._read_rows(new_bytes[len(complete):]))
+        if len(unterminated):
+            self.aggregates = self.line_aggregates.merge(StatementAggregates.from_statements(unterminated))
+        self.size, self.mtime_ns = st.st_size, st.st_mtime_ns
+        self.tail_hash = self._tail_hash(self.offset)
+        print(f"Folded {added} new records from {self.data_path} "
+              f"({self.aggregates.portfolio['statement_count']} total)")
+        return added
+
+    def aggregate(self, rebuild: bool = False) -> int:
+        """Fold in new statements (all of them if rebuild) and persist the state; returns the statement count."""
+        self.update(rebuild=rebuild)
+        self.save_state()
+        return self.aggregates.portfolio['statement_count']
+
+    def compute_risk_metrics(self) -> Dict[str, Any]:
+        """Not available incrementally: risk metrics need the full statement history."""
+        return {}
+
+    def compute_predictive_metrics(self) -> Dict[str, Any]:
+        """Not available incrementally: predictive metrics need the full statement history."""
+        return {}
+
+
+def main():
+    """Fold new statements into the aggregate state and save the metrics."""
+    parser = argparse.ArgumentParser(description="Incremental rental property business analysis")
+    parser.add_argument("--data", default="code/sample-data/rental-statements/labels.csv",
+                       help="Statement CSV (labels.csv format)")
+    parser.add_argument("--state", help="Aggregate state file (default: <data>.analysis-state.json)")
+    parser.add_argument("--output", help="Results JSON (default: business_analysis_results.json next to this script)")
+    parser.add_argument("--rebuild", action="store_true", help="Discard the state and re-aggregate the whole file")
+
+    args = parser.parse_args()
+
+    analyzer = IncrementalRentalAnalyzer(args.data, args.state)
+    results = analyzer.run_complete_analysis(rebuild=args.rebuild)
+    if not results:
+        print("Analysis failed. Check data file.")
+        return None
+    analyzer.save_results(args.output)
+    analyzer.print_summary()
+    return results
+
+
+if __name__ == "__main__":
+    main()
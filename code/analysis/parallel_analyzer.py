@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Parallel Business Analysis for Rental Property Data
+Runs the per-property aggregation behind the KPI and cost optimization
+sections in a process pool. The statement columns are written once, grouped
+by property, into a shared memory block; each worker attaches to it and
+aggregates a contiguous range of properties, so no DataFrame is pickled on
+the way in and only the small per-property results come back.
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Ensure local imports work regardless of CWD
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.insert(0, CURRENT_DIR)
+
+from business_analyzer import RentalPropertyAnalyzer
+from typed_cache import DEFAULT_CACHE_DIR
+
+
+# Below this many statements the pool start-up costs more than it saves
+PARALLEL_MIN_ROWS = 100_000
+
+# Property ranges per worker; more than one evens out unequal ranges
+SHARDS_PER_WORKER = 4
+
+# Columns shipped to the workers (property_alias goes as integer codes)
+SHARED_COLUMNS = ['statement_date', 'rent', 'management_fee', 'repair', 'misc', 'deposit']
+
+# (column, dtype, byte offset) of each array in the shared block
+Layout = List[Tuple[str, str, int]]
+
+
+def _aggregate_shard(shm_name: str, layout: Layout, rows: int, start: int, stop: int) -> pd.DataFrame:
+    """Worker: aggregate rows start:stop (whole properties) of the shared columns."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        data = {}
+        for col, dtype, offset in layout:
+            column = np.ndarray(rows, dtype=dtype, buffer=shm.buf, offset=offset)
+            data[col] = column[start:stop].copy()
+    finally:
+        shm.close()
+    data['zero_rent'] = data['rent'] == 0
+    return RentalPropertyAnalyzer.aggregate_properties(pd.DataFrame(data))
+
+
+class ParallelRentalAnalyzer(RentalPropertyAnalyzer):
+    """
+    Rental property analyzer that aggregates properties in worker processes.
+    Each property is aggregated whole by one worker over its rows in file
+    order, so results are identical to the serial analyzer. Frames smaller
+    than PARALLEL_MIN_ROWS (or workers=1) take the serial path.
+    """
+
+    def __init__(self, data_path: str = "code/sample-data/rental-statements/labels.csv",
+                 cache_dir: Optional[str] = None, workers: Optional[int] = None,
+                 min_rows: int = PARALLEL_MIN_ROWS):
+        """Initialize analyzer; workers defaults to the CPU count."""
+        super().__init__(data_path, cache_dir=cache_dir)
+        self.workers = workers or os.cpu_count() or 1
+        self.min_rows = min_rows
+
+    def _shard_bounds(self, group_starts: np.ndarray, rows: int) -> List[Tuple[int, int]]:
+        """Split rows into about workers * SHARDS_PER_WORKER ranges on property boundaries."""
+        shards = self.workers * SHARDS_PER_WORKER
+        starts = np.append(group_starts, rows)
+        cuts = starts[np.searchsorted(starts, np.arange(1, shards) * rows // shards)]
+        bounds = np.unique(np.concatenate([[starts[0]], cuts, [rows]]))
+        return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:])]
+
+    def _build_property_aggregates(self) -> pd.DataFrame:
+        """Per-property statistics, aggregated by a process pool over shared columns."""
+        if self.workers <= 1 or len(self.df) < self.min_rows:
+            return super()._build_property_aggregates()
+
+        # Integer codes in sorted alias order; a stable sort keeps each property's rows in file order
+        codes, aliases = pd.factorize(self.df['property_alias'], sort=True)
+        order = np.argsort(codes, kind='stable')
+        codes = codes[order]
+        group_starts = np.flatnonzero(np.diff(codes, prepend=-2))
+        group_starts = group_starts[codes[group_starts] >= 0]  # NaN aliases are not grouped
+        if not len(group_starts):
+            return super()._build_property_aggregates()
+
+        arrays: Dict[str, np.ndarray] = {'property_alias': codes}
+        for col in SHARED_COLUMNS:
+            arrays[col] = self.df[col].to_numpy()[order]
+        layout, offset = [], 0
+        for col, values in arrays.items():
+            layout.append((col, values.dtype.str, offset))
+            offset += values.nbytes
+
+        shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        try:
+            for (col, dtype, start), values in zip(layout, arrays.values()):
+                np.ndarray(len(values), dtype=dtype, buffer=shm.buf, offset=start)[:] = values
+            del arrays
+            bounds = self._shard_bounds(group_starts, len(codes))
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(bounds))) as pool:
+                parts = list(pool.map(_aggregate_shard, *zip(*[
+                    (shm.name, layout, len(codes), start, stop) for start, stop in bounds])))
+        finally:
+            shm.close()
+            shm.unlink()
+
+        agg = pd.concat(parts)
+        agg.index = pd.Index(aliases.take(agg.index), name='property_alias')
+        return agg
+
+
+def main():
+    """Run the analysis with per-property work spread over a process pool."""
+    parser = argparse.ArgumentParser(description="Parallel rental property business analysis")
+    parser.add_argument("--data", default="code/sample-data/rental-statements/labels.csv",
+                       help="Statement CSV (labels.csv format) or typed .arrow/.feather/.parquet file")
+    parser.add_argument("--output", help="Results JSON (default: business_analysis_results.json next to this script)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                       help="Directory for the typed load cache of converted CSVs")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Parse the CSV on every run instead of using the typed load cache")
+
+    args = parser.parse_args()
+
+    analyzer = ParallelRentalAnalyzer(args.data, cache_dir=None if args.no_cache else args.cache_dir,
+                                      workers=args.workers)
+    results = analyzer.run_complete_analysis()
+    if not results:
+        print("Analysis failed. Check data file.")
+        return None
+    analyzer.save_results(args.output)
+    analyzer.print_summary()
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Persistent result cache for the Business Analysis Engine.
+Each analysis section is stored as its own JSON file, keyed by the SHA-256
+of the input file, the analysis version and the section name, so a repeat
+request for unchanged data is answered without loading or recomputing, and
+sections can be invalidated one at a time.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import shutil
+from typing import Any, Iterable, Optional
+
+from typed_cache import hash_file
+
+
+# Results live under <cache_dir>/results when sharing the typed load cache directory
+RESULTS_SUBDIR = "results"
+
+
+class ResultCache:
+    """
+    Section results on disk: <cache_dir>/<input sha256>/<analysis version>/<section>.json.
+
+    Input hashes are memoized per source path with its size and mtime, so an
+    unchanged file is not re-read to find its key.
+    """
+
+    def __init__(self, cache_dir: str):
+        """Initialize cache rooted at cache_dir."""
+        self.cache_dir = cache_dir
+
+    def _write_json(self, path: str, data: Any) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def _read_json(self, path: str) -> Optional[Any]:
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def input_hash(self, source: str) -> str:
+        """SHA-256 of source's contents, re-hashed only when its size or mtime changes."""
+        key = hashlib.sha256(os.path.abspath(source).encode("utf-8")).hexdigest()[:32]
+        memo_path = os.path.join(self.cache_dir, "sources", key + ".json")
+        st = os.stat(source)
+        memo = self._read_json(memo_path)
+        if memo and memo.get("size") == st.st_size and memo.get("mtime_ns") == st.st_mtime_ns:
+            return memo["sha256"]
+        sha256 = hash_file(source)
+        self._write_json(memo_path, {"source": os.path.abspath(source), "sha256": sha256,
+                                     "size": st.st_size, "mtime_ns": st.st_mtime_ns})
+        return sha256
+
+    def _entry_path(self, input_hash: str, version: str, section: str) -> str:
+        return os.path.join(self.cache_dir, input_hash, version, section + ".json")
+
+    def get(self, input_hash: str, version: str, section: str) -> Optional[dict]:
+        """Cached entry ({'records': n, 'result': ...}) for the section, or None."""
+        return self._read_json(self._entry_path(input_hash, version, section))
+
+    def put(self, input_hash: str, version: str, section: str, records: int, result: Any) -> None:
+        """Store a section result computed from records statements."""
+        self._write_json(self._entry_path(input_hash, version, section),
+                         {"records": records, "result": result})
+
+    def invalidate(self, sections: Optional[Iterable[str]] = None) -> int:
+        """Remove the cached sections (all results if None) for every input; returns entries removed."""
+        if sections is None:
+            removed = len(glob.glob(os.path.join(self.cache_dir, "*", "*", "*.json")))
+            for entry in os.listdir(self.cache_dir) if os.path.isdir(self.cache_dir) else []:
+                if entry != "sources":
+                    shutil.rmtree(os.path.join(self.cache_dir, entry), ignore_errors=True)
+            return removed
+        removed = 0
+        for section in sections:
+            for path in glob.glob(os.path.join(self.cache_dir, "*", "*", section + ".json")):
+                os.remove(path)
+                removed += 1
+        return removed
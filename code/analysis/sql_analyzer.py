@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Database-backed Business Analysis for Rental Property Data
+Analyzes the statement_entries table written by
+AssetManagementAnomalyDetection/scripts/ingest_statement_csv_to_azure.py
+(dbo.statement_entries on Azure SQL, or a local SQLite copy). The
+per-property, per-month, per-date and portfolio counts, sums and sums of
+squares are computed by GROUP BY queries in the database, so only aggregate
+rows are transferred; the sections are then derived exactly as in the
+chunked and incremental modes.
+"""
+
+import argparse
+import os
+import sys
+from typing import Dict, List, Optional
+
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+# Ensure local imports work regardless of CWD
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.insert(0, CURRENT_DIR)
+
+from aggregate_analyzer import LOW_RENT_QUANTILE, AggregateRentalAnalyzer, date_keys, interpolate, quantile_ranks
+from aggregates import AMOUNT_COLUMNS, MONTH_COLUMNS, TREND_AMOUNTS, StatementAggregates
+from business_analyzer import RentalPropertyAnalyzer
+
+
+# statement_entries column for each analysis column (amount1-5 follow the labels.csv column order)
+STATEMENT_ENTRIES_COLUMNS = {
+    'property_alias': 'property_name',
+    'statement_date': 'statement_date',
+    'rent': 'amount1',
+    'management_fee': 'amount2',
+    'repair': 'amount3',
+    'deposit': 'amount4',
+    'misc': 'amount5',
+}
+
+# SQL expressions of the derived per-statement amounts (NULL if any part is NULL, like NaN)
+TOTAL_COSTS_SQL = "(amount2 + amount3 + amount5)"
+DERIVED_COLUMNS_SQL = {'total_costs': TOTAL_COSTS_SQL, 'cash_flow': f"(amount1 - {TOTAL_COSTS_SQL})"}
+
+# Calendar month of statement_date, per SQL dialect
+MONTH_SQL = {
+    'sqlite': "CAST(strftime('%m', statement_date) AS INTEGER)",
+    'mssql': "MONTH(statement_date)",
+}
+
+# statement_date as months since aggregates.TREND_ORIGIN (the trend fit x), per SQL dialect
+TREND_MONTHS_SQL = {
+    'sqlite': "((julianday(statement_date) - julianday('2000-01-01')) / 30.44)",
+    'mssql': "(CAST(DATEDIFF(day, '2000-01-01', statement_date) AS FLOAT) / 30.44)",
+}
+
+# Row window of an ordered query, per SQL dialect
+WINDOW_SQL = {
+    'sqlite': "LIMIT {count} OFFSET {offset}",
+    'mssql': "OFFSET {offset} ROWS FETCH NEXT {count} ROWS ONLY",
+}
+
+# statement_entries as created by the ingest script, for a local SQLite copy
+SQLITE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS statement_entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source_row_id INTEGER NULL,
+    property_name VARCHAR(100) NULL,
+    statement_date DATE NULL,
+    period_start DATE NULL,
+    period_end DATE NULL,
+    amount1 FLOAT NULL,
+    amount2 FLOAT NULL,
+    amount3 FLOAT NULL,
+    amount4 FLOAT NULL,
+    amount5 FLOAT NULL,
+    notes TEXT NULL,
+    balance FLOAT NULL,
+    attachment VARCHAR(255) NULL,
+    raw_csv TEXT NULL
+)
+"""
+
+
+def _column_sql(col: str) -> str:
+    return DERIVED_COLUMNS_SQL.get(col) or STATEMENT_ENTRIES_COLUMNS[col]
+
+
+def _sums_sql(columns: List[str], squares: bool = True) -> str:
+    # COUNT/SUM(/sum of squares) select items per column; empty sums are 0 as in pandas
+    items = []
+    for col in columns:
+        expr = _column_sql(col)
+        items.append(f"COUNT({expr}) AS {col}_count")
+        items.append(f"COALESCE(SUM({expr}), 0) AS {col}_sum")
+        if squares:
+            items.append(f"COALESCE(SUM({expr} * {expr}), 0) AS {col}_sumsq")
+    return ",\n    ".join(items)
+
+
+def _trend_sums_sql(x: str) -> str:
+    # aggregates.TREND_COLUMNS select items, over rows with a date, rent and total costs
+    valid = f"statement_date IS NOT NULL AND amount1 IS NOT NULL AND {TOTAL_COSTS_SQL} IS NOT NULL"
+    items = [f"SUM(CASE WHEN {valid} THEN 1 ELSE 0 END) AS trend_count"]
+    terms = {'x_sum': x, 'x_sumsq': f"{x} * {x}"}
+    for col in TREND_AMOUNTS:
+        terms[f'{col}_sum'] = _column_sql(col)
+        terms[f'{col}_xy_sum'] = f"{x} * {_column_sql(col)}"
+    for name, term in terms.items():
+        items.append(f"COALESCE(SUM(CASE WHEN {valid} THEN {term} END), 0) AS trend_{name}")
+    return ",\n    ".join(items)
+
+
+def import_statements_sqlite(database_url: str, statements: pd.DataFrame) -> int:
+    """
+    Append a typed statement frame (as load_data returns) to the
+    statement_entries table of a SQLite database, creating it if needed.
+    Returns the number of rows written.
+    """
+    engine = create_engine(database_url)
+    rows = pd.DataFrame(index=statements.index)
+    if 'statement_id' in statements.columns:
+        rows['source_row_id'] = statements['statement_id']
+    for col, entries_col in STATEMENT_ENTRIES_COLUMNS.items():
+        rows[entries_col] = statements[col]
+    for col in ['statement_date', 'period_start', 'period_end']:
+        if col in statements.columns:
+            # ISO dates, as the ingest script stores them
+            rows[col] = statements[col].dt.strftime('%Y-%m-%d')
+    with engine.begin() as conn:
+        conn.execute(text(SQLITE_TABLE_SQL))
+        rows.to_sql('statement_entries', conn, if_exists='append', index=False)
+    return len(rows)
+
+
+class SQLRentalAnalyzer(AggregateRentalAnalyzer):
+    """
+    Rental property analyzer over the statement_entries table.
+    Fills the AggregateRentalAnalyzer state with GROUP BY queries (see there
+    for how results compare with RentalPropertyAnalyzer); load_data reads the
+    table's rows for the row-based sections instead.
+    """
+
+    mode = 'sql'
+
+    def __init__(self, database_url: str, table: Optional[str] = None):
+        """Initialize analyzer with a SQLAlchemy database URL and table (default: statement_entries)."""
+        super().__init__(database_url)
+        self.engine = create_engine(database_url)
+        self.dialect = self.engine.dialect.name
+        if self.dialect not in MONTH_SQL:
+            raise ValueError(f"Unsupported database dialect: {self.dialect}")
+        self.table = table or ('dbo.statement_entries' if self.dialect == 'mssql' else 'statement_entries')
+
+    def _query(self, sql: str, **params) -> pd.DataFrame:
+        with self.engine.connect() as conn:
+            return pd.read_sql(text(sql), conn, params=params)
+
+    def load_data(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Load statement rows from the table (in insertion order), renamed to the analysis columns."""
+        try:
+            wanted = [col for col in STATEMENT_ENTRIES_COLUMNS if columns is None or col in columns]
+            select = ", ".join(f"{STATEMENT_ENTRIES_COLUMNS[col]} AS {col}" for col in wanted)
+            self.df = self.prepare_statements(self._query(f"SELECT {select} FROM {self.table} ORDER BY id"))
+            print(f"Loaded {len(self.df)} records from {self.table}")
+            return self.df
+        except Exception as e:
+            print(f"Error loading data: {e}")
+            return None
+
+    def _property_aggregates(self) -> pd.DataFrame:
+        properties = self._query(f"""
+            SELECT property_name AS property_alias,
+                COUNT(*) AS statement_count,
+                SUM(CASE WHEN amount1 = 0 THEN 1 ELSE 0 END) AS zero_rent_count,
+                MIN(statement_date) AS first_statement,
+                MAX(statement_date) AS last_statement,
+                {_sums_sql(AMOUNT_COLUMNS)},
+                {_trend_sums_sql(TREND_MONTHS_SQL[self.dialect])}
+            FROM {self.table}
+            WHERE property_name IS NOT NULL
+            GROUP BY property_name
+        """).set_index('property_alias')
+        for col in ['first_statement', 'last_statement']:
+            properties[col] = pd.to_datetime(properties[col])
+        return properties
+
+    def _month_aggregates(self) -> pd.DataFrame:
+        month = MONTH_SQL[self.dialect]
+        months = self._query(f"""
+            SELECT {month} AS month,
+                {_sums_sql(MONTH_COLUMNS, squares=False)}
+            FROM {self.table}
+            WHERE statement_date IS NOT NULL
+            GROUP BY {month}
+        """).set_index('month')
+        months.index = months.index.astype(int)
+        return months
+
+    def _portfolio_aggregates(self) -> Dict[str, object]:
+        portfolio = self._query(f"""
+            SELECT COUNT(*) AS statement_count,
+                SUM(CASE WHEN amount1 = 0 THEN 1 ELSE 0 END) AS zero_rent_count,
+                MIN(statement_date) AS first_statement,
+                MAX(statement_date) AS last_statement,
+                {_sums_sql(AMOUNT_COLUMNS + list(DERIVED_COLUMNS_SQL))}
+            FROM {self.table}
+        """).iloc[0].to_dict()
+        for key, value in portfolio.items():
+            if key in ('first_statement', 'last_statement'):
+                portfolio[key] = pd.Timestamp(value) if value is not None else pd.NaT
+            elif key.endswith('_count'):
+                portfolio[key] = int(value or 0)
+            else:
+                portfolio[key] = float(value or 0.0)
+        return portfolio
+
+    def _date_blocks(self) -> pd.DataFrame:
+        totals = ", ".join(f"COALESCE(SUM({_column_sql(col)}), 0) AS {col}"
+                           for col in ['rent', 'total_costs', 'cash_flow'])
+        blocks = self._query(f"""
+            SELECT statement_date, COUNT(*) AS statement_count, {totals}
+            FROM {self.table}
+            GROUP BY statement_date
+        """)
+        blocks.index = date_keys(pd.to_datetime(blocks.pop('statement_date')))
+        return blocks.astype(float).sort_index()
+
+    def _last_statement(self):
+        window = WINDOW_SQL[self.dialect].format(count=1, offset=0)
+        last = self._query(f"""
+            SELECT statement_date, amount1 AS rent, {TOTAL_COSTS_SQL} AS total_costs
+            FROM {self.table}
+            ORDER BY CASE WHEN statement_date IS NULL THEN 1 ELSE 0 END DESC, statement_date DESC, id DESC
+            {window}
+        """)
+        if not len(last):
+            return None
+        key = date_keys(pd.to_datetime(last['statement_date']))[0]
+        rent, total_costs = last[['rent', 'total_costs']].astype(float).iloc[0]
+        return key, rent, total_costs
+
+    def _count_low_rent(self) -> int:
+        """Statements with rent below the lower quartile, found with an ordered window and a count."""
+        n = self.aggregates.portfolio['rent_count']
+        if not n:
+            return 0
+        lower, upper, weight = quantile_ranks(n, LOW_RENT_QUANTILE)
+        window = WINDOW_SQL[self.dialect].format(count=upper - lower + 1, offset=lower)
+        bounds = self._query(f"""
+            SELECT amount1 AS rent FROM {self.table}
+            WHERE amount1 IS NOT NULL
+            ORDER BY amount1
+            {window}
+        """)['rent'].to_numpy(dtype=float)
+        quantile = interpolate(bounds[0], bounds[-1], weight)
+        return int(self._query(f"SELECT COUNT(*) AS n FROM {self.table} WHERE amount1 < :q",
+                               q=float(quantile))['n'].iloc[0])
+
+    def aggregate(self) -> int:
+        """Run the aggregate queries; returns the statement count."""
+        self.aggregates = StatementAggregates(self._property_aggregates(), self._month_aggregates(),
+                                              self._portfolio_aggregates())
+        self.date_blocks = self._date_blocks()
+        self.last_statement = self._last_statement()
+        self.low_rent_statements = self._count_low_rent()
+        total = self.aggregates.portfolio['statement_count']
+        print(f"Aggregated {total} records from {self.table} in the database")
+        return total
+
+
+def main():
+    """Run the database-backed analysis and save the results."""
+    parser = argparse.ArgumentParser(description="Rental property business analysis over statement_entries")
+    parser.add_argument("--database", required=True,
+                       help="SQLAlchemy URL, e.g. sqlite:///statements.db or the Azure SQL mssql+pyodbc URL")
+    parser.add_argument("--table", help="Statement table (default: statement_entries, dbo.statement_entries on SQL Server)")
+    parser.add_argument("--import-csv", metavar="CSV",
+                       help="First append this labels.csv-format file to a SQLite statement_entries table")
+    parser.add_argument("--output", help="Results JSON (default: business_analysis_results.json next to this script)")
+
+    args = parser.parse_args()
+
+    if args.import_csv:
+        statements = RentalPropertyAnalyzer(args.import_csv).load_data()
+        if statements is None:
+            return None
+        print(f"Imported {import_statements_sqlite(args.database, statements)} records into {args.database}")
+
+    analyzer = SQLRentalAnalyzer(args.database, args.table)
+    results = analyzer.run_complete_analysis()
+    if not results:
+        print("Analysis failed. Check the database and table.")
+        return None
+    analyzer.save_results(args.output)
+    analyzer.print_summary()
+    return results
+
+
+if __name__ == "__main__":
+    main()
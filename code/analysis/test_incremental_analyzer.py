@@ -0,0 +1,114 @@
+"""
+Tests for IncrementalRentalAnalyzer: appended statements are folded in
+without re-reading the file, and any change to the already-processed rows
+rebuilds the state so results match a full RentalPropertyAnalyzer run.
+"""
+
+import contextlib
+import io
+import math
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Ensure local imports work regardless of CWD
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+if CURRENT_DIR not in sys.path:
+    sys.path.insert(0, CURRENT_DIR)
+
+from business_analyzer import RentalPropertyAnalyzer
+from incremental_analyzer import IncrementalRentalAnalyzer
+
+
+SAMPLE_DATA = os.path.join(CURRENT_DIR, '..', 'sample-data', 'rental-statements', 'labels.csv')
+
+# Sections the incremental analyzer produces
+SECTIONS = ['property_kpis', 'portfolio_metrics', 'seasonal_analysis', 'cost_optimization']
+
+
+class IncrementalRentalAnalyzerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="incremental-test-")
+        self.data_path = os.path.join(self.work_dir, 'labels.csv')
+        with open(SAMPLE_DATA) as f:
+            self.lines = [line + '\n' for line in f.read().splitlines()]
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def write_lines(self, lines):
+        with open(self.data_path, 'w') as f:
+            f.writelines(lines)
+
+    def update(self):
+        """Run an update with a fresh analyzer, as separate invocations would; returns (rows read, analyzer)."""
+        analyzer = IncrementalRentalAnalyzer(self.data_path)
+        with contextlib.redirect_stdout(io.StringIO()):
+            added = analyzer.update()
+            analyzer.save_state()
+        return added, analyzer
+
+    def assert_matches_full_analysis(self, analyzer):
+        full = RentalPropertyAnalyzer(self.data_path)
+        with contextlib.redirect_stdout(io.StringIO()):
+            full.load_data()
+        for section in SECTIONS:
+            method = f"compute_{section}" if section != 'cost_optimization' else 'compute_cost_optimization_opportunities'
+            self.assert_close(getattr(full, method)(), getattr(analyzer, method)(), section)
+
+    def assert_close(self, expected, actual, path):
+        if isinstance(expected, dict):
+            self.assertEqual(list(expected), list(actual), path)
+            for key in expected:
+                self.assert_close(expected[key], actual[key], f"{path}/{key}")
+        elif isinstance(expected, float) and isinstance(actual, float):
+            if not (math.isnan(expected) and math.isnan(actual)):
+                self.assertTrue(math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-9),
+                                f"{path}: {expected} != {actual}")
+        else:
+            self.assertEqual(expected, actual, path)
+
+    def test_appended_rows_are_read_incrementally(self):
+        self.write_lines(self.lines[:80])
+        self.assertEqual(self.update()[0], 78)
+        self.write_lines(self.lines)
+        added, analyzer = self.update()
+        self.assertEqual(added, len(self.lines) - 80)
+        self.assert_matches_full_analysis(analyzer)
+
+    def test_unterminated_last_row_is_read_again(self):
+        # A writer has flushed only part of row 80
+        partial = self.lines[80][:len(self.lines[80]) // 2]
+        self.write_lines(self.lines[:80] + [partial])
+        self.assertEqual(self.update()[0], 78)
+        self.write_lines(self.lines)
+        added, analyzer = self.update()
+        self.assertEqual(added, len(self.lines) - 80)
+        self.assert_matches_full_analysis(analyzer)
+
+    def test_edit_to_early_row_rebuilds_state(self):
+        self.write_lines(self.lines)
+        self.update()
+
+        # Change the rent of the first statement in place (same byte length, so the
+        # file does not grow), far from the end of the processed bytes
+        fields = self.lines[2].split(',')
+        fields[5] = '8' + fields[5][1:]
+        edited = self.lines[:2] + [','.join(fields)] + self.lines[3:]
+        self.write_lines(edited)
+        added, analyzer = self.update()
+        self.assertEqual(added, len(self.lines) - 2)
+        self.assert_matches_full_analysis(analyzer)
+
+        # An append after the rebuild is incremental again
+        self.write_lines(edited + self.lines[2:4])
+        added, analyzer = self.update()
+        self.assertEqual(added, 2)
+        self.assert_matches_full_analysis(analyzer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Typed columnar load cache for the Business Analysis Engine.
+The first load of a statement CSV parses it and converts dates and amounts
+as usual, then writes the typed frame to an uncompressed Arrow IPC (Feather)
+file. Later loads read that file, memory-mapped and only for the requested
+columns, while the CSV's content hash is unchanged. Needs pyarrow; callers
+fall back to parsing the CSV when it is not installed.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+from typing import Callable, Iterable, Iterator, Optional
+
+import pandas as pd
+
+
+DEFAULT_CACHE_DIR = ".analysis-cache"
+
+# Bump when the typed file layout or load-time conversions change
+CACHE_FORMAT_VERSION = 1
+
+# Typed columnar files load_data can read directly
+TYPED_EXTENSIONS = ('.arrow', '.feather', '.parquet')
+
+
+def hash_file(path: str, chunk_size: int = 1 << 20) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def pyarrow_available() -> bool:
+    """True if pyarrow (needed for Arrow/Parquet files) can be imported."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def read_typed_file(path: str, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """Read an Arrow IPC/Feather or Parquet file, memory-mapped, keeping only columns if given."""
+    if columns is not None:
+        columns = list(columns)
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path, columns=columns, memory_map=True)
+    import pyarrow as pa
+    from pyarrow import feather
+    if columns is not None:
+        # Ask only for columns the file has, as usecols does for CSV
+        with pa.memory_map(path) as source:
+            available = set(pa.ipc.open_file(source).schema.names)
+        columns = [col for col in columns if col in available]
+    return feather.read_table(path, columns=columns, memory_map=True).to_pandas()
+
+
+def iter_typed_batches(path: str, columns: Optional[Iterable[str]] = None,
+                       batch_size: int = 100_000) -> Iterator[pd.DataFrame]:
+    """Yield an Arrow IPC/Feather or Parquet file as frames of at most batch_size rows."""
+    import pyarrow as pa
+    if path.endswith('.parquet'):
+        from pyarrow import parquet
+        source = parquet.ParquetFile(path, memory_map=True)
+        names = source.schema_arrow.names
+        batches = source.iter_batches(batch_size=batch_size,
+                                      columns=None if columns is None else [c for c in columns if c in names])
+    else:
+        # Memory-mapped, so only the batch being converted is materialized
+        table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+        if columns is not None:
+            table = table.select([c for c in columns if c in table.column_names])
+        batches = table.to_batches(max_chunksize=batch_size)
+    for batch in batches:
+        yield batch.to_pandas()
+
+
+class TypedLoadCache:
+    """
+    One typed Arrow file per source CSV, replaced when the CSV changes.
+
+    Freshness is checked against a JSON sidecar recording the CSV's SHA-256,
+    size and mtime; a matching size and mtime is trusted without re-hashing.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, refresh: bool = False):
+        """Initialize cache rooted at cache_dir; refresh reconverts on the next load."""
+        self.cache_dir = cache_dir
+        self.refresh = refresh
+
+    def _entry_paths(self, source: str):
+        key = hashlib.sha256(os.path.abspath(source).encode("utf-8")).hexdigest()[:32]
+        base = os.path.join(self.cache_dir, key)
+        return base + ".arrow", base + ".json"
+
+    def _read_meta(self, meta_path: str) -> Optional[dict]:
+        try:
+            with open(meta_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, meta_path: str, meta: dict) -> None:
+        tmp_path = meta_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp_path, meta_path)
+
+    def is_current(self, source: str) -> bool:
+        """True if the typed file for source matches the source's current contents."""
+        if self.refresh:
+            return False
+        typed_path, meta_path = self._entry_paths(source)
+        meta = self._read_meta(meta_path)
+        if meta is None or meta.get("format_version") != CACHE_FORMAT_VERSION or not os.path.exists(typed_path):
+            return False
+        st = os.stat(source)
+        # Same size and mtime: trust it without re-reading the file
+        if meta.get("size") == st.st_size and meta.get("mtime_ns") == st.st_mtime_ns:
+            return True
+        if meta.get("size") != st.st_size or meta.get("sha256") != hash_file(source):
+            return False
+        # Touched but unchanged: record the new mtime so the next check is cheap
+        meta["mtime_ns"] = st.st_mtime_ns
+        self._write_meta(meta_path, meta)
+        return True
+
+    def load(self, source: str, convert: Callable[[str], pd.DataFrame],
+             columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        Return the typed frame for source, restricted to columns if given.
+        On a miss, convert(source) parses the CSV into a typed frame (all
+        columns), which is written to the cache before being returned.
+        """
+        typed_path, meta_path = self._entry_paths(source)
+        if self.is_current(source):
+            return read_typed_file(typed_path, columns)
+
+        st = os.stat(source)
+        sha256 = hash_file(source)
+        df = convert(source)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = typed_path + ".tmp"
+        df.to_feather(tmp_path, compression="uncompressed")
+        os.replace(tmp_path, typed_path)
+        self._write_meta(meta_path, {
+            "format_version": CACHE_FORMAT_VERSION,
+            "source": os.path.abspath(source),
+            "sha256": sha256,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "rows": len(df),
+        })
+        self.refresh = False
+        if columns is not None:
+            return df[[col for col in columns if col in df.columns]]
+        return df
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for the OCR processor.
+Times, in fresh interpreters, what the rental_ocr package loads at startup
+against the eager pandas/pdf2image/pytesseract imports the old standalone
+scripts did, and checks which heavy libraries a --test-single run on a
+text-layer PDF actually pulls in.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from typing import Any, Dict, List
+
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# label -> import statement run in a fresh interpreter
+IMPORT_TARGETS = {
+    "rental_ocr (parsing)": "import rental_ocr",
+    "rental_ocr.cli (processor startup)": "import rental_ocr.cli",
+    "eager imports (old scripts)": "import pandas, pdf2image, pytesseract",
+}
+
+# Libraries that should only load when a run needs them
+HEAVY_MODULES = ["pandas", "numpy", "pdf2image", "pytesseract", "PIL", "sqlalchemy",
+                 "watchdog", "tesserocr", "concurrent.futures.process"]
+
+_TIMER = (
+    "import time; _t = time.perf_counter(); {stmt}; "
+    "print(time.perf_counter() - _t)"
+)
+
+_TEST_SINGLE = (
+    "import sys, json; from rental_ocr.pipeline import process_pdf; "
+    "process_pdf({pdf!r}, text_backend={backend!r}); "
+    "print(json.dumps([m for m in {heavy!r} if m in sys.modules]))"
+)
+
+
+def _run(code: str) -> str:
+    out = subprocess.run([sys.executable, "-c", code], cwd=SCRIPTS_DIR, check=True,
+                         stdout=subprocess.PIPE, text=True)
+    return out.stdout.strip().splitlines()[-1]
+
+
+def time_import(stmt: str, repeat: int = 5) -> Dict[str, float]:
+    """Time stmt in `repeat` fresh interpreters; returns min/median milliseconds."""
+    samples = [float(_run(_TIMER.format(stmt=stmt))) * 1000 for _ in range(repeat)]
+    return {"min_ms": round(min(samples), 2), "median_ms": round(statistics.median(samples), 2)}
+
+
+def modules_loaded_by_test_single(pdf_path: str, text_backend: str) -> List[str]:
+    """Return the HEAVY_MODULES loaded after processing one PDF in a fresh interpreter."""
+    code = _TEST_SINGLE.format(pdf=os.path.abspath(pdf_path), backend=text_backend, heavy=HEAVY_MODULES)
+    return json.loads(_run(code))
+
+
+def main():
+    """Run the import-time benchmark."""
+    parser = argparse.ArgumentParser(description="Measure OCR processor import/startup time")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per target")
+    parser.add_argument("--pdf", default="sample-data/rental-statements/property-a/20210402.pdf",
+                       help="Text-layer PDF used for the --test-single module check")
+    parser.add_argument("--text-backend", default="auto", help="Text backend for the module check")
+    parser.add_argument("--output", help="Optional JSON file to write results to")
+
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {"generated_at": datetime.now().isoformat(), "imports": {}}
+    print(f"Import time over {args.repeat} fresh interpreters:\n")
+    print(f"{'target':<38}{'min ms':>10}{'median ms':>12}")
+    for label, stmt in IMPORT_TARGETS.items():
+        try:
+            stats = time_import(stmt, args.repeat)
+        except subprocess.CalledProcessError:
+            print(f"{label:<38}  (import failed, skipped)")
+            continue
+        results["imports"][label] = {"statement": stmt, **stats}
+        print(f"{label:<38}{stats['min_ms']:>10.2f}{stats['median_ms']:>12.2f}")
+
+    if os.path.exists(args.pdf):
+        loaded = modules_loaded_by_test_single(args.pdf, args.text_backend)
+        results["test_single_heavy_modules"] = loaded
+        print(f"\nHeavy modules loaded by a single text-layer PDF: {', '.join(loaded) or 'none'}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
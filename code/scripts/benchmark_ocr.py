@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Throughput and accuracy benchmark for the OCR processor versions.
+Runs the v1/v2/v3 profiles of rental_ocr over a PDF set, times the
+extract/parse/reconcile stages and scores extracted fields against
+labels.csv. Writes JSON so results can be compared between versions and
+over time.
+"""
+
+import argparse
+import csv
+import json
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from rental_ocr.extraction import extract_text
+from rental_ocr.parsing import (
+    PROPERTY_ALIAS_BY_DIR, parse_fields, parse_statement_date_from_filename, reconcile_and_validate,
+)
+from rental_ocr.profiles import PROFILES, get_profile
+
+# Fields scored against labels.csv
+BENCHMARK_FIELDS = ["rent", "management_fee", "repair", "deposit", "misc", "total"]
+
+STAGES = ["extract", "parse", "reconcile"]
+
+
+def load_labels(labels_csv: str) -> Dict[Tuple[str, str], Dict[str, str]]:
+    """Load labels.csv keyed by (property_alias, statement_date as M/D/YYYY)."""
+    with open(labels_csv, "r", newline="", encoding="utf-8") as f:
+        lines = f.readlines()
+    # labels.csv starts with a title line before the header row
+    if lines and not lines[0].startswith("statement_id"):
+        lines = lines[1:]
+    return {(r["property_alias"], r["statement_date"]): r for r in csv.DictReader(lines)}
+
+
+def find_pdfs(root: str) -> List[Tuple[str, str]]:
+    """Return sorted (property_dir_name, pdf_path) under root (a property dir or a tree of them)."""
+    pdfs = []
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.lower().endswith(".pdf"):
+                pdfs.append((os.path.basename(dirpath), os.path.join(dirpath, filename)))
+    return sorted(pdfs, key=lambda p: p[1])
+
+
+def _parse_label(value: Optional[str]) -> Optional[float]:
+    if value is None or value.strip() == "":
+        return None
+    try:
+        return round(float(value.replace(",", "")), 2)
+    except ValueError:
+        return None
+
+
+def benchmark_version(version: str, pdfs: List[Tuple[str, str]],
+                      labels: Dict[Tuple[str, str], Dict[str, str]],
+                      tolerance: float, text_backend: Optional[str] = None) -> Dict[str, Any]:
+    """Run one processor profile over pdfs; return timing and accuracy stats."""
+    profile = get_profile(version)
+    text_backend = text_backend or profile.default_text_backend
+
+    stage_seconds = {stage: 0.0 for stage in STAGES}
+    methods: Dict[str, int] = {}
+    field_stats = {f: {"labelled": 0, "exact": 0, "within_tolerance": 0} for f in BENCHMARK_FIELDS}
+    errors: List[Dict[str, str]] = []
+    labelled_files = 0
+
+    start = time.perf_counter()
+    for property_dir_name, pdf_path in pdfs:
+        try:
+            t0 = time.perf_counter()
+            text, method = extract_text(pdf_path, text_backend=text_backend)
+            t1 = time.perf_counter()
+            values, _, _ = parse_fields(text, profile)
+            t2 = time.perf_counter()
+            values, _, _ = reconcile_and_validate(values, profile)
+            t3 = time.perf_counter()
+        except Exception as e:
+            errors.append({"pdf": pdf_path, "error": f"{type(e).__name__}: {e}"})
+            continue
+
+        stage_seconds["extract"] += t1 - t0
+        stage_seconds["parse"] += t2 - t1
+        stage_seconds["reconcile"] += t3 - t2
+        methods[method] = methods.get(method, 0) + 1
+
+        alias = PROPERTY_ALIAS_BY_DIR.get(property_dir_name, property_dir_name)
+        statement_date = parse_statement_date_from_filename(os.path.basename(pdf_path))
+        label = labels.get((alias, statement_date))
+        if label is None:
+            continue
+
+        labelled_files += 1
+        for field in BENCHMARK_FIELDS:
+            expected = _parse_label(label.get(field))
+            if expected is None:
+                continue
+            stats = field_stats[field]
+            stats["labelled"] += 1
+            got = values.get(field)
+            if got is None:
+                continue
+            diff = abs(round(got, 2) - expected)
+            if diff < 0.005:
+                stats["exact"] += 1
+            if diff <= tolerance:
+                stats["within_tolerance"] += 1
+    elapsed = time.perf_counter() - start
+
+    completed = len(pdfs) - len(errors)
+    accuracy: Dict[str, Dict[str, Any]] = {}
+    totals = {"labelled": 0, "exact": 0, "within_tolerance": 0}
+    for field, stats in field_stats.items():
+        for k in totals:
+            totals[k] += stats[k]
+        accuracy[field] = _with_rates(stats)
+    accuracy["overall"] = _with_rates(totals)
+
+    return {
+        "version": version,
+        "text_backend": text_backend,
+        "files": len(pdfs),
+        "completed": completed,
+        "labelled_files": labelled_files,
+        "methods": methods,
+        "timing": {
+            "total_seconds": round(elapsed, 4),
+            "files_per_second": round(completed / elapsed, 3) if elapsed > 0 else None,
+            "stages": {
+                stage: {
+                    "total_seconds": round(seconds, 4),
+                    "mean_ms": round(seconds / completed * 1000, 3) if completed else None,
+                }
+                for stage, seconds in stage_seconds.items()
+            },
+        },
+        "accuracy": accuracy,
+        "errors": errors,
+    }
+
+
+def _with_rates(stats: Dict[str, int]) -> Dict[str, Any]:
+    n = stats["labelled"]
+    return {
+        **stats,
+        "exact_rate": round(stats["exact"] / n, 4) if n else None,
+        "within_tolerance_rate": round(stats["within_tolerance"] / n, 4) if n else None,
+    }
+
+
+def main():
+    """Benchmark the selected OCR processor versions."""
+    parser = argparse.ArgumentParser(description="Benchmark OCR processor speed and accuracy against labels.csv")
+    parser.add_argument("--versions", nargs="+", default=list(PROFILES), choices=list(PROFILES),
+                       help="Processor profiles to run")
+    parser.add_argument("--text-backend",
+                       help="Text-layer backend for every version (default: each profile's own)")
+    parser.add_argument("--pdf-dir", default="sample-data/rental-statements",
+                       help="Property directory or rental-statements root to benchmark")
+    parser.add_argument("--labels", default="sample-data/rental-statements/labels.csv",
+                       help="Ground-truth labels CSV")
+    parser.add_argument("--tolerance", type=float, default=1.00,
+                       help="Absolute tolerance (GBP) for within-tolerance matches")
+    parser.add_argument("--limit", type=int, help="Only benchmark the first N PDFs")
+    parser.add_argument("--output", default="ocr_benchmark_results.json",
+                       help="JSON file to write results to")
+
+    args = parser.parse_args()
+
+    pdfs = find_pdfs(args.pdf_dir)
+    if args.limit:
+        pdfs = pdfs[:args.limit]
+    if not pdfs:
+        print(f"No PDFs found under {args.pdf_dir}")
+        return
+    labels = load_labels(args.labels)
+
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "pdf_dir": args.pdf_dir,
+        "labels": args.labels,
+        "tolerance": args.tolerance,
+        "runs": {},
+    }
+
+    print(f"Benchmarking {len(pdfs)} PDFs against {args.labels}\n")
+    for version in args.versions:
+        result = benchmark_version(version, pdfs, labels, args.tolerance, args.text_backend)
+        report["runs"][version] = result
+
+        timing = result["timing"]
+        overall = result["accuracy"]["overall"]
+        stages = ", ".join(f"{s} {timing['stages'][s]['mean_ms']}ms" for s in STAGES)
+        print(f"{version}: {timing['files_per_second']} files/sec ({stages})")
+        print(f"  exact {overall['exact']}/{overall['labelled']}, "
+              f"within ±{args.tolerance:.2f} {overall['within_tolerance']}/{overall['labelled']} "
+              f"across {result['labelled_files']} labelled files")
+        if result["errors"]:
+            print(f"  {len(result['errors'])} file(s) failed")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
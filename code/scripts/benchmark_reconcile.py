@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark scalar vs columnar reconciliation of OCR results.
+Parses statement PDFs once, replicates the parsed rows to the requested
+size, then times reconcile_and_validate + confidence blend per row against
+rental_ocr.batch.reconcile_batch, and checks both give identical values.
+"""
+
+import argparse
+import math
+import os
+import time
+from typing import Dict, List
+
+from rental_ocr.batch import conf_column, mismatch_issues, parse_table, reconcile_batch
+from rental_ocr.extraction import extract_text
+from rental_ocr.parsing import AMOUNT_FIELDS, reconcile_and_validate
+from rental_ocr.profiles import PROFILES, get_profile
+
+
+def scalar_scores(table: Dict[str, list], profile) -> List[tuple]:
+    """Reconcile and blend row by row, as score_text does."""
+    out = []
+    for i in range(len(table["rent"])):
+        values = {f: table[f][i] for f in AMOUNT_FIELDS}
+        confs = {f: table[conf_column(f)][i] for f in AMOUNT_FIELDS}
+        values, overall_conf, issues = reconcile_and_validate(values, profile)
+        avg_field_conf = sum(confs.values()) / max(1, len(confs))
+        final_conf = profile.overall_weight * overall_conf + profile.field_weight * avg_field_conf
+        out.append((values, overall_conf, final_conf, issues))
+    return out
+
+
+def count_mismatches(scalar: List[tuple], batch: Dict) -> int:
+    """Number of rows where the batch result differs from the scalar one."""
+    issues = mismatch_issues(batch)
+    bad = 0
+    for i, (values, overall_conf, final_conf, row_issues) in enumerate(scalar):
+        same = all(
+            (values[f] is None and math.isnan(batch[f][i])) or values[f] == batch[f][i]
+            for f in AMOUNT_FIELDS
+        )
+        same = same and overall_conf == batch["overall_confidence"][i]
+        same = same and final_conf == batch["confidence"][i] and row_issues == issues[i]
+        bad += not same
+    return bad
+
+
+def main():
+    """Run the scalar vs batch reconciliation comparison."""
+    parser = argparse.ArgumentParser(description="Compare scalar and columnar OCR reconciliation")
+    parser.add_argument("--property-dir", default="sample-data/rental-statements/property-a",
+                       help="Directory containing PDF files to parse")
+    parser.add_argument("--rows", type=int, default=100000, help="Statements to re-score")
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES))
+
+    args = parser.parse_args()
+
+    pdf_paths = [
+        os.path.join(args.property_dir, f)
+        for f in sorted(os.listdir(args.property_dir)) if f.lower().endswith(".pdf")
+    ]
+    if not pdf_paths:
+        print(f"No PDFs found in {args.property_dir}")
+        return
+    texts = [extract_text(p, text_backend="auto")[0] for p in pdf_paths]
+
+    print(f"Re-scoring {args.rows} statements (from {len(texts)} parsed PDFs)\n")
+    print(f"{'profile':<9}{'scalar ms':>11}{'batch ms':>10}{'speedup':>9}{'mismatches':>12}")
+    for name in args.profiles:
+        profile = get_profile(name)
+        parsed, _ = parse_table(texts, profile)
+        reps = -(-args.rows // len(texts))
+        table = {col: (vals * reps)[:args.rows] for col, vals in parsed.items()}
+
+        start = time.perf_counter()
+        scalar = scalar_scores(table, profile)
+        scalar_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        batch = reconcile_batch(table, profile)
+        batch_ms = (time.perf_counter() - start) * 1000
+
+        print(f"{name:<9}{scalar_ms:>11.1f}{batch_ms:>10.1f}{scalar_ms / batch_ms:>8.1f}x"
+              f"{count_mismatches(scalar, batch):>12}")
+
+
+if __name__ == "__main__":
+    main()
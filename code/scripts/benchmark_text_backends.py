@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-file latency of the text-layer extraction backends.
+Compares the in-process backend against the pdftotext subprocess on a
+directory of statement PDFs.
+"""
+
+import argparse
+import os
+import statistics
+import time
+from typing import Dict, List
+
+from rental_ocr.backends import TEXT_BACKENDS, get_text_backend
+
+
+def benchmark_backend(backend_name: str, pdf_paths: List[str], repeat: int = 3) -> Dict[str, float]:
+    """Time backend.extract on every PDF; returns latency stats in milliseconds."""
+    backend = get_text_backend(backend_name)
+    # Warm up so one-off import/parser setup is not billed to the first file
+    backend.extract(pdf_paths[0])
+
+    latencies: List[float] = []
+    empty = 0
+    for _ in range(repeat):
+        for pdf_path in pdf_paths:
+            start = time.perf_counter()
+            text = backend.extract(pdf_path)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if not text.strip():
+                empty += 1
+
+    latencies.sort()
+    return {
+        "files": len(pdf_paths),
+        "samples": len(latencies),
+        "mean_ms": statistics.mean(latencies),
+        "median_ms": statistics.median(latencies),
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "empty_results": empty // repeat,
+    }
+
+
+def main():
+    """Run the backend latency comparison."""
+    parser = argparse.ArgumentParser(description="Compare per-file latency of PDF text backends")
+    parser.add_argument("--property-dir", default="sample-data/rental-statements/property-a",
+                       help="Directory containing PDF files")
+    parser.add_argument("--backends", nargs="+", default=list(TEXT_BACKENDS),
+                       help="Backends to compare")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the directory per backend")
+
+    args = parser.parse_args()
+
+    pdf_paths = [
+        os.path.join(args.property_dir, f)
+        for f in sorted(os.listdir(args.property_dir)) if f.lower().endswith(".pdf")
+    ]
+    if not pdf_paths:
+        print(f"No PDFs found in {args.property_dir}")
+        return
+
+    print(f"Benchmarking {len(pdf_paths)} PDFs from {args.property_dir} ({args.repeat} passes)\n")
+    print(f"{'backend':<12}{'mean ms':>10}{'median ms':>12}{'p95 ms':>10}{'empty':>8}")
+    for name in args.backends:
+        if not get_text_backend(name).available():
+            print(f"{name:<12}  (not available, skipped)")
+            continue
+        stats = benchmark_backend(name, pdf_paths, args.repeat)
+        print(f"{name:<12}{stats['mean_ms']:>10.2f}{stats['median_ms']:>12.2f}"
+              f"{stats['p95_ms']:>10.2f}{stats['empty_results']:>8}")
+
+
+if __name__ == "__main__":
+    main()
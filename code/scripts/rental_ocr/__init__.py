@@ -0,0 +1,32 @@
+"""
+OCR processing for rental statement PDFs.
+
+The v1/v2/v3 processors are heuristic profiles (rental_ocr.profiles) over a
+shared pipeline:
+
+- extraction: text layer (pypdf/pdftotext) with OCR fallback
+- parsing: keyword scanning, reconciliation and confidence scoring
+- pipeline: batch, incremental and watch-folder runs
+- cli: the command line used by scripts/ocr_processor_v*.py
+
+Importing the package only loads the parsing layer; PDF, OCR, pandas and
+database libraries are imported when a run needs them.
+"""
+
+from rental_ocr.parsing import (
+    PROPERTY_ALIAS_BY_DIR, parse_fields, parse_statement_date_from_filename,
+    reconcile_and_validate, score_text,
+)
+from rental_ocr.profiles import DEFAULT_PROFILE, PROFILES, OcrProfile, get_profile
+
+__all__ = [
+    "DEFAULT_PROFILE",
+    "OcrProfile",
+    "PROFILES",
+    "PROPERTY_ALIAS_BY_DIR",
+    "get_profile",
+    "parse_fields",
+    "parse_statement_date_from_filename",
+    "reconcile_and_validate",
+    "score_text",
+]
@@ -0,0 +1,237 @@
+"""
+Pluggable text-layer extraction backends and OCR engines for the OCR processor.
+The in-process implementations stay loaded for the life of the worker
+process; the pdftotext and pytesseract subprocess paths are kept as fallbacks.
+"""
+
+import subprocess
+import time
+from typing import Dict, Optional, Tuple, Type
+
+
+class TextBackend:
+    """Base class for text-layer extraction backends."""
+
+    name = "base"
+
+    def available(self) -> bool:
+        """Return True if the backend can run in this environment."""
+        return True
+
+    def extract(self, pdf_path: str) -> str:
+        """Return layout-preserving text for pdf_path, or "" if there is none."""
+        raise NotImplementedError
+
+
+class PdftotextBackend(TextBackend):
+    """Runs `pdftotext -layout` in a subprocess for every PDF."""
+
+    name = "pdftotext"
+
+    def available(self) -> bool:
+        try:
+            subprocess.run(["pdftotext", "-v"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def extract(self, pdf_path: str) -> str:
+        try:
+            out = subprocess.run([
+                "pdftotext", "-layout", pdf_path, "-"],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False, text=True
+            )
+            return out.stdout or ""
+        except FileNotFoundError:
+            return ""
+
+
+class PypdfBackend(TextBackend):
+    """In-process extraction with pypdf's layout mode (no fork/exec per file)."""
+
+    name = "pypdf"
+
+    def __init__(self):
+        self._pypdf = None
+
+    def _module(self):
+        # Imported once per process and reused for every PDF
+        if self._pypdf is None:
+            import pypdf
+            self._pypdf = pypdf
+        return self._pypdf
+
+    def available(self) -> bool:
+        try:
+            self._module()
+            return True
+        except ImportError:
+            return False
+
+    def extract(self, pdf_path: str) -> str:
+        try:
+            reader = self._module().PdfReader(pdf_path)
+            pages = [page.extract_text(extraction_mode="layout") or "" for page in reader.pages]
+        except Exception:
+            return ""
+        # pdftotext separates pages with form feeds; keep that convention
+        return "\f".join(pages)
+
+
+TEXT_BACKENDS: Dict[str, Type[TextBackend]] = {
+    PypdfBackend.name: PypdfBackend,
+    PdftotextBackend.name: PdftotextBackend,
+}
+
+# Preference order for "auto": in-process first, subprocess as fallback
+AUTO_BACKEND_ORDER = ("pypdf", "pdftotext")
+
+_backend_instances: Dict[str, TextBackend] = {}
+
+
+def get_text_backend(name: str = "auto") -> TextBackend:
+    """Return the per-process backend instance for name ("auto" picks the first available)."""
+    backend: Optional[TextBackend] = _backend_instances.get(name)
+    if backend is not None:
+        return backend
+
+    if name == "auto":
+        backend = next(
+            (b for b in map(get_text_backend, AUTO_BACKEND_ORDER) if b.available()),
+            get_text_backend(PdftotextBackend.name),
+        )
+        _backend_instances[name] = backend
+    else:
+        if name not in TEXT_BACKENDS:
+            raise ValueError(f"Unknown text backend: {name} (choose from {', '.join(TEXT_BACKENDS)})")
+        backend = TEXT_BACKENDS[name]()
+        _backend_instances[name] = backend
+    return backend
+
+
+class OcrEngine:
+    """Base class for page-image OCR engines.
+
+    recognize() counts pages and OCR seconds so per-page latency can be
+    reported for whichever engine ran.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self.pages = 0
+        self.seconds = 0.0
+
+    def available(self) -> bool:
+        """Return True if the engine can run in this environment."""
+        return True
+
+    def image_to_string(self, image) -> str:
+        """Return recognized text for a PIL image."""
+        raise NotImplementedError
+
+    def recognize(self, image) -> str:
+        """OCR one page image, adding its latency to pages/seconds."""
+        start = time.perf_counter()
+        try:
+            return self.image_to_string(image)
+        finally:
+            self.pages += 1
+            self.seconds += time.perf_counter() - start
+
+
+class PytesseractEngine(OcrEngine):
+    """pytesseract: starts a tesseract process (and reloads language data) per page."""
+
+    name = "pytesseract"
+
+    def __init__(self):
+        super().__init__()
+        self._pytesseract = None
+
+    def _module(self):
+        if self._pytesseract is None:
+            import pytesseract
+            self._pytesseract = pytesseract
+        return self._pytesseract
+
+    def available(self) -> bool:
+        try:
+            self._module().get_tesseract_version()
+            return True
+        except Exception:
+            return False
+
+    def image_to_string(self, image) -> str:
+        return self._module().image_to_string(image)
+
+
+class TesserocrEngine(OcrEngine):
+    """
+    tesserocr: one long-lived Tesseract API per process, fed images in memory.
+    Language data is loaded once, and no temp files or subprocesses are used.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self, lang: str = "eng"):
+        super().__init__()
+        self.lang = lang
+        self._api = None
+
+    def _get_api(self):
+        if self._api is None:
+            import tesserocr
+            self._api = tesserocr.PyTessBaseAPI(lang=self.lang)
+        return self._api
+
+    def available(self) -> bool:
+        try:
+            self._get_api()
+            return True
+        except Exception:
+            return False
+
+    def image_to_string(self, image) -> str:
+        api = self._get_api()
+        api.SetImage(image)
+        try:
+            return api.GetUTF8Text()
+        finally:
+            api.Clear()
+
+
+OCR_ENGINES: Dict[str, Type[OcrEngine]] = {
+    TesserocrEngine.name: TesserocrEngine,
+    PytesseractEngine.name: PytesseractEngine,
+}
+
+# Preference order for "auto": in-process engine first, pytesseract as fallback
+AUTO_OCR_ENGINE_ORDER = ("tesserocr", "pytesseract")
+
+_ocr_engine_instances: Dict[str, OcrEngine] = {}
+
+
+def get_ocr_engine(name: str = "auto") -> OcrEngine:
+    """Return the per-process OCR engine for name ("auto" picks the first available)."""
+    engine: Optional[OcrEngine] = _ocr_engine_instances.get(name)
+    if engine is not None:
+        return engine
+
+    if name == "auto":
+        engine = next(
+            (e for e in map(get_ocr_engine, AUTO_OCR_ENGINE_ORDER) if e.available()),
+            get_ocr_engine(PytesseractEngine.name),
+        )
+    else:
+        if name not in OCR_ENGINES:
+            raise ValueError(f"Unknown OCR engine: {name} (choose from {', '.join(OCR_ENGINES)})")
+        engine = OCR_ENGINES[name]()
+    _ocr_engine_instances[name] = engine
+    return engine
+
+
+def ocr_engine_stats() -> Dict[str, Tuple[int, float]]:
+    """Return {engine name: (pages, OCR seconds)} for engines used in this process."""
+    engines = {id(e): e for e in _ocr_engine_instances.values()}.values()
+    return {e.name: (e.pages, e.seconds) for e in engines if e.pages}
@@ -0,0 +1,109 @@
+"""
+On-disk cache of raw extracted PDF text, keyed by PDF content hash.
+Lets reruns of the OCR processor skip pdftotext/Tesseract entirely when only
+the parsing heuristics have changed.
+"""
+
+import hashlib
+import os
+import tempfile
+from typing import List, Optional, Tuple
+
+
+DEFAULT_CACHE_DIR = ".ocr-cache"
+DEFAULT_CACHE_MAX_MB = 512
+
+
+def hash_file(path: str, chunk_size: int = 1 << 20) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Content-addressed store of extracted text.
+
+    Entries are keyed by (content hash, extraction method, DPI) and stored as
+    one UTF-8 file each, so the cache is safe to share between worker
+    processes. Eviction is least-recently-used by file mtime.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR,
+                 max_bytes: int = DEFAULT_CACHE_MAX_MB * 1024 * 1024,
+                 refresh: bool = False):
+        """Initialize cache rooted at cache_dir; refresh ignores existing entries."""
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+
+    def _entry_path(self, content_hash: str, method: str, dpi: int) -> str:
+        key = hashlib.sha256(f"{content_hash}:{method}:{dpi}".encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], key + ".txt")
+
+    def get(self, content_hash: str, method: str, dpi: int = 0) -> Optional[str]:
+        """Return cached text, or None on a miss (an empty string is a valid hit)."""
+        if self.refresh:
+            return None
+        path = self._entry_path(content_hash, method, dpi)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except (FileNotFoundError, UnicodeDecodeError):
+            return None
+        try:
+            # Touch so eviction treats this entry as recently used
+            os.utime(path, None)
+        except OSError:
+            pass
+        return text
+
+    def put(self, content_hash: str, method: str, dpi: int, text: str) -> None:
+        """Store extracted text atomically (write to temp file, then rename)."""
+        path = self._entry_path(content_hash, method, dpi)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def evict(self) -> Tuple[int, int]:
+        """Delete least-recently-used entries until under max_bytes. Returns (removed, bytes_left)."""
+        entries: List[Tuple[float, int, str]] = []
+        total = 0
+        if not os.path.isdir(self.cache_dir):
+            return 0, 0
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if not entry.name.endswith(".txt"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+
+        removed = 0
+        if total > self.max_bytes:
+            for _, size, path in sorted(entries):
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+                if total <= self.max_bytes:
+                    break
+        return removed, total
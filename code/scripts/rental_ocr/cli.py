@@ -0,0 +1,165 @@
+"""
+Command-line entry point shared by the ocr_processor_v1/v2/v3 scripts.
+Only argparse and the light pipeline modules load at startup; PDF/OCR
+libraries, process pools and database drivers load when a run needs them.
+"""
+
+import argparse
+import os
+from typing import List, Optional
+
+from rental_ocr.backends import OCR_ENGINES, TEXT_BACKENDS, ocr_engine_stats
+from rental_ocr.cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_MAX_MB, ExtractionCache
+from rental_ocr.db_sink import DEFAULT_BATCH_SIZE
+from rental_ocr.pipeline import (
+    ADAPTIVE_DPI_TIERS, print_ocr_engine_summary, process_pdf, process_property_directory,
+    process_root_directory, watch_root_directory,
+)
+from rental_ocr.profiles import DEFAULT_PROFILE, PROFILES, get_profile
+from rental_ocr.trace import NULL_TRACE, FileTrace, TraceWriter
+from rental_ocr.watch import DEFAULT_DEBOUNCE_SECONDS, DEFAULT_POLL_INTERVAL
+
+
+def main(argv: Optional[List[str]] = None, profile: str = DEFAULT_PROFILE.name,
+         description: str = "OCR processor for rental statement PDFs",
+         default_output: str = "property-a-tuned.csv") -> None:
+    """Process rental statements with the given profile (overridable with --profile)."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--profile", default=profile, choices=list(PROFILES),
+                       help=f"Heuristic profile (default: {profile})")
+    parser.add_argument("--property-dir", default="sample-data/rental-statements/property-a",
+                       help="Directory containing PDF files")
+    parser.add_argument("--root",
+                       help="Process every property directory under this rental-statements root")
+    parser.add_argument("--watch",
+                       help="Run as a daemon: watch this rental-statements root and process new PDFs as they arrive")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE_SECONDS,
+                       help="With --watch, seconds a file must stay unchanged before it is processed")
+    parser.add_argument("--poll", action="store_true",
+                       help="With --watch, poll the tree instead of using filesystem notifications")
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL,
+                       help="Seconds between scans when polling")
+    parser.add_argument("--per-property", action="store_true",
+                       help="With --root, write one CSV per property instead of one combined CSV")
+    parser.add_argument("--output", default=default_output,
+                       help="Output CSV file")
+    parser.add_argument("--test-single", help="Test with a single PDF file")
+    parser.add_argument("--workers", type=int, default=1,
+                       help="Number of worker processes (0 = one per CPU)")
+    parser.add_argument("--text-backend", choices=["auto", *TEXT_BACKENDS],
+                       help="Text-layer extractor (auto = in-process pypdf if installed, else pdftotext; "
+                            "default: the profile's)")
+    parser.add_argument("--ocr-engine", default="auto", choices=["auto", *OCR_ENGINES],
+                       help="OCR engine (auto = in-process tesserocr if installed, else pytesseract); "
+                            "per-page latency is printed after the run (use --no-cache to time every page)")
+    parser.add_argument("--adaptive-dpi", action="store_true",
+                       help="OCR at low DPI first and re-render at higher DPI only for low-confidence files")
+    parser.add_argument("--dpi-tiers", default=",".join(str(d) for d in ADAPTIVE_DPI_TIERS),
+                       help="Comma-separated DPI tiers for --adaptive-dpi")
+    parser.add_argument("--incremental", action="store_true",
+                       help="Only process new/changed PDFs, tracked in <output>.manifest.json")
+    parser.add_argument("--trace",
+                       help="Write per-file stage timings as JSON lines to this path")
+    parser.add_argument("--db-url",
+                       help="Also write rows to statement_entries at this SQLAlchemy URL "
+                            "(e.g. sqlite:///statements.db)")
+    parser.add_argument("--db-batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                       help="Rows per database transaction with --db-url")
+    parser.add_argument("--db-only", action="store_true",
+                       help="With --db-url, skip writing the output CSV")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                       help="Directory for cached extracted text")
+    parser.add_argument("--cache-max-mb", type=int, default=DEFAULT_CACHE_MAX_MB,
+                       help="Maximum extraction cache size in MB")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Disable the extraction cache")
+    parser.add_argument("--refresh-cache", action="store_true",
+                       help="Ignore cached text and re-extract (cache is rewritten)")
+
+    args = parser.parse_args(argv)
+    ocr_profile = get_profile(args.profile)
+
+    cache = None
+    if not args.no_cache:
+        cache = ExtractionCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024,
+                                refresh=args.refresh_cache)
+
+    dpi_tiers = None
+    if args.adaptive_dpi:
+        dpi_tiers = sorted(int(d) for d in args.dpi_tiers.split(",") if d.strip())
+
+    if args.test_single:
+        # Test mode with single file
+        print(f"Testing OCR ({ocr_profile.name}) on: {args.test_single}")
+        tracer = FileTrace(args.test_single) if args.trace else NULL_TRACE
+        values, conf, method, notes = process_pdf(args.test_single, cache, args.text_backend, dpi_tiers, tracer,
+                                                  args.ocr_engine, ocr_profile)
+        if args.trace:
+            writer = TraceWriter(args.trace)
+            writer.write(tracer.to_dict())
+            writer.close()
+        print(f"Confidence: {conf:.2f}")
+        print(f"Method: {method}")
+        print(f"Values: {values}")
+        print(f"Notes: {notes}")
+        engine_stats = ocr_engine_stats()
+        if engine_stats:
+            print_ocr_engine_summary({os.getpid(): engine_stats})
+    else:
+        if args.db_only and not args.db_url:
+            print("Error: --db-only requires --db-url")
+            return
+
+        workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+        sink = None
+        if args.db_url:
+            from rental_ocr.db_sink import StatementEntriesSink
+            sink = StatementEntriesSink(args.db_url, args.db_batch_size)
+        process_kwargs = dict(workers=workers, cache=cache, text_backend=args.text_backend,
+                              dpi_tiers=dpi_tiers, incremental=args.incremental,
+                              trace_path=args.trace, ocr_engine=args.ocr_engine,
+                              sink=sink, write_csv=not args.db_only, profile=ocr_profile)
+
+        try:
+            if args.watch:
+                if not os.path.isdir(args.watch):
+                    print(f"Error: Directory {args.watch} does not exist")
+                    return
+
+                processed = watch_root_directory(
+                    args.watch, args.output, workers=workers, debounce_seconds=args.debounce,
+                    poll_interval=args.poll_interval, use_polling=args.poll,
+                    sink=sink, write_csv=not args.db_only, cache=cache,
+                    profile=ocr_profile, text_backend=args.text_backend, dpi_tiers=dpi_tiers,
+                    ocr_engine=args.ocr_engine)
+                print(f"\nProcessed {processed} file(s) while watching")
+                return
+
+            if args.root:
+                # Process all property directories through one shared work queue
+                if not os.path.isdir(args.root):
+                    print(f"Error: Directory {args.root} does not exist")
+                    return
+
+                print(f"Processing property directories under: {args.root}")
+                processed, skipped = process_root_directory(args.root, args.output,
+                                                            per_property=args.per_property,
+                                                            **process_kwargs)
+            else:
+                # Process entire directory
+                if not os.path.isdir(args.property_dir):
+                    print(f"Error: Directory {args.property_dir} does not exist")
+                    return
+
+                print(f"Processing PDFs in: {args.property_dir}")
+                print(f"Output file: {args.output}")
+
+                processed, skipped = process_property_directory(args.property_dir, args.output,
+                                                                **process_kwargs)
+        finally:
+            if sink is not None:
+                sink.close()
+        print(f"\nSummary:")
+        print(f"  Processed: {processed}")
+        print(f"  Skipped: {skipped}")
+
@@ -0,0 +1,187 @@
+"""
+Database sink for OCR results.
+Streams processed statements straight into the statement_entries table used by
+AssetManagementAnomalyDetection/scripts/ingest_statement_csv_to_azure.py,
+in batched transactions, instead of going through an intermediate CSV.
+Any SQLAlchemy URL works; sqlite:///statements.db is a local stand-in for Azure SQL.
+"""
+
+import csv
+import io
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+DEFAULT_BATCH_SIZE = 50
+
+# statement_entries column -> OCR output column (same order as statement-data.csv)
+ENTRY_COLUMNS = {
+    "source_row_id": "statement_id",
+    "property_name": "property_alias",
+    "statement_date": "statement_date",
+    "period_start": "period_start",
+    "period_end": "period_end",
+    "amount1": "rent",
+    "amount2": "management_fee",
+    "amount3": "repair",
+    "amount4": "deposit",
+    "amount5": "misc",
+    "notes": "note",
+    "balance": "total",
+}
+
+DATE_COLUMNS = {"statement_date", "period_start", "period_end"}
+FLOAT_COLUMNS = {"amount1", "amount2", "amount3", "amount4", "amount5", "balance"}
+
+MSSQL_CREATE_SQL = """
+IF OBJECT_ID('dbo.statement_entries','U') IS NULL
+CREATE TABLE dbo.statement_entries (
+    id INT IDENTITY(1,1) PRIMARY KEY,
+    source_row_id INT NULL,
+    property_name NVARCHAR(100) NULL,
+    statement_date DATE NULL,
+    period_start DATE NULL,
+    period_end DATE NULL,
+    amount1 FLOAT NULL,
+    amount2 FLOAT NULL,
+    amount3 FLOAT NULL,
+    amount4 FLOAT NULL,
+    amount5 FLOAT NULL,
+    notes NVARCHAR(MAX) NULL,
+    balance FLOAT NULL,
+    attachment NVARCHAR(255) NULL,
+    raw_csv NVARCHAR(MAX) NULL
+);
+"""
+
+SQLITE_CREATE_SQL = """
+CREATE TABLE IF NOT EXISTS statement_entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source_row_id INTEGER NULL,
+    property_name VARCHAR(100) NULL,
+    statement_date DATE NULL,
+    period_start DATE NULL,
+    period_end DATE NULL,
+    amount1 FLOAT NULL,
+    amount2 FLOAT NULL,
+    amount3 FLOAT NULL,
+    amount4 FLOAT NULL,
+    amount5 FLOAT NULL,
+    notes TEXT NULL,
+    balance FLOAT NULL,
+    attachment VARCHAR(255) NULL,
+    raw_csv TEXT NULL
+)
+"""
+
+
+def _to_date(value: Any) -> Optional[str]:
+    if value in (None, ""):
+        return None
+    for fmt in ("%m/%d/%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(str(value).strip(), fmt).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value in (None, ""):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def row_to_entry(row: Dict[str, Any], headers: List[str], attachment: Optional[str] = None) -> Dict[str, Any]:
+    """Convert an OCR output row to statement_entries parameters.
+
+    attachment identifies the source PDF; raw_csv is the row as it would
+    appear in the OCR output CSV.
+    """
+    entry: Dict[str, Any] = {}
+    for column, field in ENTRY_COLUMNS.items():
+        value = row.get(field)
+        if column in DATE_COLUMNS:
+            entry[column] = _to_date(value)
+        elif column in FLOAT_COLUMNS:
+            entry[column] = _to_float(value)
+        elif column == "source_row_id":
+            entry[column] = int(value) if value not in (None, "") else None
+        else:
+            entry[column] = value or None
+    entry["attachment"] = attachment
+
+    buf = io.StringIO()
+    csv.DictWriter(buf, fieldnames=headers, restval="", extrasaction="ignore",
+                   lineterminator="").writerow(row)
+    entry["raw_csv"] = buf.getvalue()
+    return entry
+
+
+class StatementEntriesSink:
+    """
+    Batched, transactional writer for statement_entries.
+
+    Rows are buffered and flushed every batch_size rows; each batch is one
+    transaction that first deletes earlier rows for the same attachment, so
+    re-processing a PDF replaces its row instead of duplicating it.
+    """
+
+    def __init__(self, db_url: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        """Connect to db_url (a SQLAlchemy URL) and ensure the table exists."""
+        # Imported here so the OCR processor runs without SQLAlchemy unless a sink is used
+        from sqlalchemy import create_engine, text
+
+        self.batch_size = max(1, batch_size)
+        self.pending: List[Dict[str, Any]] = []
+        self.written = 0
+
+        if db_url.startswith("mssql"):
+            self.engine = create_engine(db_url, fast_executemany=True)
+            table, create_sql = "dbo.statement_entries", MSSQL_CREATE_SQL
+        else:
+            self.engine = create_engine(db_url)
+            table, create_sql = "statement_entries", SQLITE_CREATE_SQL
+        with self.engine.begin() as conn:
+            conn.execute(text(create_sql))
+
+        columns = ["attachment", "raw_csv", *ENTRY_COLUMNS]
+        col_sql = ", ".join(columns)
+        param_sql = ", ".join(f":{c}" for c in columns)
+        self._insert = text(f"INSERT INTO {table} ({col_sql}) VALUES ({param_sql})")
+        self._delete = text(f"DELETE FROM {table} WHERE attachment = :attachment")
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        """Queue one entry (see row_to_entry), flushing when the batch is full."""
+        self.pending.append(entry)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write queued entries in a single transaction."""
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, []
+        attachments = [{"attachment": e["attachment"]} for e in batch if e.get("attachment")]
+        with self.engine.begin() as conn:
+            if attachments:
+                conn.execute(self._delete, attachments)
+            conn.execute(self._insert, batch)
+        self.written += len(batch)
+
+    def close(self) -> None:
+        """Flush remaining entries and release the connection pool."""
+        try:
+            self.flush()
+        finally:
+            self.engine.dispose()
+
+    def __enter__(self) -> "StatementEntriesSink":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self.close()
+        return False
@@ -0,0 +1,165 @@
+"""
+Text extraction for rental statement PDFs: text layer first, OCR fallback.
+pdf2image and the OCR engines are only imported once a PDF actually needs
+OCR, so text-layer runs never load them.
+"""
+
+import hashlib
+from typing import Callable, List, Optional, Tuple
+
+from rental_ocr.backends import get_ocr_engine, get_text_backend
+from rental_ocr.cache import ExtractionCache, hash_file
+from rental_ocr.trace import NULL_TRACE
+
+
+# Rasterization resolution for the Tesseract fallback
+TESSERACT_DPI = 300
+
+
+def split_pages(text: str) -> List[str]:
+    """Split a text layer into pages on form feeds (pdftotext also ends the last page with one)."""
+    pages = text.split("\f")
+    if len(pages) > 1 and pages[-1] == "":
+        pages.pop()
+    return pages
+
+
+def run_pdftotext(pdf_path: str) -> str:
+    """Extract text from PDF using pdftotext with layout preservation."""
+    return get_text_backend("pdftotext").extract(pdf_path)
+
+
+def run_tesseract(pdf_path: str, dpi: int = TESSERACT_DPI, page_texts: Optional[List[str]] = None,
+                  tracer=NULL_TRACE, ocr_engine: str = "auto") -> str:
+    """Extract text from PDF using OCR (Tesseract).
+
+    Pages are rasterized and OCR'd one at a time, and each image is released
+    before the next page is rendered. Pages that already have text in
+    page_texts (text layer split on form feeds) are used as-is, not OCR'd.
+    ocr_engine picks the OCR engine (see rental_ocr.backends.OCR_ENGINES);
+    page images are handed to it in memory.
+    """
+    try:
+        # Deferred: only needed on the OCR fallback path
+        from pdf2image import convert_from_path, pdfinfo_from_path
+        with tracer.stage("pdfinfo"):
+            page_count = int(pdfinfo_from_path(pdf_path)["Pages"])
+    except Exception:
+        return ""
+    tracer.set(page_count=page_count)
+    engine = get_ocr_engine(ocr_engine)
+
+    texts: List[str] = []
+    ocr_pages = 0
+    for page_no in range(1, page_count + 1):
+        if page_texts is not None and page_no <= len(page_texts) and page_texts[page_no - 1].strip():
+            texts.append(page_texts[page_no - 1])
+            continue
+
+        try:
+            with tracer.stage("rasterize"):
+                images = convert_from_path(pdf_path, dpi=dpi, first_page=page_no, last_page=page_no)
+        except Exception:
+            continue
+        ocr_pages += 1
+        for img in images:
+            try:
+                with tracer.stage("ocr"):
+                    txt = engine.recognize(img)
+                if txt:
+                    texts.append(txt)
+            except Exception:
+                pass
+            finally:
+                img.close()
+        del images
+    tracer.set(ocr_pages=ocr_pages, ocr_engine=engine.name)
+    return "\n".join(texts)
+
+
+def _cached_extract(cache: Optional[ExtractionCache], content_hash: Optional[str],
+                    method: str, dpi: int, extract: Callable[[], str], tracer=NULL_TRACE) -> str:
+    """Return text for (content_hash, method, dpi) from cache, extracting on a miss."""
+    if cache is None or content_hash is None:
+        return extract()
+    text = cache.get(content_hash, method, dpi)
+    tracer.set(**{f"cache_{method}": "miss" if text is None else "hit"})
+    if text is None:
+        text = extract()
+        cache.put(content_hash, method, dpi, text)
+    return text
+
+
+def content_hash(pdf_path: str, cache: Optional[ExtractionCache]) -> Optional[str]:
+    """Return the PDF's content hash when caching is on, else None."""
+    if cache is None:
+        return None
+    try:
+        return hash_file(pdf_path)
+    except OSError:
+        return None
+
+
+def ocr_text(pdf_path: str, dpi: int = TESSERACT_DPI, cache: Optional[ExtractionCache] = None,
+             pdf_hash: Optional[str] = None, page_texts: Optional[List[str]] = None,
+             tracer=NULL_TRACE, ocr_engine: str = "auto") -> str:
+    """
+    OCR a PDF at the given DPI, going through the extraction cache if enabled.
+    Pages with text in page_texts are kept as-is; only the blank ones are OCR'd.
+    """
+    if pdf_hash is None:
+        pdf_hash = content_hash(pdf_path, cache)
+    method = "tesseract"
+    if page_texts is not None and any(page.strip() for page in page_texts):
+        # The result embeds the text-layer pages, so key it on them too
+        method += ":" + hashlib.sha256("\f".join(page_texts).encode("utf-8")).hexdigest()[:16]
+    return _cached_extract(cache, pdf_hash, method, dpi,
+                           lambda: run_tesseract(pdf_path, dpi=dpi, page_texts=page_texts, tracer=tracer,
+                                                 ocr_engine=ocr_engine),
+                           tracer)
+
+
+def text_layer(pdf_path: str, cache: Optional[ExtractionCache] = None,
+               pdf_hash: Optional[str] = None, text_backend: str = "auto",
+               tracer=NULL_TRACE) -> Tuple[str, str]:
+    """Return the PDF's text layer (pages separated by form feeds) and the name of the backend used."""
+    backend = get_text_backend(text_backend)
+    tracer.set(backend=backend.name)
+    with tracer.stage("text_layer"):
+        text = _cached_extract(cache, pdf_hash, backend.name, 0,
+                               lambda: backend.extract(pdf_path), tracer)
+    return text, backend.name
+
+
+def extract_text(pdf_path: str, cache: Optional[ExtractionCache] = None,
+                 text_backend: str = "auto", dpi: int = TESSERACT_DPI,
+                 tracer=NULL_TRACE, ocr_engine: str = "auto") -> Tuple[str, str]:
+    """
+    Extract text from PDF using best available method, decided per page.
+    Returns the text layer if every page has one; otherwise the blank pages
+    are OCR'd, text pages are kept, and the method is "tesseract". A text
+    layer with some blank pages is returned as-is, with its backend as the
+    method, when no OCR engine is available or OCR finds no text on them.
+    """
+    with tracer.stage("hash"):
+        pdf_hash = content_hash(pdf_path, cache)
+
+    # Try the text layer first (faster and more accurate for text-based PDFs)
+    text1, backend_name = text_layer(pdf_path, cache, pdf_hash, text_backend, tracer)
+    pages = split_pages(text1)
+    if all(page.strip() for page in pages):
+        tracer.set(page_count=len(pages))
+        return text1, backend_name
+
+    text_pages = [page for page in pages if page.strip()]
+    if text_pages and not get_ocr_engine(ocr_engine).available():
+        tracer.set(page_count=len(pages))
+        return text1, backend_name
+
+    # Fall back to OCR for the pages without a text layer (scanned pages)
+    text2 = ocr_text(pdf_path, dpi, cache, pdf_hash, page_texts=pages, tracer=tracer,
+                     ocr_engine=ocr_engine)
+    if text_pages and text2.split() == "\n".join(text_pages).split():
+        # Nothing recognized on the blank pages (e.g. intentionally empty ones)
+        return text1, backend_name
+    return text2, "tesseract"
@@ -0,0 +1,100 @@
+"""
+labels.csv maintenance for the v1 workflow: OCR statements that have no
+label yet and append them to labels.csv. pandas is only imported here.
+"""
+
+import csv
+import os
+from typing import TYPE_CHECKING, Tuple
+
+from rental_ocr.parsing import PROPERTY_ALIAS_BY_DIR, parse_statement_date_from_filename
+from rental_ocr.pipeline import process_pdf
+from rental_ocr.profiles import V1_PROFILE, OcrProfile
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def load_labels(labels_path: str) -> "pd.DataFrame":
+    """Load labels.csv, adding an empty needs_review column if missing."""
+    # Deferred: pandas is only needed for the labels.csv workflow
+    import pandas as pd
+
+    df = pd.read_csv(labels_path)
+    if "needs_review" not in df.columns:
+        df["needs_review"] = ""
+    return df
+
+
+def is_row_present(df: "pd.DataFrame", property_alias: str, statement_date: str) -> bool:
+    """Return True if a label exists for (property_alias, statement_date)."""
+    # Existing labels appear to use (property_alias, statement_date) uniqueness
+    mask = (df["property_alias"].astype(str) == property_alias) & (df["statement_date"].astype(str) == statement_date)
+    return bool(mask.any())
+
+
+def next_statement_id(df: "pd.DataFrame") -> int:
+    """Return the statement_id after the largest one in df."""
+    try:
+        return int(df["statement_id"].max()) + 1
+    except Exception:
+        return 1
+
+
+def append_rows(base_dir: str, labels_path: str, profile: OcrProfile = V1_PROFILE) -> Tuple[int, int]:
+    """OCR statements not yet in labels.csv and append them (v1 workflow)."""
+    df = load_labels(labels_path)
+    start_id = next_statement_id(df)
+    appended = 0
+    skipped = 0
+
+    for prop_dir, alias in PROPERTY_ALIAS_BY_DIR.items():
+        folder = os.path.join(base_dir, prop_dir)
+        if not os.path.isdir(folder):
+            continue
+        for name in sorted(os.listdir(folder)):
+            if not name.lower().endswith(".pdf"):
+                continue
+            pdf_path = os.path.join(folder, name)
+            statement_date = parse_statement_date_from_filename(name)
+            if not statement_date:
+                skipped += 1
+                continue
+            if is_row_present(df, alias, statement_date):
+                continue
+
+            values, conf, method, notes = process_pdf(pdf_path, profile=profile)
+
+            needs_review = "true" if conf < profile.review_threshold else ""
+
+            row = {
+                "statement_id": start_id,
+                "property_alias": alias,
+                "statement_date": statement_date,
+                "period_start": "",
+                "period_end": "",
+                "rent": values.get("rent", ""),
+                "management_fee": values.get("management_fee", ""),
+                "repair": values.get("repair", ""),
+                "deposit": values.get("deposit", ""),
+                "misc": values.get("misc", ""),
+                "note": notes.get("notes", ""),
+                "total": values.get("total", ""),
+                "pay_date": statement_date,
+                "needs_review": needs_review,
+            }
+
+            # Ensure columns order matches existing file plus needs_review at end
+            # Read header order
+            columns = list(df.columns)
+            if "needs_review" not in columns:
+                columns.append("needs_review")
+            # Append row to df in memory
+            df.loc[len(df)] = [row.get(col, df[col].dtype.type() if hasattr(df[col].dtype, 'type') else "") for col in columns]
+
+            start_id += 1
+            appended += 1
+
+    # Write back to CSV (overwrite with updated DataFrame)
+    df.to_csv(labels_path, index=False, quoting=csv.QUOTE_MINIMAL)
+    return appended, skipped
@@ -0,0 +1,100 @@
+"""
+Processed-file manifest for incremental OCR runs.
+Records each PDF's content hash, assigned statement_id and confidence next to
+the output CSV so later runs only OCR new or changed statements.
+"""
+
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+from rental_ocr.cache import hash_file
+
+
+MANIFEST_VERSION = 1
+
+
+def manifest_path_for(output_csv: str) -> str:
+    """Return the manifest path stored alongside an output CSV."""
+    return output_csv + ".manifest.json"
+
+
+def file_fingerprint(pdf_path: str) -> Dict[str, Any]:
+    """Return the {sha256, size, mtime_ns} the manifest records for pdf_path."""
+    st = os.stat(pdf_path)
+    return {"sha256": hash_file(pdf_path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+class RunManifest:
+    """
+    Maps PDF filename -> {sha256, size, mtime_ns, statement_id, confidence}.
+
+    statement_ids are never reused: a changed file keeps its ID and new files
+    get IDs from next_statement_id, so IDs stay stable across runs.
+    """
+
+    def __init__(self, path: str, files: Optional[Dict[str, Dict[str, Any]]] = None,
+                 next_statement_id: int = 1):
+        """Initialize manifest stored at path."""
+        self.path = path
+        self.files: Dict[str, Dict[str, Any]] = files or {}
+        self.next_statement_id = next_statement_id
+
+    @classmethod
+    def load(cls, path: str) -> "RunManifest":
+        """Load manifest from path, or return an empty one if missing/unreadable."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(path)
+        if data.get("version") != MANIFEST_VERSION:
+            return cls(path)
+        return cls(path, data.get("files", {}), int(data.get("next_statement_id", 1)))
+
+    def save(self) -> None:
+        """Write manifest atomically."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": MANIFEST_VERSION,
+                "next_statement_id": self.next_statement_id,
+                "files": self.files,
+            }, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def is_current(self, filename: str, pdf_path: str) -> bool:
+        """Return True if pdf_path is unchanged since it was last recorded."""
+        entry = self.files.get(filename)
+        if entry is None:
+            return False
+        st = os.stat(pdf_path)
+        # Same size and mtime: trust it without re-reading the file
+        if entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+            return True
+        return entry.get("sha256") == hash_file(pdf_path)
+
+    def statement_id_for(self, filename: str) -> int:
+        """Return the existing statement_id for filename, or allocate the next one."""
+        entry = self.files.get(filename)
+        if entry is not None and entry.get("statement_id") is not None:
+            return int(entry["statement_id"])
+        statement_id = self.next_statement_id
+        self.next_statement_id += 1
+        return statement_id
+
+    def record(self, filename: str, pdf_path: str, statement_id: int, confidence: float,
+               fingerprint: Optional[Dict[str, Any]] = None) -> None:
+        """Record a successfully processed file.
+
+        fingerprint is the file_fingerprint taken when the file was submitted
+        for processing; without one the file is fingerprinted as it is now.
+        """
+        self.files[filename] = {
+            **(fingerprint or file_fingerprint(pdf_path)),
+            "statement_id": statement_id,
+            "confidence": round(confidence, 4),
+        }
+        self.next_statement_id = max(self.next_statement_id, statement_id + 1)
@@ -0,0 +1,320 @@
+"""
+Field parsing, reconciliation and scoring for rental statement text.
+Pure Python (re only), so parsing can be imported without the PDF/OCR stack.
+All heuristics come from an OcrProfile (see rental_ocr.profiles).
+"""
+
+import re
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from rental_ocr.profiles import DEFAULT_PROFILE, OcrProfile
+from rental_ocr.trace import NULL_TRACE
+
+
+# Property mapping
+PROPERTY_ALIAS_BY_DIR = {
+    "property-a": "Arranview",
+    "property-b": "Bedford",
+    "property-c": "97B Dempster",
+}
+
+# Date pattern for filename parsing
+DATE_FILENAME_RE = re.compile(r"(20\d{2})(\d{2})(\d{2})")
+
+# Enhanced amount pattern for extracting monetary values
+AMOUNT_RE = re.compile(r"(?<![0-9\-])([\-]?[0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]{1,2})|[\-]?[0-9]+(?:\.[0-9]{1,2}))")
+
+# Amount fields, in output order
+AMOUNT_FIELDS = ["rent", "management_fee", "repair", "deposit", "misc", "total"]
+
+# Present fields needed for the profile's many_fields_bonus
+MANY_FIELDS = 4
+
+
+def parse_statement_date_from_filename(filename: str) -> Optional[str]:
+    """Extract statement date from filename in YYYYMMDD format."""
+    m = DATE_FILENAME_RE.search(filename)
+    if not m:
+        return None
+    y, mo, d = m.group(1), m.group(2), m.group(3)
+    try:
+        dt = datetime(int(y), int(mo), int(d))
+        # Return in M/D/YYYY format to match labels.csv
+        return f"{dt.month}/{dt.day}/{dt.year}"
+    except ValueError:
+        return None
+
+
+def normalize_amount(value: str) -> Optional[float]:
+    """Normalize monetary amount string to float."""
+    try:
+        v = value.replace(",", "").strip()
+        return round(float(v), 2)
+    except Exception:
+        return None
+
+
+# Characters that re.IGNORECASE folds onto ASCII letters but str.lower() does not
+# (dotted/dotless I, long s). Lines containing them take the exact regex path.
+_CASE_FOLD_SPECIAL_RE = re.compile("[\u0130\u0131\u017f]")
+
+
+class KeywordScanner:
+    """
+    Single-pass matcher that finds amounts near keywords for many fields at once.
+
+    Keyword regexes for every field are compiled once. Each line is lowercased
+    once, rejected with a single combined regex if it has no keyword at all,
+    and otherwise matched against each field's case-sensitive regex, which is
+    equivalent to the original per-field re.IGNORECASE search. Amounts are
+    tokenized at most once per line and shared by all fields.
+    """
+
+    def __init__(self, field_keywords: Dict[str, List[str]],
+                 neighbor_offsets: Tuple[int, ...] = DEFAULT_PROFILE.neighbor_offsets,
+                 confidence: float = DEFAULT_PROFILE.keyword_confidence):
+        """Precompile keyword regexes for field_keywords."""
+        self.fields = list(field_keywords)
+        self.neighbor_offsets = neighbor_offsets
+        self.confidence = confidence
+        all_keywords = sorted({k.lower() for kws in field_keywords.values() for k in kws},
+                              key=lambda k: (-len(k), k))
+        self._any_keyword_re = re.compile("|".join(re.escape(k) for k in all_keywords))
+        self._field_res = [
+            (field, re.compile("|".join(re.escape(k.lower()) for k in kws)))
+            for field, kws in field_keywords.items()
+        ]
+        self._field_res_ignorecase = [
+            (field, re.compile("|".join(re.escape(k) for k in kws), re.IGNORECASE))
+            for field, kws in field_keywords.items()
+        ]
+
+    def fields_in_line(self, line: str) -> frozenset:
+        """Return the set of fields with at least one keyword in line."""
+        if _CASE_FOLD_SPECIAL_RE.search(line):
+            return frozenset(f for f, r in self._field_res_ignorecase if r.search(line))
+        low = line.lower()
+        if not self._any_keyword_re.search(low):
+            return frozenset()
+        return frozenset(f for f, r in self._field_res if r.search(low))
+
+    def scan(self, lines: List[str]) -> Dict[str, List[Tuple[float, float, str]]]:
+        """Return {field: [(amount, confidence, line), ...]} for every field."""
+        results: Dict[str, List[Tuple[float, float, str]]] = {f: [] for f in self.fields}
+        amounts_cache: Dict[int, List[Optional[float]]] = {}
+
+        def amounts_at(i: int) -> List[Optional[float]]:
+            # Tokenize each line at most once, shared by all fields
+            if i not in amounts_cache:
+                amounts_cache[i] = [normalize_amount(c) for c in AMOUNT_RE.findall(lines[i])]
+            return amounts_cache[i]
+
+        for idx, line in enumerate(lines):
+            hit_fields = self.fields_in_line(line)
+            if not hit_fields:
+                continue
+
+            # Look for amounts on the same line first, then on the neighbouring lines
+            candidates = amounts_at(idx)
+            if not candidates:
+                for offset in self.neighbor_offsets:
+                    check_idx = idx + offset
+                    if 0 <= check_idx < len(lines):
+                        candidates = amounts_at(check_idx)
+                        if candidates:
+                            break
+            # Matches are attributed to the keyword line, neighbour amounts included
+            matches = [(amt, self.confidence, line.strip()) for amt in candidates if amt is not None]
+            if not matches:
+                continue
+
+            for field in hit_fields:
+                results[field].extend(matches)
+
+        return results
+
+
+_scanners: Dict[str, KeywordScanner] = {}
+
+
+def scanner_for(profile: OcrProfile) -> KeywordScanner:
+    """Return the (cached) KeywordScanner for profile's keyword sets."""
+    scanner = _scanners.get(profile.name)
+    if scanner is None:
+        scanner = KeywordScanner(profile.field_keywords, profile.neighbor_offsets, profile.keyword_confidence)
+        _scanners[profile.name] = scanner
+    return scanner
+
+
+def find_amounts_near_keyword(lines: List[str], keywords: List[str],
+                              profile: OcrProfile = DEFAULT_PROFILE) -> List[Tuple[float, float, str]]:
+    """Find monetary amounts near specified keywords with enhanced matching."""
+    scanner = KeywordScanner({"field": keywords}, profile.neighbor_offsets, profile.keyword_confidence)
+    return scanner.scan(lines)["field"]
+
+
+def _sum_deductions(matches: List[Tuple[float, float, str]]) -> Tuple[Optional[float], float, List[str]]:
+    """Sum up deduction amounts from keyword matches."""
+    if not matches:
+        return None, 0.0, []
+
+    # Sum positive amounts (deductions)
+    total = sum(m[0] for m in matches if m[0] is not None and m[0] >= 0)
+    avg_conf = sum(m[1] for m in matches) / max(1, len(matches))
+    # Unique notes in first-seen order (a set would vary between processes)
+    notes = list(dict.fromkeys(m[2] for m in matches))
+
+    return round(total, 2), avg_conf, notes
+
+
+def sum_deductions_by_keywords(lines: List[str], keywords: List[str],
+                               profile: OcrProfile = DEFAULT_PROFILE) -> Tuple[Optional[float], float, List[str]]:
+    """Sum up deduction amounts for specified keywords."""
+    return _sum_deductions(find_amounts_near_keyword(lines, keywords, profile))
+
+
+def parse_fields(text: str, profile: OcrProfile = DEFAULT_PROFILE
+                 ) -> Tuple[Dict[str, Optional[float]], Dict[str, float], Dict[str, str]]:
+    """Parse financial fields from extracted text with the profile's keyword sets."""
+    lines = [l.strip() for l in text.splitlines() if l.strip()]
+    hits = scanner_for(profile).scan(lines)
+
+    rent_candidates = hits["rent"]
+    rent_val = None
+    rent_conf = 0.0
+    if rent_candidates:
+        # Prefer the largest amount (typically rent is significant)
+        rent_val, rent_conf, _ = sorted(rent_candidates, key=lambda x: x[0], reverse=True)[0]
+
+    mgmt_candidates = hits["management_fee"]
+    mgmt_val = None
+    mgmt_conf = 0.0
+    if mgmt_candidates:
+        # Often a percentage of rent; pick the median
+        sorted_m = sorted(mgmt_candidates, key=lambda x: x[0])
+        mid = len(sorted_m) // 2
+        mgmt_val, mgmt_conf, _ = sorted_m[mid]
+
+    repair_val, repair_conf, repair_notes = _sum_deductions(hits["repair"])
+    deposit_val, deposit_conf, deposit_notes = _sum_deductions(hits["deposit"])
+    misc_val, misc_conf, misc_notes = _sum_deductions(hits["misc"])
+
+    total_candidates = hits["total"]
+    total_val = None
+    total_conf = 0.0
+    if total_candidates:
+        # Use the last occurrence (often the summary), preferring reasonable amounts
+        reasonable_totals = total_candidates
+        if profile.total_max is not None:
+            reasonable_totals = [t for t in total_candidates if t[0] > 0 and t[0] < profile.total_max]
+        if reasonable_totals:
+            total_val, total_conf, _ = reasonable_totals[-1]
+        else:
+            total_val, total_conf, _ = total_candidates[-1]
+
+    # Derive total if missing
+    derived_total = None
+    if rent_val is not None:
+        deductions = sum(p for p in [mgmt_val, repair_val, deposit_val, misc_val] if p is not None)
+        derived_total = round(rent_val - deductions, 2)
+
+    field_values = {
+        "rent": rent_val,
+        "management_fee": mgmt_val,
+        "repair": repair_val,
+        "deposit": deposit_val,
+        "misc": misc_val,
+        "total": total_val if total_val is not None else derived_total,
+    }
+
+    confidences = {
+        "rent": rent_conf if rent_val is not None else 0.0,
+        "management_fee": mgmt_conf if mgmt_val is not None else 0.0,
+        "repair": repair_conf if repair_val is not None else 0.0,
+        "deposit": deposit_conf if deposit_val is not None else 0.0,
+        "misc": misc_conf if misc_val is not None else 0.0,
+        "total": total_conf if total_val is not None else (
+            profile.derived_total_confidence if derived_total is not None else 0.0),
+    }
+
+    meta_notes = {
+        "notes": "; ".join([*repair_notes, *deposit_notes, *misc_notes])[:200]
+    }
+
+    return field_values, confidences, meta_notes
+
+
+def reconcile_and_validate(values: Dict[str, Optional[float]], profile: OcrProfile = DEFAULT_PROFILE
+                           ) -> Tuple[Dict[str, Optional[float]], float, List[str]]:
+    """Validate and reconcile financial values using the profile's tolerance and weights."""
+    issues: List[str] = []
+
+    # v1 reconciled the amounts as parsed, before making them positive
+    source = dict(values) if profile.reconcile_raw_values else values
+
+    # Ensure all amounts are positive
+    for k in AMOUNT_FIELDS:
+        if values.get(k) is not None:
+            values[k] = round(abs(values[k]), 2)
+
+    rent = source.get("rent")
+    mgmt = source.get("management_fee")
+    repair = source.get("repair")
+    deposit = source.get("deposit")
+    misc = source.get("misc")
+    total = source.get("total")
+
+    # Compute derived total if missing
+    if total is None and rent is not None:
+        others = sum(v for v in [mgmt, repair, deposit, misc] if v is not None)
+        values["total"] = round(rent - others, 2)
+        total = values["total"]
+
+    # Reconciliation check
+    if rent is not None and total is not None:
+        expected = round(rent - sum(v for v in [mgmt, repair, deposit, misc] if v is not None), 2)
+        if abs(expected - total) > profile.tolerance:
+            issues.append(f"total_mismatch expected={expected} got={total}")
+
+    # Overall confidence: field presence, key fields and reconciliation
+    base_conf = 0.0
+    present_fields = sum(1 for k in AMOUNT_FIELDS if values.get(k) is not None)
+    base_conf += profile.present_field_weight * present_fields
+
+    if rent is not None:
+        base_conf += profile.rent_bonus
+    if total is not None:
+        base_conf += profile.total_bonus
+    if rent is not None and total is not None:
+        base_conf += profile.rent_and_total_bonus
+
+    if not issues:
+        base_conf += profile.reconciled_bonus
+    else:
+        base_conf += profile.mismatch_bonus
+
+    if present_fields >= MANY_FIELDS:
+        base_conf += profile.many_fields_bonus
+
+    base_conf = max(0.0, min(1.0, base_conf))
+
+    return values, base_conf, issues
+
+
+def score_text(text: str, profile: OcrProfile = DEFAULT_PROFILE, tracer=NULL_TRACE
+               ) -> Tuple[Dict[str, Optional[float]], float, Dict[str, str]]:
+    """Parse, reconcile and score extracted text; returns (values, confidence, notes)."""
+    with tracer.stage("parse"):
+        values, confs, notes = parse_fields(text, profile)
+    with tracer.stage("reconcile"):
+        values, overall_conf, issues = reconcile_and_validate(values, profile)
+
+        # Blend overall and mean field confidence
+        avg_field_conf = sum(confs.values()) / max(1, len(confs))
+        final_conf = profile.overall_weight * overall_conf + profile.field_weight * avg_field_conf
+
+    if issues:
+        notes["notes"] = (notes.get("notes", "") + "; " + "; ".join(issues)).strip("; ").strip()
+
+    return values, final_conf, notes
@@ -0,0 +1,643 @@
+"""
+Batch, incremental and watch-folder processing of rental statement PDFs.
+Runs process_pdf over property directories (optionally on a process pool)
+and writes rows to CSV, a manifest and/or a database sink. Heavy optional
+dependencies (process pools, watchdog, SQLAlchemy) are imported on use.
+"""
+
+import csv
+import os
+import signal
+import sys
+import time
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from rental_ocr.backends import ocr_engine_stats
+from rental_ocr.cache import ExtractionCache
+from rental_ocr.db_sink import StatementEntriesSink, row_to_entry
+from rental_ocr.extraction import TESSERACT_DPI, content_hash, extract_text, ocr_text, split_pages, text_layer
+from rental_ocr.manifest import RunManifest, file_fingerprint, manifest_path_for
+from rental_ocr.parsing import PROPERTY_ALIAS_BY_DIR, parse_statement_date_from_filename, score_text
+from rental_ocr.profiles import DEFAULT_PROFILE, OcrProfile
+from rental_ocr.trace import NULL_TRACE, FileTrace, TraceWriter
+from rental_ocr.watch import DEFAULT_DEBOUNCE_SECONDS, DEFAULT_POLL_INTERVAL
+
+
+# Escalation tiers for --adaptive-dpi: OCR at the lowest, re-render only if needed
+ADAPTIVE_DPI_TIERS = (150, 225, 300)
+
+# CSV headers matching labels.csv format
+OUTPUT_HEADERS = [
+    "statement_id", "property_alias", "statement_date", "period_start", "period_end",
+    "rent", "management_fee", "repair", "deposit", "misc", "note", "total", "pay_date"
+]
+
+
+def process_pdf(pdf_path: str, cache: Optional[ExtractionCache] = None,
+                text_backend: Optional[str] = None,
+                dpi_tiers: Optional[List[int]] = None,
+                tracer=NULL_TRACE,
+                ocr_engine: str = "auto",
+                profile: OcrProfile = DEFAULT_PROFILE) -> Tuple[Dict[str, Optional[float]], float, str, Dict[str, str]]:
+    """Process a single PDF and extract financial data.
+
+    profile selects the parsing/scoring heuristics (v1, v2 or v3); text_backend
+    defaults to the profile's. With dpi_tiers, the OCR fallback starts at the
+    lowest DPI and re-renders at the next tier only while confidence is below
+    the profile's review threshold. OCR'd files record the DPI used and OCR
+    time in notes["ocr_dpi"] / notes["ocr_seconds"]. Pass a FileTrace as
+    tracer to record per-stage timings. ocr_engine selects the OCR engine
+    for the fallback.
+    """
+    tiers = sorted(dpi_tiers) if dpi_tiers else [TESSERACT_DPI]
+    text_backend = text_backend or profile.default_text_backend
+
+    start = time.perf_counter()
+    text, method = extract_text(pdf_path, cache, text_backend,
+                                dpi=tiers[0], tracer=tracer, ocr_engine=ocr_engine)
+    values, final_conf, notes = score_text(text, profile, tracer)
+
+    if method == "tesseract":
+        dpi = tiers[0]
+        pdf_hash = content_hash(pdf_path, cache)
+        page_texts = None
+        for next_dpi in tiers[1:]:
+            if final_conf >= profile.review_threshold:
+                break
+            if page_texts is None:
+                # Re-render only the pages without a text layer
+                page_texts = split_pages(text_layer(pdf_path, cache, pdf_hash, text_backend, tracer)[0])
+            dpi = next_dpi
+            text = ocr_text(pdf_path, dpi, cache, pdf_hash, page_texts=page_texts, tracer=tracer,
+                            ocr_engine=ocr_engine)
+            values, final_conf, notes = score_text(text, profile, tracer)
+        notes["ocr_dpi"] = str(dpi)
+        notes["ocr_seconds"] = f"{time.perf_counter() - start:.3f}"
+        tracer.set(ocr_dpi=dpi)
+
+    if tracer.enabled:
+        tracer.set(method=method, text_length=len(text), confidence=round(final_conf, 4))
+    return values, final_conf, method, notes
+
+
+def peak_rss_mb() -> float:
+    """Return this process's peak resident set size in MB (0.0 where unsupported)."""
+    try:
+        import resource  # Unix only
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _process_pdf_safe(pdf_path: str, trace: bool = False,
+                      **process_kwargs) -> Tuple[Optional[Tuple], Optional[str], Dict[str, Any]]:
+    """Run process_pdf, returning (result, error, worker_info) instead of raising.
+
+    worker_info holds the pid, its peak RSS in MB, its cumulative OCR engine
+    stats ({engine: (pages, seconds)}) and, if trace is set, the file's
+    trace record.
+    """
+    tracer = FileTrace(pdf_path) if trace else NULL_TRACE
+    try:
+        result, error = process_pdf(pdf_path, tracer=tracer, **process_kwargs), None
+    except Exception as e:
+        result, error = None, f"{type(e).__name__}: {e}"
+        tracer.set(error=error)
+    info: Dict[str, Any] = {"pid": os.getpid(), "peak_rss_mb": peak_rss_mb(),
+                            "ocr_engines": ocr_engine_stats()}
+    if trace:
+        info["trace"] = tracer.to_dict()
+    return result, error, info
+
+
+def iter_pdf_results(pdf_paths: List[str], workers: int = 1,
+                     worker_peak_rss: Optional[Dict[int, float]] = None,
+                     trace_writer: Optional[TraceWriter] = None,
+                     worker_ocr_stats: Optional[Dict[int, Dict[str, Tuple[int, float]]]] = None,
+                     **process_kwargs) -> Iterator[Tuple[str, Optional[Tuple], Optional[str]]]:
+    """Yield (pdf_path, result, error) for each PDF in input order.
+
+    With workers > 1 the process_pdf calls run in a process pool; results are
+    still yielded in the order of pdf_paths so output stays deterministic.
+    If worker_peak_rss is given it is filled with {pid: peak RSS in MB}; if
+    trace_writer is given each file's stage trace is written to it; if
+    worker_ocr_stats is given it is filled with {pid: {engine: (pages, seconds)}}.
+    process_kwargs are passed through to process_pdf.
+    """
+    if worker_peak_rss is None:
+        worker_peak_rss = {}
+    if worker_ocr_stats is None:
+        worker_ocr_stats = {}
+    trace = trace_writer is not None
+
+    def record(info: Dict[str, Any]) -> None:
+        pid = info["pid"]
+        worker_peak_rss[pid] = max(info["peak_rss_mb"], worker_peak_rss.get(pid, 0.0))
+        # Engine stats are cumulative per process, so the latest report wins
+        if info.get("ocr_engines"):
+            worker_ocr_stats[pid] = info["ocr_engines"]
+        if trace_writer is not None:
+            trace_writer.write(info.get("trace"))
+
+    if workers <= 1:
+        for pdf_path in pdf_paths:
+            result, error, info = _process_pdf_safe(pdf_path, trace, **process_kwargs)
+            record(info)
+            yield pdf_path, result, error
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_process_pdf_safe, p, trace, **process_kwargs) for p in pdf_paths]
+        for pdf_path, future in zip(pdf_paths, futures):
+            try:
+                result, error, info = future.result()
+                record(info)
+            except Exception as e:
+                # Worker crashed (e.g. BrokenProcessPool) - record and keep going
+                result, error = None, f"{type(e).__name__}: {e}"
+            yield pdf_path, result, error
+
+
+def print_ocr_dpi_summary(ocr_stats: Dict[int, List[float]], dpi_tiers: List[int]) -> None:
+    """Print files and OCR time per DPI tier, and rasterized area vs a fixed top-tier run."""
+    tiers = sorted(dpi_tiers)
+    top = tiers[-1]
+    print("\nOCR DPI tiers:")
+    rendered_area = 0.0
+    fixed_area = 0.0
+    for dpi in sorted(ocr_stats):
+        seconds = ocr_stats[dpi]
+        print(f"  {dpi:>4} DPI: {len(seconds)} file(s), {sum(seconds):.2f}s OCR")
+        # Pixel count scales with DPI squared; a file that ended at dpi also rendered every lower tier
+        tried = [t for t in tiers if t <= dpi] or [dpi]
+        rendered_area += len(seconds) * sum((t / top) ** 2 for t in tried)
+        fixed_area += len(seconds)
+    if fixed_area:
+        print(f"  Rasterized area: {rendered_area / fixed_area * 100:.0f}% of a fixed {top} DPI run")
+
+
+def print_ocr_engine_summary(worker_ocr_stats: Dict[int, Dict[str, Tuple[int, float]]]) -> None:
+    """Print pages OCR'd and mean per-page OCR latency for each engine used."""
+    totals: Dict[str, List[float]] = {}
+    for stats in worker_ocr_stats.values():
+        for name, (pages, seconds) in stats.items():
+            total = totals.setdefault(name, [0, 0.0])
+            total[0] += pages
+            total[1] += seconds
+    print("\nOCR engines:")
+    for name, (pages, seconds) in sorted(totals.items()):
+        print(f"  {name}: {int(pages)} page(s), {seconds:.2f}s OCR, "
+              f"{seconds / pages * 1000:.1f} ms/page")
+
+
+def read_output_rows(output_csv: str) -> List[Dict[str, str]]:
+    """Read rows from a previously written output CSV (empty if missing)."""
+    if not os.path.exists(output_csv):
+        return []
+    with open(output_csv, 'r', newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def find_property_dirs(root: str) -> List[str]:
+    """Return sorted subdirectories of root that contain at least one PDF."""
+    dirs = []
+    for name in sorted(os.listdir(root)):
+        path = os.path.join(root, name)
+        if os.path.isdir(path) and any(f.lower().endswith(".pdf") for f in os.listdir(path)):
+            dirs.append(path)
+    return dirs
+
+
+def per_property_output(output_csv: str, property_name: str) -> str:
+    """Return the per-property output path derived from output_csv (out.csv -> out-property-a.csv)."""
+    stem, ext = os.path.splitext(output_csv)
+    return f"{stem}-{property_name}{ext or '.csv'}"
+
+
+def build_output_row(statement_id: int, property_name: str, statement_date: str,
+                     values: Dict[str, Optional[float]], notes: Dict[str, str],
+                     include_ocr_dpi: bool = False) -> Dict[str, Any]:
+    """Build one output CSV row (OUTPUT_HEADERS, plus ocr_dpi if requested)."""
+    row = {
+        "statement_id": statement_id,
+        "property_alias": PROPERTY_ALIAS_BY_DIR.get(property_name, property_name),
+        "statement_date": statement_date,
+        "period_start": "",  # Not extracted from PDFs
+        "period_end": "",     # Not extracted from PDFs
+        "rent": values.get("rent", ""),
+        "management_fee": values.get("management_fee", ""),
+        "repair": values.get("repair", ""),
+        "deposit": values.get("deposit", ""),
+        "misc": values.get("misc", ""),
+        "note": notes.get("notes", ""),
+        "total": values.get("total", ""),
+        "pay_date": statement_date,
+    }
+    if include_ocr_dpi:
+        row["ocr_dpi"] = notes.get("ocr_dpi", "")
+    return row
+
+
+class _OutputTarget:
+    """Rows, ID allocation and optional manifest for one output CSV.
+
+    With write_csv=False (rows go to a database sink only) no rows are kept
+    and write() just saves the manifest.
+    """
+
+    def __init__(self, output_csv: str, incremental: bool, write_csv: bool = True):
+        self.output_csv = output_csv
+        self.write_csv = write_csv
+        self.rows: List[Dict] = []
+        self.next_statement_id = 1
+        self.manifest: Optional[RunManifest] = None
+        self.existing_rows: List[Dict[str, str]] = []
+        if incremental:
+            self.manifest = RunManifest.load(manifest_path_for(output_csv))
+            self.existing_rows = read_output_rows(output_csv) if write_csv else []
+            if write_csv and not self.existing_rows:
+                # Output missing: the manifest no longer describes it, start over
+                self.manifest = RunManifest(self.manifest.path)
+
+    def allocate_statement_id(self, manifest_key: str) -> int:
+        if self.manifest is not None:
+            return self.manifest.statement_id_for(manifest_key)
+        statement_id = self.next_statement_id
+        self.next_statement_id += 1
+        return statement_id
+
+    def add(self, row: Dict) -> None:
+        if self.write_csv:
+            self.rows.append(row)
+
+    def write(self, headers: List[str]) -> None:
+        if not self.write_csv:
+            if self.manifest is not None:
+                self.manifest.save()
+            return
+
+        rows = self.rows
+        if self.manifest is not None and rows:
+            # Replace changed rows and append new ones, ordered by stable statement_id
+            merged = {int(r["statement_id"]): r for r in self.existing_rows}
+            merged.update((r["statement_id"], r) for r in rows)
+            rows = [merged[k] for k in sorted(merged)]
+
+        if rows:
+            with open(self.output_csv, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=headers, restval="", extrasaction="ignore")
+                writer.writeheader()
+                writer.writerows(rows)
+            print(f"Written {len(rows)} rows to {self.output_csv}")
+        elif self.manifest is not None:
+            print(f"No new or changed PDFs; {self.output_csv} is up to date")
+
+        if self.manifest is not None:
+            self.manifest.save()
+
+
+def process_statement_dirs(targets: Dict[str, List[str]], workers: int = 1,
+                           cache: Optional[ExtractionCache] = None,
+                           text_backend: Optional[str] = None,
+                           dpi_tiers: Optional[List[int]] = None,
+                           incremental: bool = False,
+                           trace_path: Optional[str] = None,
+                           ocr_engine: str = "auto",
+                           sink: Optional[StatementEntriesSink] = None,
+                           write_csv: bool = True,
+                           profile: OcrProfile = DEFAULT_PROFILE) -> Tuple[int, int]:
+    """Process PDFs from property directories and write each output CSV.
+
+    targets maps output CSV -> property directories whose rows go into it.
+    PDFs from all directories share one work queue (and worker pool), so
+    workers stay busy across properties.
+
+    With incremental=True a manifest next to each output CSV records each
+    file's hash and statement_id; only new or changed PDFs are processed and
+    their rows appended/replaced, keeping existing statement_ids stable.
+
+    With trace_path, a JSON lines record of per-stage timings is written
+    for every processed file.
+
+    With a sink, each row is also queued to the statement_entries table as
+    its file finishes (flushed in batches); write_csv=False skips the CSV.
+    profile selects the heuristics, review threshold and, unless text_backend
+    is given, the text backend.
+    """
+    processed = 0
+    skipped = 0
+    unchanged = 0
+    errors: List[Tuple[str, str]] = []
+
+    headers = list(OUTPUT_HEADERS)
+    if dpi_tiers:
+        headers.append("ocr_dpi")
+
+    outputs = {output_csv: _OutputTarget(output_csv, incremental, write_csv) for output_csv in targets}
+
+    # Collect work in sorted order so statement_id numbering is deterministic
+    jobs: List[Tuple[_OutputTarget, str, str, str]] = []  # (target, property_name, filename, date)
+    for output_csv, property_dirs in targets.items():
+        target = outputs[output_csv]
+        for property_dir in property_dirs:
+            property_name = os.path.basename(os.path.normpath(property_dir))
+            for filename in sorted(os.listdir(property_dir)):
+                if not filename.lower().endswith(".pdf"):
+                    continue
+
+                statement_date = parse_statement_date_from_filename(filename)
+                if not statement_date:
+                    print(f"Skipping {filename}: Could not parse date")
+                    skipped += 1
+                    continue
+
+                if target.manifest is not None and target.manifest.is_current(
+                        f"{property_name}/{filename}", os.path.join(property_dir, filename)):
+                    unchanged += 1
+                    continue
+
+                jobs.append((target, property_dir, filename, statement_date))
+
+    if incremental:
+        print(f"Incremental run: {len(jobs)} new/changed, {unchanged} unchanged")
+
+    pdf_paths = [os.path.join(property_dir, filename) for _, property_dir, filename, _ in jobs]
+    if workers > 1:
+        print(f"Processing {len(pdf_paths)} PDFs with {workers} workers...")
+
+    start = time.perf_counter()
+    worker_peak_rss: Dict[int, float] = {}
+    worker_ocr_stats: Dict[int, Dict[str, Tuple[int, float]]] = {}
+    ocr_stats: Dict[int, List[float]] = {}  # dpi -> OCR seconds per file
+    multi_dir = sum(len(dirs) for dirs in targets.values()) > 1
+    trace_writer = TraceWriter(trace_path) if trace_path else None
+    results = iter_pdf_results(pdf_paths, workers, worker_peak_rss, trace_writer, worker_ocr_stats,
+                               cache=cache, text_backend=text_backend, dpi_tiers=dpi_tiers,
+                               ocr_engine=ocr_engine, profile=profile)
+    for (target, property_dir, filename, statement_date), (pdf_path, result, error) in zip(jobs, results):
+        property_name = os.path.basename(os.path.normpath(property_dir))
+        label = f"{property_name}/{filename}" if multi_dir else filename
+        print(f"Processing {label}...")
+
+        if error is not None:
+            print(f"Error processing {label}: {error}")
+            errors.append((pdf_path, error))
+            skipped += 1
+            continue
+
+        values, conf, method, notes = result
+
+        # More lenient review threshold (0.80 instead of 0.85)
+        needs_review = conf < profile.review_threshold
+
+        manifest_key = f"{property_name}/{filename}"
+        statement_id = target.allocate_statement_id(manifest_key)
+
+        row = build_output_row(statement_id, property_name, statement_date, values, notes, bool(dpi_tiers))
+        if "ocr_dpi" in notes:
+            ocr_stats.setdefault(int(notes["ocr_dpi"]), []).append(float(notes["ocr_seconds"]))
+
+        target.add(row)
+        if sink is not None:
+            sink.add(row_to_entry(row, headers, attachment=manifest_key))
+        if target.manifest is not None:
+            target.manifest.record(manifest_key, pdf_path, statement_id, conf)
+        processed += 1
+
+        if "ocr_dpi" in notes:
+            print(f"  Confidence: {conf:.2f}, Method: {method} @ {notes['ocr_dpi']} DPI")
+        else:
+            print(f"  Confidence: {conf:.2f}, Method: {method}")
+        if needs_review:
+            print(f"  ⚠️  Needs review (low confidence)")
+        else:
+            print(f"  ✅ High confidence")
+    elapsed = time.perf_counter() - start
+    if trace_writer is not None:
+        trace_writer.close()
+        print(f"\nStage trace written to {trace_path}")
+
+    # Write to CSV
+    print()
+    if sink is not None:
+        sink.flush()
+        print(f"Inserted {sink.written} rows into statement_entries")
+    for target in outputs.values():
+        target.write(headers)
+
+    if errors:
+        print(f"\n{len(errors)} file(s) failed:")
+        for pdf_path, error in errors:
+            print(f"  {pdf_path}: {error}")
+
+    if jobs:
+        rate = len(jobs) / elapsed if elapsed > 0 else 0.0
+        print(f"\nProcessed {len(jobs)} files in {elapsed:.2f}s ({rate:.2f} files/sec, workers={workers})")
+    if ocr_stats:
+        print_ocr_dpi_summary(ocr_stats, dpi_tiers or [TESSERACT_DPI])
+    if worker_ocr_stats:
+        print_ocr_engine_summary(worker_ocr_stats)
+    if worker_peak_rss:
+        print(f"Peak RSS per worker: max {max(worker_peak_rss.values()):.1f} MB "
+              f"across {len(worker_peak_rss)} process(es)")
+
+    if cache is not None:
+        removed, _ = cache.evict()
+        if removed:
+            print(f"Evicted {removed} old entries from extraction cache")
+
+    return processed, skipped
+
+
+def process_property_directory(property_dir: str, output_csv: str, workers: int = 1,
+                               cache: Optional[ExtractionCache] = None,
+                               text_backend: Optional[str] = None,
+                               dpi_tiers: Optional[List[int]] = None,
+                               incremental: bool = False,
+                               trace_path: Optional[str] = None,
+                               ocr_engine: str = "auto",
+                               sink: Optional[StatementEntriesSink] = None,
+                               write_csv: bool = True,
+                               profile: OcrProfile = DEFAULT_PROFILE) -> Tuple[int, int]:
+    """Process all PDFs in a property directory and write to CSV."""
+    return process_statement_dirs({output_csv: [property_dir]}, workers=workers, cache=cache,
+                                  text_backend=text_backend, dpi_tiers=dpi_tiers,
+                                  incremental=incremental, trace_path=trace_path,
+                                  ocr_engine=ocr_engine, sink=sink, write_csv=write_csv,
+                                  profile=profile)
+
+
+def process_root_directory(root: str, output_csv: str, per_property: bool = False,
+                           **process_kwargs) -> Tuple[int, int]:
+    """Process every property directory under root in one run.
+
+    Writes one combined CSV, or with per_property=True one CSV per property
+    (see per_property_output). process_kwargs go to process_statement_dirs.
+    """
+    property_dirs = find_property_dirs(root)
+    if not property_dirs:
+        print(f"No property directories with PDFs found under {root}")
+        return 0, 0
+
+    if per_property:
+        targets = {
+            per_property_output(output_csv, os.path.basename(d)): [d] for d in property_dirs
+        }
+    else:
+        targets = {output_csv: property_dirs}
+
+    print(f"Found {len(property_dirs)} property directories: "
+          f"{', '.join(os.path.basename(d) for d in property_dirs)}")
+    return process_statement_dirs(targets, **process_kwargs)
+
+
+def _append_output_row(output_csv: str, headers: List[str], row: Dict[str, Any], replace: bool) -> None:
+    """Append row to output_csv (writing the header first), or replace the row with its statement_id."""
+    if replace:
+        rows = [r for r in read_output_rows(output_csv) if int(r["statement_id"]) != row["statement_id"]]
+        rows.append(row)
+        rows.sort(key=lambda r: int(r["statement_id"]))
+        with open(output_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=headers, restval="", extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+        return
+
+    new_file = not os.path.exists(output_csv) or os.path.getsize(output_csv) == 0
+    with open(output_csv, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=headers, restval="", extrasaction="ignore")
+        if new_file:
+            writer.writeheader()
+        writer.writerow(row)
+
+
+class _WatchJob(NamedTuple):
+    """A PDF submitted by watch_root_directory, with the fingerprint of the bytes it was submitted with."""
+    future: Any
+    statement_date: str
+    ready_at: float
+    fingerprint: Dict[str, Any]
+
+
+def _ignore_sigint() -> None:
+    """Pool initializer: leave Ctrl+C to the parent, which stops the watcher."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def watch_root_directory(root: str, output_csv: str, workers: int = 1,
+                         debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+                         poll_interval: float = DEFAULT_POLL_INTERVAL,
+                         use_polling: bool = False,
+                         sink: Optional[StatementEntriesSink] = None,
+                         write_csv: bool = True,
+                         profile: OcrProfile = DEFAULT_PROFILE,
+                         **process_kwargs) -> int:
+    """Watch root for new statement PDFs and process each one as it arrives.
+
+    Uses filesystem notifications (watchdog) when available, else polling.
+    Only files created or modified after startup are processed; a file is
+    submitted to the worker pool once it has stopped changing for
+    debounce_seconds; if it changes again while being processed, it is
+    resubmitted when that job completes. Each result is appended to
+    output_csv and, with a sink, committed to the database straight away,
+    and the manifest records the content hash the job was submitted with.
+    statement_ids come from the output's manifest, so restarts continue the
+    numbering and a re-uploaded file keeps its ID. Runs until interrupted; returns the
+    number of files processed. process_kwargs are passed to process_pdf.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from rental_ocr.watch import StableFileTracker, make_watcher
+
+    watcher = make_watcher(root, use_polling, poll_interval)
+    tracker = StableFileTracker(debounce_seconds)
+    manifest = RunManifest.load(manifest_path_for(output_csv))
+    headers = list(OUTPUT_HEADERS)
+    if process_kwargs.get("dpi_tiers"):
+        headers.append("ocr_dpi")
+
+    in_flight: Dict[str, _WatchJob] = {}
+    # In-flight files that changed again; resubmitted when their job completes
+    dirty = set()
+    processed = 0
+
+    def submit(executor, pdf_path: str) -> None:
+        if pdf_path in in_flight:
+            dirty.add(pdf_path)
+            return
+        property_name = os.path.basename(os.path.dirname(pdf_path))
+        filename = os.path.basename(pdf_path)
+        try:
+            if manifest.is_current(f"{property_name}/{filename}", pdf_path):
+                return
+            fingerprint = file_fingerprint(pdf_path)
+        except OSError:
+            return
+        statement_date = parse_statement_date_from_filename(filename)
+        if not statement_date:
+            print(f"Skipping {property_name}/{filename}: Could not parse date")
+            return
+        future = executor.submit(_process_pdf_safe, pdf_path, profile=profile, **process_kwargs)
+        in_flight[pdf_path] = _WatchJob(future, statement_date, time.perf_counter(), fingerprint)
+
+    print(f"Watching {root} for new PDFs ({watcher.name}, debounce {debounce_seconds:.1f}s, "
+          f"workers={workers}). Press Ctrl+C to stop.")
+    watcher.start()
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_ignore_sigint) as executor:
+            while True:
+                for pdf_path in watcher.poll():
+                    tracker.touch(pdf_path)
+
+                for pdf_path in tracker.ready():
+                    submit(executor, pdf_path)
+
+                done = [p for p, job in in_flight.items() if job.future.done()]
+                for pdf_path in done:
+                    job = in_flight.pop(pdf_path)
+                    property_name = os.path.basename(os.path.dirname(pdf_path))
+                    manifest_key = f"{property_name}/{os.path.basename(pdf_path)}"
+                    try:
+                        result, error, _ = job.future.result()
+                    except Exception as e:
+                        result, error = None, f"{type(e).__name__}: {e}"
+                    if error is not None:
+                        print(f"Error processing {manifest_key}: {error}")
+                        if pdf_path in dirty:
+                            dirty.discard(pdf_path)
+                            submit(executor, pdf_path)
+                        continue
+
+                    values, conf, method, notes = result
+                    replace = manifest_key in manifest.files
+                    statement_id = manifest.statement_id_for(manifest_key)
+                    row = build_output_row(statement_id, property_name, job.statement_date, values, notes,
+                                           bool(process_kwargs.get("dpi_tiers")))
+                    if write_csv:
+                        _append_output_row(output_csv, headers, row, replace)
+                    if sink is not None:
+                        sink.add(row_to_entry(row, headers, attachment=manifest_key))
+                        sink.flush()
+                    manifest.record(manifest_key, pdf_path, statement_id, conf, job.fingerprint)
+                    manifest.save()
+                    processed += 1
+
+                    review = "needs review" if conf < profile.review_threshold else "high confidence"
+                    print(f"Processed {manifest_key} -> statement_id {statement_id} "
+                          f"(confidence {conf:.2f}, {method}, {review}) "
+                          f"in {time.perf_counter() - job.ready_at:.2f}s")
+                    if pdf_path in dirty:
+                        # Changed while it was processed: the recorded hash no longer matches
+                        dirty.discard(pdf_path)
+                        submit(executor, pdf_path)
+
+                if not done:
+                    time.sleep(min(0.2, poll_interval))
+    except KeyboardInterrupt:
+        print("\nStopping watcher...")
+    finally:
+        watcher.stop()
+    return processed
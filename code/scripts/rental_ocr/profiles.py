@@ -0,0 +1,180 @@
+"""
+Heuristic profiles for the rental statement OCR processor.
+Each profile captures what used to differ between ocr_processor_v1/v2/v3:
+keyword sets, neighbour-line scanning, total selection, reconciliation
+tolerance, confidence weights and the review threshold.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+class OcrProfile(NamedTuple):
+    """Parsing and scoring parameters for one processor version."""
+
+    name: str
+    description: str
+    field_keywords: Dict[str, List[str]]
+    # Neighbouring lines checked (in order) when a keyword line has no amount
+    neighbor_offsets: Tuple[int, ...]
+    # Confidence given to every keyword match
+    keyword_confidence: float
+    # Field confidence for a total derived from rent minus deductions
+    derived_total_confidence: float
+    # Totals at or above this are ignored if a smaller positive one exists
+    total_max: Optional[float]
+    # Reconciliation tolerance (GBP) between stated and derived total
+    tolerance: float
+    # Reconcile on amounts as parsed (v1) rather than after taking abs()
+    reconcile_raw_values: bool
+    # Overall confidence weights
+    present_field_weight: float
+    rent_bonus: float
+    total_bonus: float
+    rent_and_total_bonus: float
+    reconciled_bonus: float
+    mismatch_bonus: float
+    many_fields_bonus: float
+    # Final confidence = overall_weight * overall + field_weight * mean field confidence
+    overall_weight: float
+    field_weight: float
+    review_threshold: float
+    # Text-layer backend used when the caller does not pick one
+    default_text_backend: str = "auto"
+
+
+V1_PROFILE = OcrProfile(
+    name="v1",
+    description="Original processor (appends unlabeled statements to labels.csv)",
+    field_keywords={
+        "rent": ["rent received", "rent from", "rent to", "rent", "rental income"],
+        "management_fee": ["management fee", "management fees", "mgmt fee", "agent fee"],
+        "repair": [
+            "repair", "repairs", "maintenance", "invoice", "call out", "gas safety", "legionella",
+            "plumbing", "boiler"
+        ],
+        "deposit": ["deposit", "float held", "reserve", "retention"],
+        "misc": ["rent guarantee", "credit check", "standing charge", "certificate", "epc", "eicr", "pat"],
+        "total": [
+            "net payment", "payment to landlord", "amount paid", "total to landlord", "balance paid", "total"
+        ],
+    },
+    neighbor_offsets=(1, -1),
+    keyword_confidence=0.92,
+    derived_total_confidence=0.88,
+    total_max=None,
+    tolerance=0.50,
+    reconcile_raw_values=True,
+    present_field_weight=0.15,
+    rent_bonus=0.0,
+    total_bonus=0.0,
+    rent_and_total_bonus=0.25,
+    reconciled_bonus=0.25,
+    mismatch_bonus=0.0,
+    many_fields_bonus=0.0,
+    overall_weight=0.6,
+    field_weight=0.4,
+    review_threshold=0.90,
+    default_text_backend="pdftotext",
+)
+
+V2_PROFILE = OcrProfile(
+    name="v2",
+    description="Enhanced processor with extended keyword sets",
+    field_keywords={
+        "rent": ["rent received", "rent from", "rent to", "rent", "rental income", "rental"],
+        "management_fee": ["management fee", "management fees", "mgmt fee", "agent fee", "management"],
+        "repair": [
+            "repair", "repairs", "maintenance", "invoice", "call out", "gas safety",
+            "legionella", "plumbing", "boiler", "certs", "certificate"
+        ],
+        "deposit": ["deposit", "float held", "reserve", "retention", "safe deposit"],
+        "misc": [
+            "rent guarantee", "credit check", "standing charge", "epc", "eicr", "pat",
+            "council tax", "energy", "missing payment"
+        ],
+        "total": [
+            "net payment", "payment to landlord", "amount paid", "total to landlord",
+            "balance paid", "total", "net"
+        ],
+    },
+    neighbor_offsets=(1, -1),
+    keyword_confidence=0.92,
+    derived_total_confidence=0.88,
+    total_max=None,
+    tolerance=0.50,
+    reconcile_raw_values=False,
+    present_field_weight=0.15,
+    rent_bonus=0.0,
+    total_bonus=0.0,
+    rent_and_total_bonus=0.25,
+    reconciled_bonus=0.25,
+    mismatch_bonus=0.0,
+    many_fields_bonus=0.0,
+    overall_weight=0.6,
+    field_weight=0.4,
+    review_threshold=0.90,
+    default_text_backend="pdftotext",
+)
+
+V3_PROFILE = OcrProfile(
+    name="v3",
+    description="Tuned processor - optimized for high confidence readings",
+    field_keywords={
+        "rent": [
+            "rent received", "rent from", "rent to", "rent", "rental income", "rental",
+            "income", "receipts", "tenant payment", "monthly rent"
+        ],
+        "management_fee": [
+            "management fee", "management fees", "mgmt fee", "agent fee", "management",
+            "letting fee", "admin fee", "service charge", "commission"
+        ],
+        "repair": [
+            "repair", "repairs", "maintenance", "invoice", "call out", "gas safety",
+            "legionella", "plumbing", "boiler", "certs", "certificate", "eicr", "pat",
+            "electrical", "heating", "water", "drainage", "roof", "window", "door"
+        ],
+        "deposit": [
+            "deposit", "float held", "reserve", "retention", "safe deposit", "holding",
+            "security deposit", "bond"
+        ],
+        "misc": [
+            "rent guarantee", "credit check", "standing charge", "epc", "eicr", "pat",
+            "council tax", "energy", "missing payment", "insurance", "legal", "court",
+            "eviction", "reference", "inventory", "check-in", "check-out"
+        ],
+        "total": [
+            "net payment", "payment to landlord", "amount paid", "total to landlord",
+            "balance paid", "total", "net", "final amount", "due to landlord",
+            "landlord payment", "net amount"
+        ],
+    },
+    # Matches are attributed to the keyword line, so neighbour amounts get the same confidence
+    neighbor_offsets=(-2, -1, 1, 2),
+    keyword_confidence=0.95,
+    derived_total_confidence=0.90,
+    total_max=10000.0,
+    # More lenient reconciliation check (±£5.00 instead of ±£0.50)
+    tolerance=5.00,
+    reconcile_raw_values=False,
+    present_field_weight=0.25,
+    rent_bonus=0.30,
+    total_bonus=0.20,
+    rent_and_total_bonus=0.0,
+    reconciled_bonus=0.20,
+    mismatch_bonus=0.10,
+    many_fields_bonus=0.10,
+    overall_weight=0.7,
+    field_weight=0.3,
+    review_threshold=0.80,
+)
+
+PROFILES: Dict[str, OcrProfile] = {p.name: p for p in (V1_PROFILE, V2_PROFILE, V3_PROFILE)}
+
+DEFAULT_PROFILE = V3_PROFILE
+
+
+def get_profile(name: str) -> OcrProfile:
+    """Return the profile called name (v1, v2 or v3)."""
+    if name not in PROFILES:
+        raise ValueError(f"Unknown OCR profile: {name} (choose from {', '.join(PROFILES)})")
+    return PROFILES[name]
@@ -0,0 +1,97 @@
+"""
+Per-file stage tracing for the OCR processor.
+A FileTrace records how long each stage of process_pdf took plus page count,
+text length and backend; records are written as JSON lines. When tracing is
+off NULL_TRACE is used, whose hooks are no-ops.
+"""
+
+import json
+import os
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, Optional
+
+
+_NULL_STAGE = nullcontext()
+
+
+class _NullTrace:
+    """Tracing disabled: every hook does nothing."""
+
+    enabled = False
+
+    def stage(self, name: str):
+        return _NULL_STAGE
+
+    def set(self, **fields: Any) -> None:
+        pass
+
+
+NULL_TRACE = _NullTrace()
+
+
+class _StageTimer:
+    def __init__(self, trace: "FileTrace", name: str):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        stages = self.trace.stages
+        # Stages can repeat (per page, per DPI tier); accumulate them
+        stages[self.name] = stages.get(self.name, 0.0) + elapsed
+        return False
+
+
+class FileTrace:
+    """Stage durations and metadata for one PDF."""
+
+    enabled = True
+
+    def __init__(self, pdf_path: str):
+        """Start a trace for pdf_path."""
+        self.pdf_path = pdf_path
+        self.stages: Dict[str, float] = {}
+        self.fields: Dict[str, Any] = {}
+        self._start = time.perf_counter()
+
+    def stage(self, name: str) -> _StageTimer:
+        """Context manager timing one stage (accumulates if the stage repeats)."""
+        return _StageTimer(self, name)
+
+    def set(self, **fields: Any) -> None:
+        """Attach metadata such as page_count, text_length or backend."""
+        self.fields.update(fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the trace as a JSON-serializable record."""
+        return {
+            "file": self.pdf_path,
+            "pid": os.getpid(),
+            **self.fields,
+            "stages": {k: round(v, 6) for k, v in self.stages.items()},
+            "total_seconds": round(time.perf_counter() - self._start, 6),
+        }
+
+
+class TraceWriter:
+    """Appends trace records to a JSON lines file."""
+
+    def __init__(self, path: str):
+        """Open path for writing (truncates an existing trace)."""
+        self.path = path
+        self._f = open(path, "w", encoding="utf-8")
+
+    def write(self, record: Optional[Dict[str, Any]]) -> None:
+        """Write one record (None is ignored)."""
+        if record is None:
+            return
+        self._f.write(json.dumps(record) + "\n")
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
@@ -0,0 +1,158 @@
+"""
+Watch-folder support for the OCR daemon.
+Reports PDFs created or modified under a directory tree, using filesystem
+notifications via watchdog when it is installed and periodic polling
+otherwise. Files are only reported once their size and mtime have stopped
+changing, so partially copied uploads are not picked up.
+"""
+
+import os
+import queue
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+DEFAULT_DEBOUNCE_SECONDS = 2.0
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+def _is_pdf(path: str) -> bool:
+    return path.lower().endswith(".pdf")
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def snapshot_pdfs(root: str) -> Dict[str, Tuple[int, int]]:
+    """Return {pdf_path: (size, mtime_ns)} for every PDF under root."""
+    snapshot = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if _is_pdf(filename):
+                path = os.path.join(dirpath, filename)
+                key = _stat_key(path)
+                if key is not None:
+                    snapshot[path] = key
+    return snapshot
+
+
+class PollingWatcher:
+    """Detects new/changed PDFs by diffing directory snapshots."""
+
+    name = "polling"
+
+    def __init__(self, root: str, interval: float = DEFAULT_POLL_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+        self._last_scan = 0.0
+
+    def start(self) -> None:
+        # Files already present are history, not new uploads
+        self._snapshot = snapshot_pdfs(self.root)
+        self._last_scan = time.monotonic()
+
+    def poll(self) -> List[str]:
+        """Return PDFs created or modified since the previous scan."""
+        now = time.monotonic()
+        if now - self._last_scan < self.interval:
+            return []
+        self._last_scan = now
+        current = snapshot_pdfs(self.root)
+        changed = [p for p, key in current.items() if self._snapshot.get(p) != key]
+        self._snapshot = current
+        return changed
+
+    def stop(self) -> None:
+        pass
+
+
+class WatchdogWatcher:
+    """Receives PDF create/modify/move events from watchdog's native observer."""
+
+    name = "watchdog"
+
+    def __init__(self, root: str):
+        # Raises ImportError when watchdog is not installed; see make_watcher
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        events: "queue.Queue[str]" = queue.Queue()
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory or event.event_type not in ("created", "modified", "moved", "closed"):
+                    return
+                path = getattr(event, "dest_path", "") or event.src_path
+                if _is_pdf(path):
+                    events.put(path)
+
+        self.root = root
+        self._events = events
+        self._observer = Observer()
+        self._observer.schedule(_Handler(), root, recursive=True)
+
+    def start(self) -> None:
+        self._observer.start()
+
+    def poll(self) -> List[str]:
+        """Return PDFs with events since the previous call."""
+        paths = []
+        while True:
+            try:
+                paths.append(self._events.get_nowait())
+            except queue.Empty:
+                return paths
+
+    def stop(self) -> None:
+        self._observer.stop()
+        self._observer.join()
+
+
+def make_watcher(root: str, use_polling: bool = False, interval: float = DEFAULT_POLL_INTERVAL):
+    """Return a watchdog watcher for root, or a polling one if requested or unavailable."""
+    if not use_polling:
+        try:
+            return WatchdogWatcher(root)
+        except (ImportError, OSError):
+            pass
+    return PollingWatcher(root, interval)
+
+
+class StableFileTracker:
+    """
+    Debounces partial writes: a file is ready once its size and mtime are
+    unchanged for debounce_seconds (and it is not empty).
+    """
+
+    def __init__(self, debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS):
+        self.debounce_seconds = debounce_seconds
+        self._pending: Dict[str, Tuple[Optional[Tuple[int, int]], float]] = {}
+
+    def touch(self, path: str) -> None:
+        """Note that path was created or changed."""
+        self._pending[path] = (_stat_key(path), time.monotonic())
+
+    def ready(self) -> List[str]:
+        """Return (and stop tracking) files that have settled, in path order."""
+        now = time.monotonic()
+        settled = []
+        for path, (key, since) in list(self._pending.items()):
+            current = _stat_key(path)
+            if current is None:
+                # Deleted or renamed before it settled
+                del self._pending[path]
+            elif current != key:
+                self._pending[path] = (current, now)
+            elif now - since >= self.debounce_seconds and current[0] > 0:
+                settled.append(path)
+                del self._pending[path]
+        return sorted(settled)
+
+    def __len__(self) -> int:
+        return len(self._pending)